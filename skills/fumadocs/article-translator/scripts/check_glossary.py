@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Glossary enforcement for translated articles.
+
+Each language pair has a glossary, references/glossary.<source>-<target>.json:
+
+    keep          term → renderings that must not appear (the term stays in English,
+                  spelled exactly as given: "GitHub", "Node.js", "npm")
+    translations  source term → {"preferred": rendering, "variants": [inconsistent renderings]}
+
+All terms of a glossary are inserted into a trie, and the trie is compiled
+into one factored regular expression for Latin-script terms (matched
+case-insensitively, on ASCII word boundaries, so React is found in
+"使用React构建") and one for the others (CJK renderings, matched anywhere).
+Every translated file is scanned once per expression over its prose only
+(code fences, JSX, inline code and URLs are skipped, see
+translation_memory.segment_mdx), so thousands of files take seconds.
+
+Reported violations:
+    translated   a rendering listed under a keep term (应用程序接口 instead of API)
+    spelling     a keep term written differently (Github, javascript, NPM)
+    variant      an inconsistent rendering (元件 instead of 组件)
+    missing      a keep term that occurs fewer times than in the English source
+                 (counted with exact case there, so "rest" and "react" are not REST and React)
+
+Usage:
+    python check_glossary.py [docs_dir] [--locales zh,fr] [--glossary-dir <dir>] [--json]
+
+Examples:
+    python check_glossary.py
+    python check_glossary.py content/docs --locales zh --json
+"""
+
+import re
+import sys
+import json
+import argparse
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from check_translation import DEFAULT_DOCS_DIR, SOURCE_LOCALE, pair_locales
+from translation_memory import segment_mdx
+
+
+GLOSSARY_DIR = Path(__file__).resolve().parent.parent / "references"
+LATIN_TERM = re.compile(r'^[\w.+#-]+(?: [\w.+#-]+)*$', re.ASCII)
+MASK = re.compile(r'`[^`]*`|\]\([^)]*\)|https?://\S+|<[^>]*>|\{[^}]*\}')
+
+
+class Trie:
+    """Character trie that compiles to a single regex with shared prefixes factored out."""
+
+    END = ""
+
+    def __init__(self):
+        self.root: Dict[str, Any] = {}
+
+    def add(self, word: str):
+        node = self.root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[self.END] = True
+
+    def pattern(self) -> Optional[str]:
+        return self._pattern(self.root) if self.root else None
+
+    def _pattern(self, node: Dict[str, Any]) -> Optional[str]:
+        if self.END in node and len(node) == 1:
+            return None
+
+        branches, singles = [], []
+        for char in sorted(c for c in node if c != self.END):
+            tail = self._pattern(node[char])
+            if tail is None:
+                singles.append(re.escape(char))
+            else:
+                branches.append(re.escape(char) + tail)
+        if singles:
+            branches.append(singles[0] if len(singles) == 1 else "[" + "".join(singles) + "]")
+
+        result = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if self.END in node:
+            result = f"(?:{result})?"
+        return result
+
+
+@lru_cache(maxsize=None)
+def load_glossary(glossary_dir: Path, lang: str) -> Optional[Dict[str, Any]]:
+    """Compiled glossary for en → lang (zh-CN falls back to zh), or None when there is none."""
+
+    for name in (f"glossary.{SOURCE_LOCALE}-{lang}.json", f"glossary.{SOURCE_LOCALE}-{lang.split('-')[0]}.json"):
+        path = glossary_dir / name
+        if path.is_file():
+            break
+    else:
+        return None
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except ValueError as e:
+        raise ValueError(f"{path}: invalid JSON: {e}") from None
+
+    # Lowercased match text → rules that apply to it
+    rules: Dict[str, List[Tuple[str, str]]] = {}
+    for term, renderings in data.get("keep", {}).items():
+        rules.setdefault(term.lower(), []).append(("keep", term))
+        for rendering in renderings:
+            rules.setdefault(rendering.lower(), []).append(("translated", term))
+    for term, spec in data.get("translations", {}).items():
+        for variant in spec.get("variants", []):
+            rules.setdefault(variant.lower(), []).append(("variant", spec["preferred"]))
+
+    latin, other = Trie(), Trie()
+    for key in rules:
+        (latin if LATIN_TERM.match(key) else other).add(key)
+
+    matchers = []
+    if latin.pattern():
+        # ASCII boundaries: in CJK prose a term sits directly between CJK characters, which \w would count as letters
+        matchers.append(re.compile(r'(?<![A-Za-z0-9_.-])' + latin.pattern() + r'(?![A-Za-z0-9_-]|\.[A-Za-z0-9_])',
+                                   re.IGNORECASE))
+    if other.pattern():
+        matchers.append(re.compile(other.pattern(), re.IGNORECASE))
+    return {"path": path, "rules": rules, "matchers": matchers, "keep": list(data.get("keep", {}))}
+
+
+def prose_segments(text: str) -> List[Tuple[int, str]]:
+    """(line, text) of every prose segment, with inline code and URLs blanked out."""
+
+    segments = []
+    line = 1
+    for kind, s in segment_mdx(text):
+        if kind == "text":
+            segments.append((line, MASK.sub(lambda m: " " * len(m.group(0)), s)))
+        line += s.count("\n")
+    return segments
+
+
+def scan(segments: List[Tuple[int, str]], glossary: Dict[str, Any],
+         exact_keep: bool = False) -> Tuple[List[Dict[str, Any]], Counter]:
+    """Violations in the prose segments, plus occurrence counts of the keep terms.
+
+    Keep terms are counted in any case (a misspelling is still an occurrence),
+    or only when spelled exactly with exact_keep.
+    """
+
+    violations = []
+    keep_counts: Counter = Counter()
+    for line, text in segments:
+        for matcher in glossary["matchers"]:
+            for match in matcher.finditer(text):
+                found = match.group(0)
+                for kind, expected in glossary["rules"][found.lower()]:
+                    if kind == "keep":
+                        if found == expected or not exact_keep:
+                            keep_counts[expected] += 1
+                        if found == expected:
+                            continue
+                        kind = "spelling"
+                    violations.append({"line": line + text.count("\n", 0, match.start()), "kind": kind,
+                                       "found": found, "expected": expected})
+    return violations, keep_counts
+
+
+def check_pair(pair: Dict[str, Any], glossary: Dict[str, Any]) -> Dict[str, Any]:
+    target_segments = prose_segments(pair["target"].read_text(encoding="utf-8"))
+    violations, target_counts = scan(target_segments, glossary)
+
+    _, source_counts = scan(prose_segments(pair["source"].read_text(encoding="utf-8")), glossary, exact_keep=True)
+    for term, count in sorted(source_counts.items()):
+        if target_counts[term] < count:
+            violations.append({"line": None, "kind": "missing", "found": f"{target_counts[term]}×",
+                               "expected": f"{term} ({count}× in source)"})
+
+    violations.sort(key=lambda v: (v["line"] is None, v["line"] or 0))
+    return {"path": pair["target"].as_posix(), "lang": pair["lang"], "violations": violations}
+
+
+def check_site(docs_root: Path, locales: Optional[List[str]] = None,
+               glossary_dir: Path = GLOSSARY_DIR) -> List[Dict[str, Any]]:
+    """Glossary violations of every translation that has a glossary, files with the most first."""
+
+    results = []
+    for pair in pair_locales(docs_root, locales):
+        glossary = load_glossary(glossary_dir, pair["lang"])
+        if glossary is not None:
+            results.append(check_pair(pair, glossary))
+    results.sort(key=lambda r: (-len(r["violations"]), r["path"]))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check translated articles against the translation glossaries")
+    parser.add_argument("docs_dir", nargs="?", type=Path, default=DEFAULT_DOCS_DIR,
+                        help="Docs root with one directory per locale (default: content/docs)")
+    parser.add_argument("--locales", help="Comma-separated target locales (default: all with a glossary)")
+    parser.add_argument("--glossary-dir", type=Path, default=GLOSSARY_DIR,
+                        help="Directory of glossary.<source>-<target>.json files (default: the skill's references/)")
+    parser.add_argument("--json", action="store_true", help="Print all violations as JSON")
+
+    args = parser.parse_args()
+
+    if not args.docs_dir.is_dir():
+        print(f"❌ {args.docs_dir} not found", file=sys.stderr)
+        sys.exit(1)
+
+    locales = [lang.strip() for lang in args.locales.split(",")] if args.locales else None
+    try:
+        results = check_site(args.docs_dir, locales, args.glossary_dir)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+    else:
+        icons = {"translated": "🔤", "spelling": "✏️ ", "variant": "🔀", "missing": "❔"}
+        for result in results:
+            if not result["violations"]:
+                continue
+            print(f"⚠️  {result['path']} ({result['lang']}): {len(result['violations'])} glossary violations")
+            for v in result["violations"]:
+                where = f"line {v['line']}" if v["line"] else "file"
+                print(f"    {icons[v['kind']]} {where}: {v['kind']} '{v['found']}' → {v['expected']}")
+
+        kinds = Counter(v["kind"] for r in results for v in r["violations"])
+        files = sum(1 for r in results if r["violations"])
+        print(f"\n📊 {len(results)} translations checked, {files} with violations: "
+              + ", ".join(f"{kinds[k]} {k}" for k in icons))
+
+    if any(r["violations"] for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
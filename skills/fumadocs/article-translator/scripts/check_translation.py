@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Translation integrity check for a whole Fumadocs site.
+
+One scan of content/docs pairs every translated article with its English
+sibling (content/docs/<lang>/<path> ↔ content/docs/en/<path>). For each pair:
+
+- bodies are compared by hash, so verbatim copies of the English file are
+  caught regardless of frontmatter differences;
+- every prose segment (paragraph, heading, list item, table row,
+  title/description — code fences and JSX are skipped, see
+  translation_memory.segment_mdx) is measured: CJK and Latin letter counts
+  after removing inline code, URLs and the technical-term allowlist, and
+  whether the segment is identical to a segment of the English source.
+
+The per-segment statistics of all files are scored together in one pass.
+Files and segments are reported ranked by severity.
+
+Usage:
+    python check_translation.py [docs_dir] [--locales zh,fr] [--threshold 0.6] [--json]
+
+Examples:
+    python check_translation.py
+    python check_translation.py content/docs --locales zh --top 10
+    python check_translation.py --allow-terms glossary-terms.txt --json
+"""
+
+import os
+import re
+import sys
+import json
+import hashlib
+import argparse
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Set
+
+from translation_memory import segment_key, segment_mdx
+
+
+DEFAULT_DOCS_DIR = Path("content") / "docs"
+SOURCE_LOCALE = "en"
+CJK_LOCALES = {"zh", "ja", "ko"}
+LOCALE_DIR_PATTERN = re.compile(r'^[a-z]{2}(-[A-Z]{2})?$')
+
+DEFAULT_THRESHOLD = 0.6     # Latin share of letters above which a CJK segment counts as untranslated
+MIN_LETTERS = 12            # ignore segments with fewer leftover Latin letters (names, short labels)
+
+TECH_TERMS = [
+    "React", "TypeScript", "JavaScript", "Node.js", "npm", "yarn", "pnpm",
+    "API", "SDK", "CLI", "GUI", "IDE", "JSON", "YAML", "XML", "HTTP", "HTTPS",
+    "CSS", "HTML", "SQL", "NoSQL", "REST", "GraphQL",
+    "Git", "GitHub", "GitLab", "Bitbucket",
+    "Docker", "Kubernetes", "AWS", "GCP", "Azure",
+    "macOS", "Windows", "Linux", "Ubuntu", "Debian",
+    "CDN", "DNS", "SSL", "TLS", "OAuth", "JWT",
+    "MDX", "Markdown", "Fumadocs", "Next.js", "Vercel", "LLM", "AI",
+]
+
+CJK_CHAR = re.compile(r'[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]')
+LATIN_CHAR = re.compile(r'[A-Za-z\u00c0-\u024f]')
+FRONTMATTER = re.compile(r'^---\n.*?\n---[^\n]*(\n|$)', re.DOTALL)
+NOISE = re.compile(r'`[^`]*`|\]\([^)]*\)|https?://\S+|<[^>]*>|\{[^}]*\}')
+
+
+def term_pattern(terms: List[str]) -> re.Pattern:
+    alternatives = sorted((re.escape(t) for t in terms), key=len, reverse=True)
+    return re.compile(r'(?<![\w.])(?:' + "|".join(alternatives) + r')(?![\w])', re.IGNORECASE)
+
+
+def split_body(text: str) -> str:
+    """Text after the frontmatter block."""
+
+    match = FRONTMATTER.match(text)
+    return text[match.end():] if match else text
+
+
+def body_hash(text: str) -> str:
+    body = "\n".join(line.strip() for line in split_body(text).splitlines() if line.strip())
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+def pair_locales(docs_root: Path, locales: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Translated files with their English sibling, from a single walk of the docs tree."""
+
+    files: Dict[str, Dict[str, Path]] = {}
+    for dirpath, dirnames, filenames in os.walk(docs_root):
+        rel_dir = Path(dirpath).relative_to(docs_root)
+        if rel_dir == Path("."):
+            dirnames[:] = sorted(d for d in dirnames if LOCALE_DIR_PATTERN.match(d))
+            continue
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith((".", "_")))
+        lang = rel_dir.parts[0]
+        for name in filenames:
+            if name.endswith((".mdx", ".md")):
+                rel = Path(*rel_dir.parts[1:], name).as_posix()
+                files.setdefault(rel, {})[lang] = Path(dirpath) / name
+
+    pairs = []
+    for rel in sorted(files):
+        siblings = files[rel]
+        source = siblings.get(SOURCE_LOCALE)
+        if source is None:
+            continue
+        for lang in sorted(siblings):
+            if lang != SOURCE_LOCALE and (not locales or lang in locales):
+                pairs.append({"path": rel, "lang": lang, "source": source, "target": siblings[lang]})
+    return pairs
+
+
+def measure_pair(pair: Dict[str, Any], terms: re.Pattern) -> Dict[str, Any]:
+    """Body hashes and per-segment letter counts of one translated file."""
+
+    source_text = pair["source"].read_text(encoding="utf-8")
+    target_text = pair["target"].read_text(encoding="utf-8")
+    source_keys: Set[str] = {segment_key(s) for kind, s in segment_mdx(source_text) if kind == "text"}
+
+    segments = []
+    line = 1
+    for kind, s in segment_mdx(target_text):
+        if kind == "text":
+            prose = terms.sub(" ", NOISE.sub(" ", s))
+            segments.append({
+                "line": line,
+                "text": s,
+                "cjk": len(CJK_CHAR.findall(prose)),
+                "latin": len(LATIN_CHAR.findall(prose)),
+                "copied": segment_key(s) in source_keys,
+            })
+        line += s.count("\n")
+
+    return {**pair, "identical": body_hash(source_text) == body_hash(target_text), "segments": segments}
+
+
+def score_segments(cjk: List[int], latin: List[int], cjk_locale: List[bool], copied: List[bool],
+                   threshold: float) -> List[float]:
+    """Per-segment severity: untranslated Latin letters, 0 for segments that look translated.
+
+    A segment is untranslated when it has at least MIN_LETTERS Latin letters
+    left and is either identical to a source segment or, in a CJK locale,
+    mostly Latin script.
+    """
+
+    scores = []
+    for c, l, is_cjk, is_copied in zip(cjk, latin, cjk_locale, copied):
+        share = l / max(c + l, 1)
+        flagged = l >= MIN_LETTERS and (is_copied or (is_cjk and share > threshold))
+        scores.append(l * share if flagged else 0.0)
+    return scores
+
+
+def severity(identical: bool, untranslated: float) -> str:
+    if identical:
+        return "critical"
+    if untranslated >= 0.3:
+        return "high"
+    if untranslated > 0:
+        return "medium"
+    return "ok"
+
+
+def check_site(docs_root: Path, locales: Optional[List[str]] = None, threshold: float = DEFAULT_THRESHOLD,
+               extra_terms: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Integrity report of every translated file, most severe first."""
+
+    terms = term_pattern(TECH_TERMS + (extra_terms or []))
+    measured = [measure_pair(pair, terms) for pair in pair_locales(docs_root, locales)]
+
+    # Flatten all segments of all files into columns and score them in one pass
+    cjk, latin, cjk_locale, copied = [], [], [], []
+    for item in measured:
+        is_cjk = item["lang"].split("-")[0] in CJK_LOCALES
+        for seg in item["segments"]:
+            cjk.append(seg["cjk"])
+            latin.append(seg["latin"])
+            cjk_locale.append(is_cjk)
+            copied.append(seg["copied"])
+    scores = score_segments(cjk, latin, cjk_locale, copied, threshold)
+
+    report = []
+    position = 0
+    for item in measured:
+        flagged_letters = total_letters = 0
+        findings = []
+        for seg in item["segments"]:
+            total_letters += seg["cjk"] + seg["latin"]
+            if scores[position] > 0:
+                flagged_letters += seg["latin"]
+                findings.append({"line": seg["line"], "score": round(scores[position], 1),
+                                 "copied": seg["copied"], "text": seg["text"]})
+            position += 1
+
+        untranslated = 1.0 if item["identical"] else flagged_letters / max(total_letters, 1)
+        report.append({
+            "path": item["target"].as_posix(),
+            "source": item["source"].as_posix(),
+            "lang": item["lang"],
+            "severity": severity(item["identical"], untranslated),
+            "untranslated": round(untranslated, 3),
+            "identical": item["identical"],
+            "segments": sorted(findings, key=lambda f: -f["score"]),
+        })
+    rank = {"critical": 0, "high": 1, "medium": 2, "ok": 3}
+    report.sort(key=lambda r: (rank[r["severity"]], -r["untranslated"], r["path"]))
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find copied or untranslated content in translated articles")
+    parser.add_argument("docs_dir", nargs="?", type=Path, default=DEFAULT_DOCS_DIR,
+                        help="Docs root with one directory per locale (default: content/docs)")
+    parser.add_argument("--locales", help="Comma-separated target locales (default: all but en)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Latin letter share above which a CJK segment is untranslated (default: 0.6)")
+    parser.add_argument("--allow-terms", help="File with extra terms that stay in English, one per line")
+    parser.add_argument("--top", type=int, default=3, help="Segments shown per file (default: 3)")
+    parser.add_argument("--all", action="store_true", help="Also list files without findings")
+    parser.add_argument("--json", action="store_true", help="Print the full report as JSON")
+
+    args = parser.parse_args()
+
+    if not args.docs_dir.is_dir():
+        print(f"❌ {args.docs_dir} not found", file=sys.stderr)
+        sys.exit(1)
+
+    extra_terms = []
+    if args.allow_terms:
+        with open(args.allow_terms, "r", encoding="utf-8") as f:
+            extra_terms = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    locales = [lang.strip() for lang in args.locales.split(",")] if args.locales else None
+
+    report = check_site(args.docs_dir, locales, args.threshold, extra_terms)
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        icons = {"critical": "❌", "high": "⚠️ ", "medium": "🔸", "ok": "✅"}
+        for item in report:
+            if item["severity"] == "ok" and not args.all:
+                continue
+            detail = "identical to the English source" if item["identical"] else \
+                f"{item['untranslated']:.0%} untranslated"
+            print(f"{icons[item['severity']]} {item['path']} ({item['lang']}): {detail}")
+            if not item["identical"]:
+                for seg in item["segments"][:args.top]:
+                    excerpt = " ".join(seg["text"].split())
+                    excerpt = excerpt[:80] + "…" if len(excerpt) > 80 else excerpt
+                    note = " [copied]" if seg["copied"] else ""
+                    print(f"    line {seg['line']}{note}: {excerpt}")
+
+        counts = {level: sum(1 for r in report if r["severity"] == level) for level in icons}
+        print(f"\n📊 {len(report)} translations checked: {counts['critical']} critical, "
+              f"{counts['high']} high, {counts['medium']} medium, {counts['ok']} ok")
+
+    if any(r["severity"] in ("critical", "high") for r in report):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
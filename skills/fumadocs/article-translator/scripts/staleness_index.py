@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Staleness index of translated articles.
+
+A translation records the version of the English article it was made from
+in its frontmatter (source_hash: <hash>, see translation_memory.source_hash;
+written by `translation_memory.py assemble` or by the stamp command below).
+One walk of content/docs compares every recorded hash with the current hash
+of the English sibling and lists the translations that are out of date.
+
+The index is cached outside the work tree, in .git/translation-staleness.json
+(or in ~/.cache/article-translator/ when the docs are not in a git
+repository): files whose size and mtime are unchanged are not re-read, so
+the check is cheap enough for a pre-commit hook. Only the frontmatter of
+translated files is read.
+
+Usage:
+    python staleness_index.py check [docs_dir] [--locales zh,fr] [--json] [--strict]
+    python staleness_index.py stamp <translated.mdx>... [--docs-dir <dir>]
+
+Examples:
+    python staleness_index.py check
+    python staleness_index.py check content/docs --locales zh --json
+    python staleness_index.py stamp content/docs/zh/ai-ml/post.mdx
+"""
+
+import os
+import re
+import sys
+import json
+import hashlib
+import argparse
+import subprocess
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from atomic_io import write_atomic
+from translation_memory import SOURCE_LOCALE, set_frontmatter_field, source_hash
+
+
+DEFAULT_DOCS_DIR = Path("content") / "docs"
+INDEX_NAME = "translation-staleness.json"
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "article-translator"
+INDEX_VERSION = 1
+LOCALE_DIR_PATTERN = re.compile(r'^[a-z]{2}(-[A-Z]{2})?$')
+
+
+def read_recorded_hash(path: Path) -> Optional[str]:
+    """source_hash from the frontmatter, reading no further than the closing ---."""
+
+    with open(path, "r", encoding="utf-8") as f:
+        if f.readline().strip() != "---":
+            return None
+        for line in f:
+            if line.strip() == "---":
+                break
+            if line.startswith("source_hash:"):
+                return line.split(":", 1)[1].split(" #")[0].strip().strip("\"'") or None
+    return None
+
+
+def default_index_path(docs_root: Path) -> Path:
+    """Index location outside the work tree, so `git add -A` never stages it.
+
+    Inside the git directory of the repository holding docs_root, or in the
+    user cache directory (one file per docs root) when there is none.
+    """
+
+    try:
+        result = subprocess.run(["git", "rev-parse", "--git-dir"], cwd=docs_root,
+                                capture_output=True, text=True, check=True)
+        return (docs_root / result.stdout.strip()).resolve() / INDEX_NAME
+    except (OSError, subprocess.CalledProcessError):
+        digest = hashlib.sha256(str(docs_root.resolve()).encode("utf-8")).hexdigest()[:16]
+        return CACHE_DIR / f"{digest}-{INDEX_NAME}"
+
+
+def walk_docs(docs_root: Path) -> Dict[str, os.stat_result]:
+    """<lang>/<path> → stat of every article below the locale directories (single scandir walk)."""
+
+    files: Dict[str, os.stat_result] = {}
+    stack = [(docs_root, "")]
+    while stack:
+        directory, rel = stack.pop()
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.startswith((".", "_")):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if rel or LOCALE_DIR_PATTERN.match(entry.name):
+                        stack.append((Path(entry.path), f"{rel}{entry.name}/"))
+                elif rel and entry.name.endswith((".mdx", ".md")) and entry.is_file():
+                    files[rel + entry.name] = entry.stat()
+    return files
+
+
+class StalenessIndex:
+    """Cached per-file hashes: current source_hash for English files, recorded one for translations."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.reread = 0
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == INDEX_VERSION:
+            self.files = data.get("files", {})
+
+    def update(self, docs_root: Path) -> Dict[str, Dict[str, Any]]:
+        """Refresh entries for files whose size or mtime changed; drop entries of deleted files."""
+
+        current = {}
+        for rel, stat in walk_docs(docs_root).items():
+            entry = self.files.get(rel)
+            if entry is None or entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+                path = docs_root / rel
+                if rel.split("/", 1)[0] == SOURCE_LOCALE:
+                    value = source_hash(path.read_text(encoding="utf-8"))
+                else:
+                    value = read_recorded_hash(path)
+                entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "hash": value}
+                self.reread += 1
+            current[rel] = entry
+        self.files = current
+        return current
+
+    def report(self, locales: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Status of every translation: current, stale, unstamped (no source_hash) or orphaned (no source)."""
+
+        results = []
+        for rel in sorted(self.files):
+            lang, path = rel.split("/", 1)
+            if lang == SOURCE_LOCALE or (locales and lang not in locales):
+                continue
+            recorded = self.files[rel]["hash"]
+            source = self.files.get(f"{SOURCE_LOCALE}/{path}")
+            if source is None:
+                status = "orphaned"
+            elif recorded is None:
+                status = "unstamped"
+            elif recorded != source["hash"]:
+                status = "stale"
+            else:
+                status = "current"
+            results.append({"path": rel, "lang": lang, "status": status, "recorded": recorded,
+                            "source": source["hash"] if source else None})
+        return results
+
+    def save(self):
+        content = json.dumps({"version": INDEX_VERSION, "files": self.files}, indent=1, sort_keys=True)
+        write_atomic(self.path, content + "\n")
+
+
+def source_of(translation: Path, docs_root: Path) -> Path:
+    """content/docs/<lang>/x.mdx → content/docs/en/x.mdx"""
+
+    rel = translation.resolve().relative_to(docs_root.resolve())
+    if len(rel.parts) < 2 or not LOCALE_DIR_PATTERN.match(rel.parts[0]) or rel.parts[0] == SOURCE_LOCALE:
+        raise ValueError(f"{translation}: not a translation below {docs_root}/<lang>/")
+    return docs_root / SOURCE_LOCALE / Path(*rel.parts[1:])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find translations made from an outdated English source")
+    parser.add_argument("--index", type=Path,
+                        help=f"Index cache file (default: .git/{INDEX_NAME}, or the user cache "
+                             "directory outside a git repository)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    check = commands.add_parser("check", help="List stale translations")
+    check.add_argument("docs_dir", nargs="?", type=Path, default=DEFAULT_DOCS_DIR)
+    check.add_argument("--locales", help="Comma-separated locales to report (default: all but en)")
+    check.add_argument("--json", action="store_true", help="Print every translation's status as JSON")
+    check.add_argument("--strict", action="store_true", help="Also fail on unstamped and orphaned translations")
+
+    stamp = commands.add_parser("stamp", help="Record the current English source hash in translations")
+    stamp.add_argument("translations", nargs="+")
+    stamp.add_argument("--docs-dir", type=Path, default=DEFAULT_DOCS_DIR)
+
+    args = parser.parse_args()
+
+    if args.command == "stamp":
+        failed = 0
+        for translation in map(Path, args.translations):
+            try:
+                source = source_of(translation, args.docs_dir)
+                value = source_hash(source.read_text(encoding="utf-8"))
+            except (ValueError, OSError) as e:
+                print(f"❌ {e}", file=sys.stderr)
+                failed += 1
+                continue
+            text = translation.read_text(encoding="utf-8")
+            stamped = set_frontmatter_field(text, "source_hash", value)
+            if stamped == text and read_recorded_hash(translation) != value:
+                print(f"❌ {translation}: no frontmatter to stamp", file=sys.stderr)
+                failed += 1
+                continue
+            if stamped != text:
+                translation.write_text(stamped, encoding="utf-8")
+            print(f"✅ {translation}: source_hash {value}")
+        if failed:
+            sys.exit(1)
+        return
+
+    if not args.docs_dir.is_dir():
+        print(f"❌ {args.docs_dir} not found", file=sys.stderr)
+        sys.exit(1)
+
+    index = StalenessIndex(args.index or default_index_path(args.docs_dir))
+    index.update(args.docs_dir)
+    index.save()
+    locales = [lang.strip() for lang in args.locales.split(",")] if args.locales else None
+    results = index.report(locales)
+
+    counts = {status: sum(1 for r in results if r["status"] == status)
+              for status in ("stale", "unstamped", "orphaned", "current")}
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        icons = {"stale": "⚠️ ", "unstamped": "❔", "orphaned": "🗑️ "}
+        for result in results:
+            if result["status"] in icons:
+                print(f"{icons[result['status']]} {args.docs_dir / result['path']}: {result['status']}")
+        print(f"\n📊 {len(results)} translations: {counts['stale']} stale, {counts['unstamped']} unstamped, "
+              f"{counts['orphaned']} orphaned, {counts['current']} current ({index.reread} files re-read)")
+
+    if counts["stale"] or (args.strict and (counts["unstamped"] or counts["orphaned"])):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+Segment-level translation memory for MDX articles.
+
+An article is split into translatable segments (paragraphs, headings, list
+items, table rows, and the title/description frontmatter values) and fixed
+parts (frontmatter keys, code fences, JSX tags including multi-line
+attributes, imports, blank lines and Markdown prefixes such as "## " or "- "). Each segment is keyed by the hash of
+its whitespace-normalized source text, and translations are stored per
+target language in <tm-dir>/<lang>.json.
+
+After an edit to the source article, only new or changed segments are listed
+as pending; the translated file is reassembled from the memory, with every
+fixed part copied from the source byte for byte, and stamped with the
+source_hash of the English version it was made from (see staleness_index.py).
+
+Usage:
+    python translation_memory.py pending <source.mdx>... --lang <lang> [--output pending.json]
+    python translation_memory.py apply <translations.json> --lang <lang>
+    python translation_memory.py learn <source.mdx> <translated.mdx> --lang <lang>
+    python translation_memory.py assemble <source.mdx>... --lang <lang> [--output <file>]
+
+Examples:
+    python translation_memory.py learn content/docs/en/ai-ml/post.mdx content/docs/zh/ai-ml/post.mdx --lang zh
+    python translation_memory.py pending content/docs/en/ai-ml/post.mdx --lang zh --output /tmp/pending.json
+    # translate the values of /tmp/pending.json, save as /tmp/translated.json
+    python translation_memory.py apply /tmp/translated.json --lang zh
+    python translation_memory.py assemble content/docs/en/ai-ml/post.mdx --lang zh
+"""
+
+import re
+import sys
+import json
+import hashlib
+import argparse
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from atomic_io import write_atomic
+
+
+DEFAULT_TM_DIR = Path(".translation-memory")
+SOURCE_LOCALE = "en"
+TRANSLATABLE_FRONTMATTER = {"title", "description"}
+KEY_LENGTH = 20
+SOURCE_HASH_LENGTH = 16
+
+FRONTMATTER_BLOCK = re.compile(r'^---\n(?:.*?\n)?(---)[^\n]*(?:\n|$)', re.DOTALL)
+FENCE = re.compile(r'^\s*(```|~~~)')
+FRONTMATTER_FIELD = re.compile(r'^([A-Za-z0-9_-]+):(\s*)(["\']?)(.*?)(\3)(\s*(?:#.*)?)$')
+BLOCK_PREFIX = re.compile(r'^(\s*(?:#{1,6}\s+|[-*+]\s+(?:\[[ xX]\]\s+)?|\d+[.)]\s+|>\s?)+)(.*)$')
+JSX_TAG_START = re.compile(r'^\s*<[A-Za-z][\w.]*')
+JSX_LINE = re.compile(r'^\s*(?:</?[A-Za-z][\w.]*(?:\s[^<>]*)?/?>\s*)+$|^\s*/?>\s*$|^\s*<[A-Za-z][\w.]*\s*$')
+FIXED_LINE = re.compile(r'^\s*(?:import\s|export\s|<!--.*-->\s*$|\{/\*.*\*/\}\s*$)')
+TABLE_SEPARATOR = re.compile(r'^\s*\|?\s*:?-{3,}:?\s*(\|\s*:?-{3,}:?\s*)*\|?\s*$')
+HORIZONTAL_RULE = re.compile(r'^\s*([-*_])(\s*\1){2,}\s*$')
+
+Segment = Tuple[str, str]  # ("fixed" | "text", content)
+
+
+def normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+def segment_key(text: str) -> str:
+    """Memory key: hash of the whitespace-normalized source text."""
+
+    return hashlib.sha256(normalize(text).encode("utf-8")).hexdigest()[:KEY_LENGTH]
+
+
+def jsx_tag_state(line: str, state: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """Scan a JSX tag opened on this line, or continue one left open (state) by earlier lines.
+
+    Returns the scan state while the tag is still open at the end of the line,
+    None once its closing > (or />) is reached or when no tag opens here. A >
+    inside a {...} expression or a quoted string does not close the tag.
+    """
+
+    if state is None:
+        start = JSX_TAG_START.match(line)
+        if not start:
+            return None
+        state, rest = {"depth": 0, "quote": None}, line[start.end():]
+    else:
+        rest = line
+
+    for ch in rest:
+        if state["quote"]:
+            if ch == state["quote"]:
+                state["quote"] = None
+        elif ch in "\"'`":
+            state["quote"] = ch
+        elif ch == "{":
+            state["depth"] += 1
+        elif ch == "}":
+            state["depth"] -= 1
+        elif ch == ">" and state["depth"] <= 0:
+            return None
+    return state
+
+
+def segment_mdx(text: str) -> List[Segment]:
+    """Split an MDX document into fixed and translatable parts; joining them restores it exactly."""
+
+    lines = text.split("\n")
+    segments: List[Segment] = []
+    paragraph: List[str] = []
+
+    def fixed(s: str):
+        if segments and segments[-1][0] == "fixed":
+            segments[-1] = ("fixed", segments[-1][1] + s)
+        else:
+            segments.append(("fixed", s))
+
+    def translatable(s: str):
+        indent = s[:len(s) - len(s.lstrip(" \t"))]
+        if indent:
+            fixed(indent)
+        if any(ch.isalpha() for ch in s):
+            segments.append(("text", s[len(indent):]))
+        else:
+            fixed(s[len(indent):])
+
+    def flush_paragraph():
+        if paragraph:
+            translatable("\n".join(paragraph))
+            paragraph.clear()
+
+    in_frontmatter = bool(lines) and lines[0].strip() == "---"
+    in_fence: Optional[str] = None
+    open_tag: Optional[Dict[str, Any]] = None
+
+    for index, line in enumerate(lines):
+        newline = "\n" if index < len(lines) - 1 else ""
+
+        if in_frontmatter:
+            match = FRONTMATTER_FIELD.match(line)
+            if index > 0 and line.strip() == "---":
+                in_frontmatter = False
+                fixed(line + newline)
+            elif match and match.group(1) in TRANSLATABLE_FRONTMATTER and match.group(4):
+                key, space, quote, value, _, tail = match.groups()
+                fixed(f"{key}:{space}{quote}")
+                translatable(value)
+                fixed(f"{quote}{tail}{newline}")
+            else:
+                fixed(line + newline)
+            continue
+
+        if open_tag is not None:
+            # Attribute lines of a multi-line JSX tag, up to and including its closing >
+            open_tag = jsx_tag_state(line, open_tag)
+            fixed(line + newline)
+            continue
+
+        fence = FENCE.match(line)
+        if in_fence or fence:
+            flush_paragraph()
+            if in_fence is None:
+                in_fence = fence.group(1)
+            elif fence and fence.group(1) == in_fence:
+                in_fence = None
+            fixed(line + newline)
+            continue
+
+        open_tag = jsx_tag_state(line)
+        if open_tag is not None:
+            flush_paragraph()
+            fixed(line + newline)
+            continue
+
+        if (not line.strip() or JSX_LINE.match(line) or FIXED_LINE.match(line)
+                or TABLE_SEPARATOR.match(line) or HORIZONTAL_RULE.match(line)):
+            flush_paragraph()
+            fixed(line + newline)
+            continue
+
+        prefix = BLOCK_PREFIX.match(line)
+        if prefix or line.lstrip().startswith("|"):
+            flush_paragraph()
+            if prefix:
+                fixed(prefix.group(1))
+                translatable(prefix.group(2))
+            else:
+                translatable(line)
+            fixed(newline)
+            continue
+
+        # Plain prose: consecutive lines form one paragraph segment
+        paragraph.append(line)
+        if newline and index + 1 < len(lines) and _continues_paragraph(lines[index + 1]):
+            continue
+        flush_paragraph()
+        fixed(newline)
+
+    flush_paragraph()
+    return segments
+
+
+def _continues_paragraph(line: str) -> bool:
+    """Whether the next line is more plain prose of the same paragraph."""
+
+    return bool(line.strip()) and not (FENCE.match(line) or JSX_LINE.match(line) or FIXED_LINE.match(line)
+                                       or TABLE_SEPARATOR.match(line) or HORIZONTAL_RULE.match(line)
+                                       or BLOCK_PREFIX.match(line) or line.lstrip().startswith("|")
+                                       or jsx_tag_state(line) is not None)
+
+
+class TranslationMemory:
+    """Per-language store: segment key → {source, target}."""
+
+    def __init__(self, tm_dir: Path, lang: str):
+        self.path = tm_dir / f"{lang}.json"
+        self.lang = lang
+        self.entries: Dict[str, Dict[str, str]] = {}
+        self.dirty = False
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f).get("segments", {})
+        except FileNotFoundError:
+            pass
+        except ValueError as e:
+            raise ValueError(f"{self.path}: invalid JSON: {e}") from None
+
+    def get(self, source: str) -> Optional[str]:
+        entry = self.entries.get(segment_key(source))
+        return entry["target"] if entry else None
+
+    def put(self, key: str, target: str, source: Optional[str] = None):
+        entry = self.entries.get(key, {})
+        if entry.get("target") != target or (source and entry.get("source") != source):
+            self.entries[key] = {"source": source or entry.get("source", ""), "target": target}
+            self.dirty = True
+
+    def pending(self, segments: List[Segment]) -> Dict[str, str]:
+        """Translatable segments with no stored translation, keyed for `apply`."""
+
+        return {segment_key(s): s for kind, s in segments if kind == "text" and segment_key(s) not in self.entries}
+
+    def assemble(self, segments: List[Segment], fallback: bool = False) -> Tuple[str, int]:
+        """Translated document and the number of segments missing from the memory."""
+
+        out = []
+        missing = 0
+        for kind, s in segments:
+            if kind == "fixed":
+                out.append(s)
+                continue
+            target = self.get(s)
+            if target is None:
+                missing += 1
+                target = s if fallback else ""
+            out.append(target)
+        return "".join(out), missing
+
+    def save(self):
+        if not self.dirty:
+            return
+        content = json.dumps({"lang": self.lang, "segments": self.entries}, indent=2, sort_keys=True, ensure_ascii=False)
+        write_atomic(self.path, content + "\n")
+        self.dirty = False
+
+
+def set_frontmatter_field(text: str, key: str, value: str, insert: bool = True) -> str:
+    """Replace a top-level frontmatter field, or append it to the block when insert is set."""
+
+    match = FRONTMATTER_BLOCK.match(text)
+    if not match:
+        return text
+    header = text[:match.start(1)]
+    field = re.compile(rf'^{re.escape(key)}:(\s*)(["\']?).*?\2(\s*(?:#.*)?)$', re.M)
+    if field.search(header):
+        header = field.sub(lambda m: f"{key}:{m.group(1) or ' '}{m.group(2)}{value}{m.group(2)}{m.group(3)}",
+                           header, count=1)
+    elif insert:
+        header += f"{key}: {value}\n"
+    return header + text[match.start(1):]
+
+
+def source_hash(text: str) -> str:
+    """Hash of what a translation is made from: title, description and the whitespace-normalized body."""
+
+    match = FRONTMATTER_BLOCK.match(text)
+    header, body = (text[:match.end()], text[match.end():]) if match else ("", text)
+    parts = [s for kind, s in segment_mdx(header) if kind == "text"] if header else []
+    parts.extend(line.strip() for line in body.splitlines() if line.strip())
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:SOURCE_HASH_LENGTH]
+
+
+def locale_sibling(source: Path, lang: str) -> Path:
+    """content/docs/en/x.mdx → content/docs/<lang>/x.mdx"""
+
+    parts = list(source.parts)
+    for i in range(len(parts) - 1, -1, -1):
+        if parts[i] == SOURCE_LOCALE:
+            parts[i] = lang
+            return Path(*parts)
+    raise ValueError(f"{source}: no '{SOURCE_LOCALE}' directory in path; use --output")
+
+
+def align(source_segments: List[Segment], target_segments: List[Segment]) -> Optional[List[Tuple[str, str]]]:
+    """Pair source and translated text segments when both documents have the same structure."""
+
+    source_text = [s for kind, s in source_segments if kind == "text"]
+    target_text = [s for kind, s in target_segments if kind == "text"]
+    if len(source_text) != len(target_text):
+        return None
+    source_shape = [kind if kind == "text" else normalize(s) for kind, s in source_segments]
+    target_shape = [kind if kind == "text" else normalize(s) for kind, s in target_segments]
+    if len(source_shape) != len(target_shape):
+        return None
+    # Fixed parts may differ only in the frontmatter (lang, dates) — compare the body structure
+    body_start = next((i for i, (kind, s) in enumerate(source_segments) if kind == "fixed" and "\n---" in s), 0)
+    if source_shape[body_start + 1:] != target_shape[body_start + 1:]:
+        return None
+    return list(zip(source_text, target_text))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Segment-level translation memory for MDX articles")
+    parser.add_argument("--tm-dir", type=Path, default=DEFAULT_TM_DIR,
+                        help="Translation memory directory (default: .translation-memory)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    pending = commands.add_parser("pending", help="List segments that still need translation")
+    pending.add_argument("sources", nargs="+")
+    pending.add_argument("--lang", required=True)
+    pending.add_argument("--output", help="Write the pending segments as JSON to this file")
+
+    apply = commands.add_parser("apply", help="Store translated segments ({key: translation} JSON)")
+    apply.add_argument("translations")
+    apply.add_argument("--lang", required=True)
+
+    learn = commands.add_parser("learn", help="Fill the memory from an existing translated article")
+    learn.add_argument("source")
+    learn.add_argument("translated")
+    learn.add_argument("--lang", required=True)
+
+    assemble = commands.add_parser("assemble", help="Write translated articles from the memory")
+    assemble.add_argument("sources", nargs="+")
+    assemble.add_argument("--lang", required=True)
+    assemble.add_argument("--output", help="Output file (single source only; default: the <lang> sibling path)")
+    assemble.add_argument("--allow-missing", action="store_true",
+                          help="Keep the source text for untranslated segments instead of failing")
+
+    args = parser.parse_args()
+
+    try:
+        memory = TranslationMemory(args.tm_dir, args.lang)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.command == "pending":
+        result: Dict[str, str] = {}
+        total = 0
+        for source in args.sources:
+            segments = segment_mdx(Path(source).read_text(encoding="utf-8"))
+            total += sum(1 for kind, _ in segments if kind == "text")
+            result.update(memory.pending(segments))
+        content = json.dumps(result, indent=2, ensure_ascii=False)
+        if args.output:
+            Path(args.output).write_text(content + "\n", encoding="utf-8")
+        else:
+            print(content)
+        print(f"🧠 {len(result)} of {total} segments need translation to {args.lang}", file=sys.stderr)
+
+    elif args.command == "apply":
+        with open(args.translations, "r", encoding="utf-8") as f:
+            translations = json.load(f)
+        for key, value in translations.items():
+            if isinstance(value, dict):
+                memory.put(key, value["target"], value.get("source"))
+            else:
+                memory.put(key, value)
+        memory.save()
+        print(f"🧠 Stored {len(translations)} {args.lang} segments in {memory.path}")
+
+    elif args.command == "learn":
+        pairs = align(segment_mdx(Path(args.source).read_text(encoding="utf-8")),
+                      segment_mdx(Path(args.translated).read_text(encoding="utf-8")))
+        if pairs is None:
+            print(f"❌ {args.translated} does not follow the structure of {args.source}; cannot align segments",
+                  file=sys.stderr)
+            sys.exit(1)
+        for source, target in pairs:
+            memory.put(segment_key(source), target, source)
+        memory.save()
+        print(f"🧠 Learned {len(pairs)} {args.lang} segments from {args.translated}")
+
+    elif args.command == "assemble":
+        if args.output and len(args.sources) != 1:
+            parser.error("--output needs exactly one source")
+        failed = 0
+        for source in args.sources:
+            source_path = Path(source)
+            text, missing = memory.assemble(segment_mdx(source_path.read_text(encoding="utf-8")), args.allow_missing)
+            if missing and not args.allow_missing:
+                print(f"❌ {source}: {missing} segments not translated yet (run pending)", file=sys.stderr)
+                failed += 1
+                continue
+            try:
+                target = Path(args.output) if args.output else locale_sibling(source_path, args.lang)
+            except ValueError as e:
+                print(f"❌ {e}", file=sys.stderr)
+                failed += 1
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            text = set_frontmatter_field(text, "lang", args.lang, insert=False)
+            text = set_frontmatter_field(text, "source_hash", source_hash(source_path.read_text(encoding="utf-8")))
+            target.write_text(text, encoding="utf-8")
+            note = f" ({missing} segments left in {SOURCE_LOCALE})" if missing else ""
+            print(f"✅ {target}{note}")
+        if failed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""check_glossary on translated pairs, including CJK text without spaces around terms."""
+
+import sys
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from check_glossary import GLOSSARY_DIR, check_site
+
+
+class CheckGlossaryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.docs = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.docs)
+
+    def violations(self, lang: str, source: str, target: str):
+        for locale, body in (("en", source), (lang, target)):
+            path = self.docs / locale / "post.mdx"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(f"---\ntitle: \"Post\"\n---\n\n{body}\n", encoding="utf-8")
+        [result] = check_site(self.docs, [lang], GLOSSARY_DIR)
+        return [(v["kind"], v["found"]) for v in result["violations"]]
+
+    def test_terms_between_cjk_characters_are_matched(self):
+        violations = self.violations("zh", "Build apps with React and host them on GitHub.",
+                                     "使用React构建应用并托管在Github上")
+
+        self.assertEqual(violations, [("spelling", "Github")])
+
+    def test_correct_zh_terms_without_spaces_pass(self):
+        violations = self.violations("zh", "Build apps with React and host them on GitHub.",
+                                     "使用React构建应用并托管在GitHub上")
+
+        self.assertEqual(violations, [])
+
+    def test_terms_inside_longer_words_are_not_matched(self):
+        violations = self.violations("fr", "Use the npm CLI.", "Utilisez la CLI npm, pas npmx ni RESTful.")
+
+        self.assertEqual(violations, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""check_translation.check_site on translated article pairs."""
+
+import sys
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from check_translation import check_site
+
+
+EN = '''---
+title: "Building Agents"
+description: "How to build reliable agents with tools"
+---
+
+<SourceAttribution
+  source={{
+    url: "https://example.com/posts/agents",
+    author: "Jane Doe",
+    title: "Building Agents",
+  }}
+  languages={["en", "zh"]}
+  currentLang="en"
+/>
+
+## Why agents fail
+
+Most agents fail because their tools return ambiguous errors that the model cannot recover from.
+
+- Keep tool outputs short and structured
+- Return actionable error messages
+'''
+
+ZH = '''---
+title: "构建智能体"
+description: "如何用工具构建可靠的智能体"
+---
+
+<SourceAttribution
+  source={{
+    url: "https://example.com/posts/agents",
+    author: "Jane Doe",
+    title: "Building Agents",
+  }}
+  languages={["en", "zh"]}
+  currentLang="zh"
+/>
+
+## 智能体为何失败
+
+大多数智能体失败，是因为它们的工具返回了模型无法从中恢复的模糊错误。
+
+- 保持工具输出简短且结构化
+- 返回可操作的错误信息
+'''
+
+
+class CheckSiteTest(unittest.TestCase):
+
+    def setUp(self):
+        self.docs = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.docs)
+
+    def write(self, lang: str, text: str):
+        path = self.docs / lang / "ai-ml" / "agents.mdx"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+    def test_translated_pair_with_jsx_attribution_is_ok(self):
+        self.write("en", EN)
+        self.write("zh", ZH)
+
+        [item] = check_site(self.docs)
+
+        self.assertEqual((item["severity"], item["untranslated"], item["segments"]), ("ok", 0.0, []))
+
+    def test_untranslated_paragraph_is_flagged(self):
+        self.write("en", EN)
+        self.write("zh", ZH.replace("大多数智能体失败，是因为它们的工具返回了模型无法从中恢复的模糊错误。",
+                                    "Most agents fail because their tools return ambiguous errors that "
+                                    "the model cannot recover from."))
+
+        [item] = check_site(self.docs)
+
+        self.assertEqual(item["severity"], "high")
+        self.assertEqual([seg["line"] for seg in item["segments"]], [18])
+        self.assertTrue(item["segments"][0]["copied"])
+
+    def test_verbatim_copy_is_critical(self):
+        self.write("en", EN)
+        self.write("zh", EN)
+
+        [item] = check_site(self.docs)
+
+        self.assertEqual(item["severity"], "critical")
+        self.assertTrue(item["identical"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""staleness_index: where the index is kept, and stale translations."""
+
+import sys
+import shutil
+import tempfile
+import unittest
+import subprocess
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import staleness_index
+from staleness_index import StalenessIndex, default_index_path
+from translation_memory import set_frontmatter_field, source_hash
+
+
+class StalenessIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.docs = self.root / "content" / "docs"
+        self.source = self.docs / "en" / "post.mdx"
+        self.translation = self.docs / "zh" / "post.mdx"
+        for path in (self.source, self.translation):
+            path.parent.mkdir(parents=True)
+        self.source.write_text('---\ntitle: "Post"\n---\n\nHello.\n', encoding="utf-8")
+        stamped = set_frontmatter_field('---\ntitle: "文章"\n---\n\n你好。\n', "source_hash",
+                                        source_hash(self.source.read_text(encoding="utf-8")))
+        self.translation.write_text(stamped, encoding="utf-8")
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def statuses(self, path: Path):
+        index = StalenessIndex(path)
+        index.update(self.docs)
+        index.save()
+        return {r["path"]: r["status"] for r in index.report()}
+
+    @unittest.skipUnless(shutil.which("git"), "git is not installed")
+    def test_index_lives_in_the_git_directory(self):
+        subprocess.run(["git", "init", "-q", str(self.root)], check=True)
+
+        path = default_index_path(self.docs)
+        self.statuses(path)
+
+        self.assertEqual(path, (self.root / ".git").resolve() / staleness_index.INDEX_NAME)
+        self.assertTrue(path.is_file())
+        self.assertEqual(sorted(p.name for p in self.root.iterdir()), [".git", "content"])
+
+    def test_index_lives_in_the_cache_outside_git(self):
+        cache = self.root / "cache"
+        with mock.patch.object(staleness_index, "CACHE_DIR", cache), \
+                mock.patch.object(staleness_index.subprocess, "run", side_effect=OSError):
+            path = default_index_path(self.docs)
+
+        self.assertEqual(path.parent, cache)
+        self.assertTrue(path.name.endswith(staleness_index.INDEX_NAME))
+
+    def test_edited_source_makes_the_translation_stale(self):
+        path = self.root / "index.json"
+        self.assertEqual(self.statuses(path), {"zh/post.mdx": "current"})
+
+        self.source.write_text('---\ntitle: "Post"\n---\n\nHello, world.\n', encoding="utf-8")
+
+        self.assertEqual(self.statuses(path), {"zh/post.mdx": "stale"})
+
+
+if __name__ == "__main__":
+    unittest.main()
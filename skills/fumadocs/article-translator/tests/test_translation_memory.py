@@ -0,0 +1,59 @@
+"""translation_memory.segment_mdx: what is translatable and what is copied verbatim."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from translation_memory import segment_mdx
+
+
+SOURCE_ATTRIBUTION = '''<SourceAttribution
+  source={{
+    url: "https://example.com/posts/agents",
+    author: "Jane Doe",
+    title: "Building Agents > Writing Prompts",
+  }}
+  languages={["en", "zh", "fr"]}
+  currentLang="en"
+/>
+'''
+
+
+def texts(document: str):
+    return [content for kind, content in segment_mdx(document) if kind == "text"]
+
+
+class SegmentMdxTest(unittest.TestCase):
+
+    def assertRoundTrips(self, document: str):
+        self.assertEqual("".join(content for _, content in segment_mdx(document)), document)
+
+    def test_multi_line_jsx_attributes_are_fixed(self):
+        document = f"---\ntitle: \"Agents\"\n---\n\n{SOURCE_ATTRIBUTION}\nFirst paragraph.\n"
+
+        self.assertEqual(texts(document), ["Agents", "First paragraph."])
+        self.assertRoundTrips(document)
+
+    def test_tag_directly_after_prose_ends_the_paragraph(self):
+        document = f"Some prose.\n{SOURCE_ATTRIBUTION}More prose.\n"
+
+        self.assertEqual(texts(document), ["Some prose.", "More prose."])
+        self.assertRoundTrips(document)
+
+    def test_single_line_tags_keep_their_children_translatable(self):
+        document = '<Callout type="warn">\nMind the gap.\n</Callout>\n'
+
+        self.assertEqual(texts(document), ["Mind the gap."])
+        self.assertRoundTrips(document)
+
+    def test_fenced_code_is_fixed(self):
+        document = "Run it:\n\n```tsx\n<App\n  title=\"x\"\n/>\n```\n\nDone.\n"
+
+        self.assertEqual(texts(document), ["Run it:", "Done."])
+        self.assertRoundTrips(document)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Atomic file writes for the scripts of this skill.
+
+write_atomic writes to a temporary file beside the target and renames it
+into place, so readers never see a half-written file. tempfile.mkstemp
+creates the temporary file with mode 0600, which the rename would carry
+over; the file is given the mode of the file it replaces instead (0666 minus
+the umask for new files), so served and deployed files stay readable.
+"""
+
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Union
+
+
+def _current_umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Read once at import: os.umask is process-wide, so it must not be toggled from worker threads
+UMASK = _current_umask()
+
+
+def write_atomic(path: Path, content: Union[str, bytes]):
+    """Write content (str as UTF-8) to path through a temporary file and a rename."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~UMASK
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content.encode("utf-8") if isinstance(content, str) else content)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
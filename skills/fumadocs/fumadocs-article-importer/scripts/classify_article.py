@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Classify articles by category, difficulty and tags.
+
+The keyword lists in references/classification-rules.md are compiled into a
+single Aho-Corasick automaton (cached by rule_index.py), so each article is
+scored in one linear pass over its title, headings and body, whatever the
+number of keywords. Matching ignores case, except for technology names that
+are also everyday English words ("in one go", "react to", "rest assured"):
+those count only when written as the name (Go, React, REST) or as the
+language of a code block.
+
+Usage:
+    python classify_article.py <article-or-dir>... [--json] [--references <dir>]
+
+Examples:
+    python classify_article.py /tmp/article.md
+    python classify_article.py content/docs/en --json > classification.jsonl
+"""
+
+import re
+import sys
+import json
+import argparse
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+
+from rule_index import REFERENCES_DIR, RuleIndexError, load_rule_index
+
+
+# Tie-break order: more specific categories first (ai-ml over data,
+# devops and security over development), then the rules file order
+CATEGORY_PRIORITY = ["ai-ml", "devops", "security", "data", "development", "design", "content", "business"]
+DEFAULT_CATEGORY = "content"
+DEFAULT_DIFFICULTY = "intermediate"
+
+# Occurrences in the title count more than in headings, and headings more than body text
+REGION_WEIGHTS = {"title": 3, "headings": 2, "body": 1}
+MIN_TAGS = 3
+MAX_TAGS = 5
+
+HEADING = re.compile(r'^(#{1,6})\s+(.*?)\s*#*$')
+
+# Keywords that are also ordinary words: lowercase keyword → the only spelling that counts
+CASE_SENSITIVE_KEYWORDS = {
+    "go": "Go",
+    "rust": "Rust",
+    "react": "React",
+    "express": "Express",
+    "rest": "REST",
+    "excel": "Excel",
+    "sketch": "Sketch",
+}
+
+
+class Classifier:
+    """Scores categories, difficulty and tags with the automaton from the compiled rule index."""
+
+    def __init__(self, index: Dict[str, Any]):
+        self.categories = index["categories"]
+        self.automaton = index["automaton"]
+        # Per keyword id: [(kind, target, weight)], kind is category / difficulty / tag
+        self.keyword_actions = index["keyword_actions"]
+        # Per keyword id: required spelling, or None when any case matches
+        self.exact = [CASE_SENSITIVE_KEYWORDS.get(keyword) for keyword in self.automaton.keywords]
+
+    def classify(self, article: Dict[str, str]) -> Dict[str, Any]:
+        """Classify an article given as {'title', 'headings', 'body'} text regions."""
+
+        category_scores = dict.fromkeys(self.categories, 0)
+        difficulty_scores: Dict[str, Dict[str, int]] = {region: {} for region in REGION_WEIGHTS}
+        tag_scores: Dict[str, List[int]] = {}
+        position = 0
+
+        for region, region_weight in REGION_WEIGHTS.items():
+            text = article.get(region, "")
+            for keyword_id, start in self.automaton.iter_matches(text):
+                exact = self.exact[keyword_id]
+                if exact and text[start:start + len(exact)] != exact:
+                    continue
+                for kind, target, weight in self.keyword_actions[keyword_id]:
+                    if kind == "category":
+                        category_scores[target] += weight * region_weight
+                    elif kind == "difficulty":
+                        hits = difficulty_scores[region]
+                        hits[target] = hits.get(target, 0) + 1
+                    elif target in tag_scores:
+                        tag_scores[target][0] += region_weight
+                    else:
+                        # [score, priority, first position]
+                        tag_scores[target] = [region_weight, weight, position + start]
+            position += len(article.get(region, "")) + 1
+
+        category = pick_category(category_scores)
+        return {
+            "category": category,
+            "difficulty": pick_difficulty(difficulty_scores),
+            "tags": pick_tags(tag_scores, category),
+            "scores": {c: s for c, s in category_scores.items() if s},
+        }
+
+
+def pick_category(scores: Dict[str, int]) -> str:
+    """Highest score; ties go to the more specific category."""
+
+    best = max(scores.values(), default=0)
+    if best == 0:
+        return DEFAULT_CATEGORY
+    tied = [c for c, s in scores.items() if s == best]
+    return min(tied, key=lambda c: (CATEGORY_PRIORITY.index(c) if c in CATEGORY_PRIORITY else len(CATEGORY_PRIORITY), c))
+
+
+def pick_difficulty(hits: Dict[str, Dict[str, int]]) -> str:
+    """Title indicators decide, then headings, then body; an even split means intermediate."""
+
+    for region in REGION_WEIGHTS:
+        counts = hits[region]
+        if not counts:
+            continue
+        best = max(counts.values())
+        tied = [level for level, n in counts.items() if n == best]
+        return tied[0] if len(tied) == 1 else DEFAULT_DIFFICULTY
+    return DEFAULT_DIFFICULTY
+
+
+def pick_tags(scores: Dict[str, List[int]], category: str) -> List[str]:
+    """Most prominent technology tags, padded with the category to reach the minimum."""
+
+    ranked = sorted(scores, key=lambda t: (-scores[t][0], scores[t][1], scores[t][2], t))
+    tags = ranked[:MAX_TAGS]
+    if len(tags) < MIN_TAGS and category not in tags:
+        tags.append(category)
+    return tags
+
+
+def read_article(path: Path) -> Dict[str, str]:
+    """Split a Markdown/MDX article into title, headings and body text."""
+
+    title = ""
+    headings: List[str] = []
+    body: List[str] = []
+
+    with open(path, "r", encoding="utf-8") as f:
+        lines = f.read().split("\n")
+
+    i = 0
+    if lines and lines[0].strip() == "---":
+        for i in range(1, len(lines)):
+            line = lines[i]
+            if line.strip() == "---":
+                break
+            if line.startswith("title:"):
+                title = line[6:].split("  #")[0].strip().strip("\"'")
+        i += 1
+
+    in_code = False
+    for line in lines[i:]:
+        stripped = line.strip()
+        if stripped.startswith("```"):
+            if not in_code and len(stripped) > 3:
+                # The code block language names a technology
+                language = stripped[3:].split()[0]
+                body.append(CASE_SENSITIVE_KEYWORDS.get(language.lower(), language))
+            in_code = not in_code
+            continue
+        if in_code or stripped.startswith(("import ", "export ")):
+            continue
+        heading = HEADING.match(stripped)
+        if heading:
+            if len(heading.group(1)) == 1 and not title:
+                title = heading.group(2)
+            elif len(heading.group(1)) <= 3:
+                headings.append(heading.group(2))
+            continue
+        body.append(line)
+
+    return {"title": title, "headings": "\n".join(headings), "body": "\n".join(body)}
+
+
+@lru_cache(maxsize=None)
+def load_classifier(references_dir: Path = REFERENCES_DIR) -> Classifier:
+    return Classifier(load_rule_index(references_dir))
+
+
+def iter_articles(paths: Iterable[Path]) -> Iterator[Path]:
+    """Articles given directly, or every .md/.mdx below a directory, in sorted order."""
+
+    for path in paths:
+        if path.is_dir():
+            yield from sorted(p for p in path.rglob("*") if p.suffix in (".md", ".mdx") and p.is_file())
+        else:
+            yield path
+
+
+def classify_file(path: Path, classifier: Optional[Classifier] = None) -> Dict[str, Any]:
+    classifier = classifier or load_classifier()
+    result = classifier.classify(read_article(path))
+    return {"file": str(path), **result}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Classify articles by category, difficulty and tags")
+    parser.add_argument("paths", nargs="+", help="Article files or directories of .md/.mdx articles")
+    parser.add_argument("--references", type=Path, default=REFERENCES_DIR,
+                        help="Directory containing classification-rules.md and the category JSON files")
+    parser.add_argument("--json", action="store_true", help="Print one JSON object per article (JSON Lines)")
+
+    args = parser.parse_args()
+
+    try:
+        classifier = load_classifier(args.references.resolve())
+    except RuleIndexError as e:
+        print(f"❌ Cannot load classification rules: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    errors = 0
+    for path in iter_articles(Path(p) for p in args.paths):
+        try:
+            result = classify_file(path, classifier)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"❌ {path}: {e}", file=sys.stderr)
+            errors += 1
+            continue
+
+        if args.json:
+            print(json.dumps(result, ensure_ascii=False))
+        else:
+            print(f"{path}: {result['category']} / {result['difficulty']} / {', '.join(result['tags'])}")
+
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Concurrent fetcher for article imports, with per-host keep-alive connections
+and a content-addressed on-disk response cache.
+
+Requests run on a bounded worker pool. Each host gets at most --per-host
+persistent connections, reused across requests, so bulk imports pay the TCP
+and TLS handshake once per connection rather than once per URL. Response
+bodies are stored once under their sha256 in <cache-dir>/objects/; the URL
+index keeps ETag and Last-Modified validators, and later fetches send
+If-None-Match / If-Modified-Since so unchanged resources come back as 304
+without a body. The cache defaults to the user cache directory
+(~/.cache/fumadocs-article-importer/responses/), outside the site's work
+tree, so publishing never commits it.
+
+Usage:
+    python fetch_articles.py <url>... [--urls-file <file>] [--reader jina] [--out-dir <dir>]
+
+Examples:
+    python fetch_articles.py https://example.com/post --reader jina --out-dir /tmp/articles
+    python fetch_articles.py --urls-file /tmp/images.txt --workers 16
+    python fetch_articles.py --urls-file /tmp/urls.txt --reader jina --ledger .import-ledger.json
+"""
+
+import os
+import re
+import ssl
+import sys
+import json
+import time
+import hashlib
+import argparse
+import threading
+import http.client
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlsplit, urljoin
+
+from atomic_io import write_atomic
+from import_ledger import ImportLedger
+from rule_index import CACHE_DIR
+
+
+DEFAULT_CACHE_DIR = CACHE_DIR / "responses"
+DEFAULT_WORKERS = 8
+DEFAULT_PER_HOST = 4
+DEFAULT_TIMEOUT = 30
+MAX_REDIRECTS = 5
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# Not forwarded when a redirect leaves the original scheme, host and port
+CREDENTIAL_HEADERS = {"authorization", "proxy-authorization", "cookie"}
+CONDITIONAL_HEADERS = {"if-none-match", "if-modified-since"}
+USER_AGENT = "fumadocs-article-importer/1.0"
+
+JINA_READER = "https://r.jina.ai/"
+
+
+class FetchError(Exception):
+    """A URL could not be fetched (network error or non-success status)."""
+
+
+class ConnectionPool:
+    """Persistent HTTP(S) connections per (scheme, host, port), bounded per host."""
+
+    def __init__(self, per_host: int = DEFAULT_PER_HOST, timeout: float = DEFAULT_TIMEOUT):
+        self.per_host = per_host
+        self.timeout = timeout
+        self.ssl_context = ssl.create_default_context()
+        self._idle: Dict[Tuple[str, str, int], List[http.client.HTTPConnection]] = {}
+        self._slots: Dict[Tuple[str, str, int], threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+
+    def _slot(self, key: Tuple[str, str, int]) -> threading.BoundedSemaphore:
+        with self._lock:
+            if key not in self._slots:
+                self._slots[key] = threading.BoundedSemaphore(self.per_host)
+            return self._slots[key]
+
+    def acquire(self, key: Tuple[str, str, int]) -> http.client.HTTPConnection:
+        self._slot(key).acquire()
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop()
+            self.connections_opened += 1
+
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self.ssl_context)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def release(self, key: Tuple[str, str, int], conn: http.client.HTTPConnection, reusable: bool):
+        if reusable:
+            with self._lock:
+                self._idle.setdefault(key, []).append(conn)
+        else:
+            conn.close()
+        self._slots[key].release()
+
+    def close(self):
+        with self._lock:
+            for conns in self._idle.values():
+                for conn in conns:
+                    conn.close()
+            self._idle.clear()
+
+
+class ResponseCache:
+    """URL → validators index over a content-addressed object store."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.objects_dir = cache_dir / "objects"
+        self.index_path = cache_dir / "index.json"
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get("urls", {})
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Index entry for url, if its object is still on disk."""
+
+        with self._lock:
+            entry = self.entries.get(url)
+        if entry and self.object_path(entry["sha256"]).exists():
+            return entry
+        return None
+
+    def read(self, entry: Dict[str, Any]) -> bytes:
+        with open(self.object_path(entry["sha256"]), 'rb') as f:
+            return f.read()
+
+    def store(self, url: str, body: bytes, headers: http.client.HTTPMessage) -> Dict[str, Any]:
+        """Store body under its hash (once, however many URLs share it) and index url."""
+
+        digest = hashlib.sha256(body).hexdigest()
+        path = self.object_path(digest)
+        if not path.exists():
+            write_atomic(path, body)
+
+        entry = {
+            "sha256": digest,
+            "size": len(body),
+            "content_type": headers.get("Content-Type", ""),
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+        }
+        with self._lock:
+            self.entries[url] = entry
+        return entry
+
+    def touch(self, url: str, entry: Dict[str, Any], headers: http.client.HTTPMessage) -> Dict[str, Any]:
+        """Record a successful revalidation (304), keeping any refreshed validators."""
+
+        entry = dict(entry, fetched_at=time.time())
+        for field, header in (("etag", "ETag"), ("last_modified", "Last-Modified")):
+            if headers.get(header):
+                entry[field] = headers.get(header)
+        with self._lock:
+            self.entries[url] = entry
+        return entry
+
+    def save(self):
+        with self._lock:
+            content = json.dumps({"urls": self.entries}, indent=2, sort_keys=True)
+        write_atomic(self.index_path, content)
+
+
+class Fetcher:
+    """Fetch many URLs concurrently through a shared connection pool and response cache."""
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, workers: int = DEFAULT_WORKERS,
+                 per_host: int = DEFAULT_PER_HOST, timeout: float = DEFAULT_TIMEOUT,
+                 headers: Optional[Dict[str, str]] = None, max_age: float = 0):
+        self.cache = ResponseCache(cache_dir)
+        self.pool = ConnectionPool(per_host, timeout)
+        self.workers = workers
+        self.headers = {"User-Agent": USER_AGENT, **(headers or {})}
+        self.max_age = max_age
+
+    def __enter__(self) -> 'Fetcher':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.pool.close()
+        self.cache.save()
+
+    def _request(self, url: str, headers: Dict[str, str]) -> Tuple[int, http.client.HTTPMessage, bytes]:
+        """One request over a pooled connection; a stale keep-alive connection is retried once."""
+
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise FetchError(f"{url}: unsupported URL")
+        key = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+        for attempt in range(2):
+            conn = self.pool.acquire(key)
+            reusable = False
+            try:
+                conn.request("GET", target, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+                reusable = not response.will_close
+                return response.status, response.headers, body
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                if attempt:
+                    raise FetchError(f"{url}: {e}") from None
+            except (OSError, http.client.HTTPException) as e:
+                raise FetchError(f"{url}: {e}") from None
+            finally:
+                self.pool.release(key, conn, reusable)
+        raise FetchError(f"{url}: connection failed")
+
+    def fetch(self, url: str) -> Dict[str, Any]:
+        """Fetch url (following redirects), answering from the cache when it is still valid."""
+
+        cached = self.cache.get(url)
+        if cached and self.max_age and time.time() - cached["fetched_at"] < self.max_age:
+            return {"url": url, "status": 200, "from_cache": True, **cached}
+
+        headers = dict(self.headers)
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        current = url
+        origin = urlsplit(url)[:2]
+        for _ in range(MAX_REDIRECTS + 1):
+            status, response_headers, body = self._request(current, headers)
+            if status in REDIRECT_STATUSES and response_headers.get("Location"):
+                current = urljoin(current, response_headers["Location"])
+                if urlsplit(current)[:2] != origin:
+                    # Another host: no credentials, and the cached validators belong to another resource
+                    headers = {k: v for k, v in headers.items()
+                               if k.lower() not in CREDENTIAL_HEADERS | CONDITIONAL_HEADERS}
+                continue
+            break
+        else:
+            raise FetchError(f"{url}: too many redirects")
+
+        if status == 304 and cached:
+            entry = self.cache.touch(url, cached, response_headers)
+            return {"url": url, "status": 304, "from_cache": True, **entry}
+        if not 200 <= status < 300:
+            raise FetchError(f"{url}: HTTP {status}")
+
+        entry = self.cache.store(url, body, response_headers)
+        return {"url": url, "status": status, "from_cache": False, **entry}
+
+    def read(self, result: Dict[str, Any]) -> bytes:
+        """Body of a fetch result, from the object store."""
+
+        return self.cache.read(result)
+
+    def fetch_many(self, urls: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """Fetch urls on the worker pool, yielding results (or errors) as they complete."""
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(self.fetch, url): url for url in dict.fromkeys(urls)}
+            for future in as_completed(futures):
+                try:
+                    yield future.result()
+                except FetchError as e:
+                    yield {"url": futures[future], "error": str(e)}
+
+
+def reader_url(url: str, reader: Optional[str]) -> str:
+    """URL to request: the article itself, or the article through the Jina reader."""
+
+    return JINA_READER + url if reader == "jina" else url
+
+
+def output_name(url: str, content_type: str) -> str:
+    """File name for a fetched body: last path segment of its source URL plus a short URL hash.
+
+    The hash keeps URLs that end in the same segment (/a/index, /b/index)
+    from overwriting each other in --out-dir.
+    """
+
+    source = url.replace(JINA_READER, "", 1)
+    digest = hashlib.sha256(source.encode("utf-8")).hexdigest()[:8]
+    parts = urlsplit(source)
+    segment = parts.path.rstrip("/").rsplit("/", 1)[-1] or parts.hostname or "index"
+    stem, dot, ext = segment.rpartition(".")
+    if not dot:
+        stem, ext = segment, ("md" if "markdown" in content_type or "text/plain" in content_type else "html")
+    return f"{re.sub(r'[^A-Za-z0-9_-]+', '-', stem).strip('-') or 'index'}-{digest}.{ext}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch article and image URLs concurrently with caching")
+    parser.add_argument("urls", nargs="*", help="URLs to fetch")
+    parser.add_argument("--urls-file", help="File with one URL per line")
+    parser.add_argument("--reader", choices=["jina"], help="Fetch articles through a reader service (uses JINA_API_KEY)")
+    parser.add_argument("--out-dir", type=Path, help="Copy each fetched body into this directory")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR,
+                        help=f"Response cache directory (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent requests (default: 8)")
+    parser.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST,
+                        help="Persistent connections per host (default: 4)")
+    parser.add_argument("--max-age", type=float, default=0,
+                        help="Serve cached responses younger than this many seconds without revalidating")
+    parser.add_argument("--ledger", type=Path,
+                        help="Import ledger (see import_ledger.py); already-imported URLs are skipped")
+
+    args = parser.parse_args()
+
+    urls = list(args.urls)
+    if args.urls_file:
+        with open(args.urls_file, 'r', encoding='utf-8') as f:
+            urls.extend(line.strip() for line in f if line.strip() and not line.startswith("#"))
+    if not urls:
+        parser.error("give URLs or --urls-file")
+
+    if args.ledger:
+        ledger = ImportLedger(args.ledger)
+        imported = [url for url in urls if ledger.get(url) is not None]
+        urls = [url for url in urls if ledger.get(url) is None]
+        if imported:
+            print(f"📒 Skipping {len(imported)} already-imported URLs", file=sys.stderr)
+        if not urls:
+            return
+
+    headers = {}
+    if args.reader == "jina":
+        if not os.environ.get("JINA_API_KEY"):
+            print("❌ JINA_API_KEY is not set", file=sys.stderr)
+            sys.exit(1)
+        headers["Authorization"] = f"Bearer {os.environ['JINA_API_KEY']}"
+
+    failures = 0
+    with Fetcher(args.cache_dir, args.workers, args.per_host, headers=headers, max_age=args.max_age) as fetcher:
+        for result in fetcher.fetch_many(reader_url(url, args.reader) for url in urls):
+            if "error" in result:
+                failures += 1
+            elif args.out_dir:
+                args.out_dir.mkdir(parents=True, exist_ok=True)
+                path = args.out_dir / output_name(result["url"], result["content_type"])
+                path.write_bytes(fetcher.read(result))
+                result["output"] = str(path)
+            print(json.dumps(result, ensure_ascii=False))
+
+        opened = fetcher.pool.connections_opened
+
+    print(f"📥 {len(urls) - failures}/{len(urls)} fetched, {opened} connections opened", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
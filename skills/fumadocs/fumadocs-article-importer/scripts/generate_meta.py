@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Generate navigation meta.json files for every locale of a Fumadocs project.
+
+Each content/docs/<lang>/ tree is scanned once (locales in parallel). For
+every directory the pages array is reconciled with the MDX files and
+subdirectories actually present: existing order, separators, links and
+extra properties such as defaultOpen are kept, vanished pages are dropped and
+new ones appended in slug order. Category directories get their localized
+title from category-translations.json and their icon from
+category-icons.json (via rule_index.py), and are created when missing.
+
+A meta.json is only rewritten when its content changes, so unchanged files
+stay byte-identical and build caches stay warm.
+
+Usage:
+    python generate_meta.py [--project-root <dir>] [--locales en,zh,fr] [--dry-run]
+
+Examples:
+    python generate_meta.py
+    python generate_meta.py --dry-run
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from atomic_io import write_atomic
+from rule_index import RuleIndexError, load_rule_index
+
+
+DEFAULT_DOCS_DIR = Path("content") / "docs"
+SOURCE_LOCALE = "en"
+LOCALE_DIR_PATTERN = re.compile(r'^[a-z]{2}(-[A-Z]{2})?$')
+SLUG_PATTERN = re.compile(r'^[A-Za-z0-9_.-]+$')
+
+
+def read_frontmatter(path: Path) -> Dict[str, str]:
+    """Top-level scalar fields of an MDX file's YAML frontmatter."""
+
+    fields = {}
+    with open(path, "r", encoding="utf-8") as f:
+        if f.readline().strip() != "---":
+            return fields
+        for line in f:
+            if line.strip() == "---":
+                break
+            if line[:1].isalpha() and ":" in line:
+                key, value = line.split(":", 1)
+                fields[key.strip()] = value.split(" #")[0].strip().strip("\"'")
+    return fields
+
+
+def scan_directory(path: Path) -> Tuple[List[str], List[Path], Dict[str, Dict[str, str]]]:
+    """Visible page slugs, subdirectories and frontmatter of one directory (single scandir)."""
+
+    children: List[str] = []
+    subdirs: List[Path] = []
+    frontmatter: Dict[str, Dict[str, str]] = {}
+
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.name.startswith((".", "_")):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(Path(entry.path))
+            elif entry.name.endswith((".mdx", ".md")) and entry.is_file():
+                slug = entry.name.rsplit(".", 1)[0]
+                fields = read_frontmatter(Path(entry.path))
+                if fields.get("draft", "").lower() == "true":
+                    continue
+                frontmatter[slug] = fields
+                children.append(slug)
+
+    return children, sorted(subdirs), frontmatter
+
+
+def reconcile_pages(existing: List[Any], present: List[str]) -> List[Any]:
+    """Keep the existing order and special entries, drop vanished slugs, append new ones."""
+
+    present_set = set(present)
+    pages: List[Any] = []
+    listed = set()
+    rest_spread = False
+
+    for entry in existing:
+        if not isinstance(entry, str):
+            pages.append(entry)
+        elif entry.startswith("---") and entry.endswith("---"):
+            # Separator (---Title---)
+            pages.append(entry)
+        elif entry == "...":
+            rest_spread = True
+            pages.append(entry)
+        elif entry.startswith("!"):
+            listed.add(entry[1:])
+            pages.append(entry)
+        elif entry.startswith("...") and SLUG_PATTERN.match(entry[3:]):
+            if entry[3:] in present_set:
+                listed.add(entry[3:])
+                pages.append(entry)
+        elif SLUG_PATTERN.match(entry):
+            if entry in present_set and entry not in listed:
+                listed.add(entry)
+                pages.append(entry)
+        else:
+            # Links ([Text](url)) and other Fumadocs entries
+            pages.append(entry)
+
+    if not rest_spread:
+        new = sorted(slug for slug in present if slug not in listed)
+        if "index" in new and not pages:
+            new.remove("index")
+            new.insert(0, "index")
+        pages.extend(new)
+    return pages
+
+
+def load_meta(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except ValueError as e:
+        raise ValueError(f"{path}: invalid JSON: {e}") from None
+
+
+def build_meta(directory: Path, depth: int, lang: str, index: Dict[str, Any], children: List[str],
+               frontmatter: Dict[str, Dict[str, str]]) -> Tuple[Path, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Current and desired meta.json of one directory, given its visible children."""
+
+    meta_path = directory / "meta.json"
+    current = load_meta(meta_path)
+
+    category = directory.name if depth == 1 and directory.name in index["translations"] else None
+    if current is None and category is None:
+        # Only category directories get a meta.json created; elsewhere Fumadocs' defaults apply
+        return meta_path, None, None
+
+    desired = dict(current or {})
+    if category:
+        translations = index["translations"][category]
+        desired["title"] = translations.get(lang) or translations[SOURCE_LOCALE]
+        desired.setdefault("icon", index["icons"][category]["icon"])
+    elif "title" not in desired and frontmatter.get("index", {}).get("title"):
+        desired["title"] = frontmatter["index"]["title"]
+    desired["pages"] = reconcile_pages(desired.get("pages", []), children)
+    if current is None:
+        desired.setdefault("defaultOpen", False)
+
+    return meta_path, current, desired
+
+
+def write_json_atomic(path: Path, data: Dict[str, Any]):
+    write_atomic(path, json.dumps(data, indent=2, ensure_ascii=False) + "\n")
+
+
+def process_locale(locale_root: Path, lang: str, index: Dict[str, Any], dry_run: bool) -> Dict[str, Any]:
+    """Walk one locale tree once and rewrite the meta.json files whose content changed."""
+
+    result = {"lang": lang, "checked": 0, "changes": [], "errors": []}
+
+    def visit(directory: Path, depth: int) -> bool:
+        """Post-order: a subdirectory is a page only if it contains content."""
+
+        try:
+            pages, subdirs, frontmatter = scan_directory(directory)
+        except OSError as e:
+            result["errors"].append(str(e))
+            return False
+        pages += [d.name for d in subdirs if visit(d, depth + 1)]
+
+        try:
+            meta_path, current, desired = build_meta(directory, depth, lang, index, pages, frontmatter)
+        except ValueError as e:
+            result["errors"].append(str(e))
+            return bool(pages)
+
+        if desired is not None:
+            result["checked"] += 1
+            if desired != current:
+                result["changes"].append((meta_path, "created" if current is None else "updated"))
+                if not dry_run:
+                    write_json_atomic(meta_path, desired)
+        return bool(pages)
+
+    visit(locale_root, 0)
+    return result
+
+
+def generate_meta(project_root: Path, locales: Optional[List[str]] = None, dry_run: bool = False,
+                  docs_dir: Path = DEFAULT_DOCS_DIR) -> List[Dict[str, Any]]:
+    """Reconcile meta.json files for every locale in parallel."""
+
+    index = load_rule_index()
+    docs_root = project_root / docs_dir
+    available = sorted(p.name for p in docs_root.iterdir() if p.is_dir() and LOCALE_DIR_PATTERN.match(p.name))
+    selected = [lang for lang in available if not locales or lang in locales]
+
+    with ThreadPoolExecutor(max_workers=len(selected) or 1) as executor:
+        futures = [executor.submit(process_locale, docs_root / lang, lang, index, dry_run) for lang in selected]
+        return [future.result() for future in futures]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate meta.json navigation files for all locales")
+    parser.add_argument("--project-root", type=Path, default=Path("."), help="Fumadocs project root (default: .)")
+    parser.add_argument("--locales", help="Comma-separated locales to process (default: every content/docs/<lang>)")
+    parser.add_argument("--dry-run", action="store_true", help="List the meta.json files that would change")
+
+    args = parser.parse_args()
+
+    if not (args.project_root / DEFAULT_DOCS_DIR).is_dir():
+        print(f"❌ {args.project_root / DEFAULT_DOCS_DIR} not found", file=sys.stderr)
+        sys.exit(1)
+
+    locales = [lang.strip() for lang in args.locales.split(",")] if args.locales else None
+    try:
+        results = generate_meta(args.project_root, locales, args.dry_run)
+    except RuleIndexError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+
+    errors = 0
+    for result in results:
+        verb = "would change" if args.dry_run else "changed"
+        print(f"🧭 {result['lang']}: {len(result['changes'])} of {result['checked']} meta.json {verb}")
+        for path, action in result["changes"]:
+            print(f"  {'📝' if action == 'updated' else '✨'} {path} ({action})")
+        for error in result["errors"]:
+            print(f"  ❌ {error}", file=sys.stderr)
+        errors += len(result["errors"])
+
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Ledger of imported articles, keyed by canonical source URL.
+
+Each entry stores the content fingerprint of the imported source and the
+output files per language, so a list of URLs can be checked in O(1) per URL
+before any network call and only new (or, given fresh content, changed)
+sources are imported. URLs are canonicalized first: lowercase scheme and
+host, default ports, fragments, tracking parameters (utm_*, fbclid,
+gclid...) and trailing slashes are normalized away, and reader prefixes such
+as https://r.jina.ai/ are unwrapped.
+
+The ledger can be rebuilt from the frontmatter source.url (or source_url)
+of the existing articles in content/docs/<lang>/<category>/<slug>.mdx.
+
+Usage:
+    python import_ledger.py check <url>... [--urls-file <file>] [--content <file>]
+    python import_ledger.py filter --urls-file <file>
+    python import_ledger.py record <url> --content <file> --output <mdx>...
+    python import_ledger.py rebuild [--project-root <dir>]
+
+Examples:
+    python import_ledger.py filter --urls-file /tmp/urls.txt > /tmp/new-urls.txt
+    python import_ledger.py record https://example.com/post --content /tmp/article.md \\
+        --output content/docs/en/ai-ml/post.mdx content/docs/zh/ai-ml/post.mdx
+"""
+
+import re
+import sys
+import json
+import time
+import hashlib
+import argparse
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from atomic_io import write_atomic
+
+
+DEFAULT_LEDGER = Path(".import-ledger.json")
+DEFAULT_DOCS_DIR = Path("content") / "docs"
+LEDGER_VERSION = 1
+
+READER_PREFIXES = ("https://r.jina.ai/", "http://r.jina.ai/")
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "_hsenc", "_hsmi", "ref", "ref_src", "ref_url", "spm", "si",
+}
+TRACKING_PREFIXES = ("utm_", "pk_", "hsa_")
+
+LOCALE_DIR_PATTERN = re.compile(r'^[a-z]{2}(-[A-Z]{2})?$')
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a source URL so tracking variants of one article share a key."""
+
+    url = url.strip()
+    for prefix in READER_PREFIXES:
+        if url.startswith(prefix):
+            url = url[len(prefix):]
+
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower() or "https"
+    host = (parts.hostname or "").lower()
+    if parts.port and (scheme, parts.port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{parts.port}"
+
+    path = re.sub(r'/{2,}', '/', parts.path)
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit((scheme, host, path or "/", urlencode(query), ""))
+
+
+def fingerprint(content: str) -> str:
+    """Hash of the source text with whitespace differences normalized away."""
+
+    normalized = "\n".join(line.strip() for line in content.strip().splitlines() if line.strip())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def read_source_url(path: Path) -> Optional[str]:
+    """source.url (or top-level source_url) from an article's YAML frontmatter."""
+
+    with open(path, "r", encoding="utf-8") as f:
+        if f.readline().strip() != "---":
+            return None
+        in_source = False
+        fallback = None
+        for line in f:
+            if line.strip() == "---":
+                break
+            if not line.startswith((" ", "\t")):
+                in_source = line.rstrip() == "source:"
+                if line.startswith("source_url:"):
+                    fallback = line.split(":", 1)[1].split(" #")[0].strip().strip("\"'")
+            elif in_source and line.strip().startswith("url:"):
+                value = line.strip()[4:].split(" #")[0].strip().strip("\"'")
+                if value:
+                    return value
+    return fallback or None
+
+
+class ImportLedger:
+    """Canonical URL → {url, fingerprint, slug, category, outputs, imported_at}."""
+
+    def __init__(self, path: Path = DEFAULT_LEDGER):
+        self.path = path
+        self.sources: Dict[str, Dict[str, Any]] = {}
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == LEDGER_VERSION:
+            self.sources = data.get("sources", {})
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        return self.sources.get(canonicalize_url(url))
+
+    def status(self, url: str, content: Optional[str] = None) -> str:
+        """'new', 'imported', or 'changed' when fresh content differs from the imported version."""
+
+        entry = self.get(url)
+        if entry is None:
+            return "new"
+        if content is not None and entry.get("fingerprint") and entry["fingerprint"] != fingerprint(content):
+            return "changed"
+        return "imported"
+
+    def record(self, url: str, content: Optional[str], outputs: Iterable[str]):
+        """Add or update the entry for an imported source."""
+
+        key = canonicalize_url(url)
+        entry = self.sources.get(key, {"url": url, "fingerprint": None, "outputs": {}})
+        entry["url"] = url
+        if content is not None:
+            entry["fingerprint"] = fingerprint(content)
+        for output in outputs:
+            located = locate_output(output)
+            if located:
+                lang, category, slug = located
+                entry["outputs"][lang] = Path(output).as_posix()
+                entry["category"], entry["slug"] = category, slug
+        entry["imported_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        self.sources[key] = entry
+
+    def rebuild(self, project_root: Path, docs_dir: Path = DEFAULT_DOCS_DIR) -> int:
+        """Re-derive entries from the frontmatter of existing articles; keeps known fingerprints."""
+
+        previous = self.sources
+        self.sources = {}
+        docs_root = project_root / docs_dir
+        count = 0
+
+        if docs_root.is_dir():
+            for lang_dir in sorted(p for p in docs_root.iterdir() if p.is_dir() and LOCALE_DIR_PATTERN.match(p.name)):
+                for article in sorted(lang_dir.rglob("*.mdx")):
+                    url = read_source_url(article)
+                    if not url:
+                        continue
+                    key = canonicalize_url(url)
+                    rel = article.relative_to(project_root).as_posix()
+                    entry = self.sources.setdefault(key, {
+                        "url": url,
+                        "fingerprint": previous.get(key, {}).get("fingerprint"),
+                        "outputs": {},
+                        "imported_at": previous.get(key, {}).get("imported_at"),
+                    })
+                    entry["outputs"][lang_dir.name] = rel
+                    located = locate_output(rel)
+                    if located:
+                        entry["category"], entry["slug"] = located[1], located[2]
+                    count += 1
+        return count
+
+    def save(self):
+        content = json.dumps({"version": LEDGER_VERSION, "sources": self.sources},
+                             indent=2, sort_keys=True, ensure_ascii=False)
+        write_atomic(self.path, content + "\n")
+
+
+def locate_output(path: str) -> Optional[tuple]:
+    """(lang, category, slug) for content/docs/<lang>/<category>/<slug>.mdx paths."""
+
+    parts = Path(path).with_suffix("").parts
+    for i in range(len(parts) - 3):
+        if parts[i] == "docs" and LOCALE_DIR_PATTERN.match(parts[i + 1]):
+            return parts[i + 1], "/".join(parts[i + 2:-1]), parts[-1]
+    return None
+
+
+def read_urls(urls: List[str], urls_file: Optional[str]) -> List[str]:
+    urls = list(urls)
+    if urls_file:
+        with open(urls_file, "r", encoding="utf-8") as f:
+            urls.extend(line.strip() for line in f if line.strip() and not line.startswith("#"))
+    return urls
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Track imported articles by canonical source URL")
+    parser.add_argument("--ledger", type=Path, default=DEFAULT_LEDGER, help="Ledger file (default: .import-ledger.json)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    check = commands.add_parser("check", help="Report new / imported / changed for each URL")
+    check.add_argument("urls", nargs="*")
+    check.add_argument("--urls-file")
+    check.add_argument("--content", help="Freshly fetched content of a single URL, to detect changes")
+
+    filter_cmd = commands.add_parser("filter", help="Print only URLs that are not in the ledger")
+    filter_cmd.add_argument("urls", nargs="*")
+    filter_cmd.add_argument("--urls-file")
+
+    record = commands.add_parser("record", help="Record an imported article")
+    record.add_argument("url")
+    record.add_argument("--content", help="Source content the article was imported from")
+    record.add_argument("--output", nargs="+", default=[], help="MDX files written for this source")
+
+    rebuild = commands.add_parser("rebuild", help="Rebuild the ledger from article frontmatter")
+    rebuild.add_argument("--project-root", type=Path, default=Path("."))
+
+    args = parser.parse_args()
+    ledger = ImportLedger(args.ledger)
+
+    if args.command == "rebuild":
+        count = ledger.rebuild(args.project_root)
+        ledger.save()
+        print(f"📒 {len(ledger.sources)} sources from {count} articles → {args.ledger}")
+
+    elif args.command == "record":
+        content = Path(args.content).read_text(encoding="utf-8") if args.content else None
+        ledger.record(args.url, content, args.output)
+        ledger.save()
+        print(f"📒 Recorded {canonicalize_url(args.url)}")
+
+    elif args.command == "check":
+        urls = read_urls(args.urls, args.urls_file)
+        content = Path(args.content).read_text(encoding="utf-8") if args.content else None
+        if content is not None and len(urls) != 1:
+            parser.error("--content needs exactly one URL")
+        for url in urls:
+            entry = ledger.get(url) or {}
+            print(json.dumps({"url": url, "canonical": canonicalize_url(url),
+                              "status": ledger.status(url, content),
+                              "outputs": entry.get("outputs", {})}, ensure_ascii=False))
+
+    elif args.command == "filter":
+        urls = read_urls(args.urls, args.urls_file)
+        new = [url for url in dict.fromkeys(urls) if ledger.get(url) is None]
+        for url in new:
+            print(url)
+        print(f"📒 {len(new)} new of {len(urls)} URLs", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
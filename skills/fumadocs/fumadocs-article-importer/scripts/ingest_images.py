@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Download the images referenced by imported articles and store each unique
+image once, named by its content hash.
+
+Image URLs in Markdown (![alt](url)) and JSX (<img src="url">) are fetched
+concurrently through fetch_articles.Fetcher, hashed, and copied to
+public/images/docs/shared/<sha256[:16]>.<ext> unless that file already
+exists. The article references are rewritten to the local paths in the same
+pass, and a manifest records every stored image with its source URLs and the
+articles using it. An image shared by many articles (or by the en/zh/fr
+versions of one) is downloaded and stored once.
+
+Usage:
+    python ingest_images.py <article.mdx>... [--project-root <dir>] [--manifest <file>]
+
+Examples:
+    python ingest_images.py content/docs/en/ai-ml/my-article.mdx
+    python ingest_images.py content/docs/*/ai-ml/my-article.mdx --workers 16
+"""
+
+import re
+import sys
+import json
+import argparse
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from atomic_io import write_atomic
+from fetch_articles import DEFAULT_CACHE_DIR, DEFAULT_WORKERS, Fetcher
+
+
+DEFAULT_IMAGES_DIR = Path("public") / "images" / "docs" / "shared"
+DEFAULT_MANIFEST = Path(".images-manifest.json")
+HASH_LENGTH = 16
+
+# Hash names never contain a hyphen followed by digits, which MDX would parse as an expression
+CONTENT_TYPE_EXTENSIONS = {
+    "image/png": "png", "image/jpeg": "jpg", "image/jpg": "jpg", "image/gif": "gif",
+    "image/webp": "webp", "image/avif": "avif", "image/svg+xml": "svg",
+}
+URL_EXTENSIONS = {"png", "jpg", "jpeg", "gif", "webp", "avif", "svg"}
+
+MARKDOWN_IMAGE = r'!\[[^\]]*\]\(\s*<?(?P<md>https?://[^)\s>]+)>?(?:\s+"[^"]*")?\s*\)'
+JSX_IMAGE = r'<img\b[^>]*?\bsrc=["\'](?P<jsx>https?://[^"\']+)["\']'
+IMAGE_REFERENCE = re.compile(f"{MARKDOWN_IMAGE}|{JSX_IMAGE}")
+
+
+def find_image_urls(text: str) -> List[str]:
+    """Remote image URLs in document order, without duplicates."""
+
+    urls = (m.group("md") or m.group("jsx") for m in IMAGE_REFERENCE.finditer(text))
+    return list(dict.fromkeys(urls))
+
+
+def rewrite_image_urls(text: str, mapping: Dict[str, str]) -> str:
+    """Replace mapped URLs inside image references only, leaving links and prose alone."""
+
+    def replace(match: re.Match) -> str:
+        group = "md" if match.group("md") else "jsx"
+        url = match.group(group)
+        if url not in mapping:
+            return match.group(0)
+        start, end = match.span(group)
+        offset = match.start()
+        return match.group(0)[:start - offset] + mapping[url] + match.group(0)[end - offset:]
+
+    return IMAGE_REFERENCE.sub(replace, text)
+
+
+def image_extension(url: str, content_type: str) -> str:
+    ext = CONTENT_TYPE_EXTENSIONS.get(content_type.split(";")[0].strip().lower())
+    if ext:
+        return ext
+    suffix = url.split("?")[0].rsplit(".", 1)[-1].lower()
+    if suffix in URL_EXTENSIONS:
+        return "jpg" if suffix == "jpeg" else suffix
+    return "png"
+
+
+def project_relative(path: Path, root: Path) -> Optional[str]:
+    """POSIX path of path below root, or None when it is outside."""
+
+    try:
+        return path.resolve().relative_to(root.resolve()).as_posix()
+    except ValueError:
+        return None
+
+
+def load_manifest(path: Path) -> Dict[str, Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"images": {}}
+
+
+def ingest_images(articles: List[Path], project_root: Path, images_dir: Path, manifest_path: Path,
+                  cache_dir: Path = DEFAULT_CACHE_DIR, workers: int = DEFAULT_WORKERS) -> Dict[str, Any]:
+    """Fetch, dedupe and store every remote image of the articles, then rewrite them."""
+
+    texts = {article: article.read_text(encoding="utf-8") for article in articles}
+    urls = list(dict.fromkeys(url for text in texts.values() for url in find_image_urls(text)))
+
+    manifest = load_manifest(manifest_path)
+    images = manifest.setdefault("images", {})
+    public_dir = project_root / "public"
+    url_prefix = "/" + (project_root / images_dir).relative_to(public_dir).as_posix()
+
+    mapping: Dict[str, str] = {}
+    summary = {"urls": len(urls), "stored": 0, "reused": 0, "errors": []}
+
+    with Fetcher(cache_dir, workers) as fetcher:
+        for result in fetcher.fetch_many(urls):
+            url = result["url"]
+            if "error" in result:
+                summary["errors"].append(result["error"])
+                continue
+
+            name = f"{result['sha256'][:HASH_LENGTH]}.{image_extension(url, result['content_type'])}"
+            target = project_root / images_dir / name
+            if target.exists():
+                summary["reused"] += 1
+            else:
+                write_atomic(target, fetcher.read(result))
+                summary["stored"] += 1
+
+            mapping[url] = f"{url_prefix}/{name}"
+            entry = images.setdefault(name, {"sha256": result["sha256"], "size": result["size"],
+                                             "sources": [], "articles": []})
+            if url not in entry["sources"]:
+                entry["sources"].append(url)
+
+    for article, text in texts.items():
+        rewritten = rewrite_image_urls(text, mapping)
+        if rewritten != text:
+            write_atomic(article, rewritten)
+
+        rel = project_relative(article, project_root) or str(article)
+        for url in find_image_urls(text):
+            if url in mapping:
+                entry = images[mapping[url].rsplit("/", 1)[-1]]
+                if rel not in entry["articles"]:
+                    entry["articles"].append(rel)
+
+    for entry in images.values():
+        entry["sources"].sort()
+        entry["articles"].sort()
+    write_atomic(manifest_path, json.dumps(manifest, indent=2, sort_keys=True, ensure_ascii=False) + "\n")
+
+    summary["unique"] = len(set(mapping.values()))
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Download, dedupe and rewrite the images of imported articles")
+    parser.add_argument("articles", nargs="+", help="MDX/Markdown files whose remote images should be ingested")
+    parser.add_argument("--project-root", type=Path, default=Path("."), help="Fumadocs project root (default: .)")
+    parser.add_argument("--images-dir", type=Path, default=DEFAULT_IMAGES_DIR,
+                        help="Image store below the project root (default: public/images/docs/shared)")
+    parser.add_argument("--manifest", type=Path, help="Image manifest (default: <project-root>/.images-manifest.json)")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help="Response cache (see fetch_articles.py)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent downloads (default: 8)")
+
+    args = parser.parse_args()
+
+    articles = [Path(a) for a in args.articles]
+    for article in articles:
+        if not article.is_file():
+            print(f"❌ File not found: {article}", file=sys.stderr)
+            sys.exit(1)
+    if project_relative(args.project_root / args.images_dir, args.project_root / "public") is None:
+        print(f"❌ --images-dir must be inside {args.project_root / 'public'}", file=sys.stderr)
+        sys.exit(1)
+
+    manifest_path = args.manifest or args.project_root / DEFAULT_MANIFEST
+    summary = ingest_images(articles, args.project_root, args.images_dir, manifest_path,
+                            args.cache_dir, args.workers)
+
+    print(f"🖼️  {summary['urls']} image URLs → {summary['unique']} unique images "
+          f"({summary['stored']} stored, {summary['reused']} already present)")
+    for error in summary["errors"]:
+        print(f"  ❌ {error}", file=sys.stderr)
+    if summary["errors"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Compiled index of the importer's classification references.
+
+Parses and validates references/classification-rules.md,
+category-icons.json and category-translations.json, compiles the keyword
+lists into an Aho-Corasick automaton and pickles the result to the user
+cache directory ($XDG_CACHE_HOME or ~/.cache, under
+fumadocs-article-importer/), outside the skill and the site's work tree.
+Later loads reuse the pickle as long as the
+source files are unchanged (same size and mtime, or same content hash), so
+the classifier and meta.json generation start without re-parsing anything.
+Malformed references raise RuleIndexError naming the file and line.
+
+Usage:
+    python rule_index.py [--references <dir>] [--rebuild] [--json]
+
+Examples:
+    python rule_index.py
+    python rule_index.py --rebuild
+"""
+
+import os
+import re
+import sys
+import json
+import pickle
+import hashlib
+import argparse
+from collections import deque
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Iterator, Tuple
+
+from atomic_io import write_atomic
+
+
+REFERENCES_DIR = Path(__file__).resolve().parent.parent / "references"
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "fumadocs-article-importer"
+INDEX_VERSION = 1
+
+RULES_FILE = "classification-rules.md"
+ICONS_FILE = "category-icons.json"
+TRANSLATIONS_FILE = "category-translations.json"
+SOURCE_FILES = (RULES_FILE, ICONS_FILE, TRANSLATIONS_FILE)
+REQUIRED_LANGUAGES = ("en", "zh", "fr")
+
+PRIMARY_WEIGHT = 2
+
+# Keyword lists that name concrete technologies, in tag priority order
+TAG_LABELS = {
+    "languages": 0, "frameworks": 0, "libraries": 0,
+    "tools": 1, "development tools": 1, "databases": 1, "cloud": 1, "cloud platforms": 1,
+    "architecture": 2, "methodologies": 2, "patterns": 2,
+    "application types": 3,
+}
+
+LIST_ITEM = re.compile(r'^-\s+(?:\*\*)?([A-Za-z][A-Za-z /&-]*?)(?:\*\*)?:\s+(.+)$')
+HEADING = re.compile(r'^(#{1,6})\s+(.*?)\s*#*$')
+QUOTED = re.compile(r'"([^"]+)"')
+WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+
+
+class RuleIndexError(ValueError):
+    """A reference file is missing, malformed or inconsistent with the others."""
+
+
+def split_keywords(text: str) -> List[str]:
+    """Comma-separated keyword list, without the trailing 'etc.'."""
+
+    return [k.strip() for k in text.split(",") if k.strip() and k.strip().rstrip(".") != "etc"]
+
+
+def parse_classification_rules(path: Path) -> Dict[str, Any]:
+    """Read category keywords, difficulty indicators and tag vocabulary from the rules file."""
+
+    categories: Dict[str, Dict[str, List[str]]] = {}
+    difficulty: Dict[str, List[str]] = {}
+    tag_lists: Dict[str, List[str]] = {}
+
+    section = subsection = group = None
+    with open(path, "r", encoding="utf-8") as f:
+        for raw in f:
+            line = raw.rstrip()
+            heading = HEADING.match(line)
+            if heading:
+                level, title = len(heading.group(1)), heading.group(2)
+                if level == 2:
+                    section, subsection, group = title.lower(), None, None
+                elif level == 3:
+                    # "### 1. development" → development
+                    subsection, group = title.split(". ", 1)[-1].strip().lower(), None
+                elif level == 4:
+                    group = title.split(". ", 1)[-1].split("(")[0].strip().lower()
+                continue
+
+            if not line.startswith("- ") or section is None:
+                continue
+            item = LIST_ITEM.match(line)
+
+            if section.startswith("categories") and subsection and item:
+                categories.setdefault(subsection, {})[item.group(1).strip().lower()] = split_keywords(item.group(2))
+            elif section.startswith("difficulty") and subsection and item and item.group(1) == "Title contains":
+                difficulty[subsection] = QUOTED.findall(item.group(2))
+            elif section.startswith("tag extraction") and group:
+                label, keywords = (item.group(1).strip().lower(), item.group(2)) if item else (group, line[2:])
+                if label in TAG_LABELS:
+                    tag_lists.setdefault(label, []).extend(split_keywords(keywords))
+
+    if not categories:
+        raise RuleIndexError(f"{path}: no category keyword lists found")
+    for category, lists in categories.items():
+        if "primary" not in lists:
+            raise RuleIndexError(f"{path}: category '{category}' has no Primary keyword list")
+    if not difficulty:
+        raise RuleIndexError(f"{path}: no difficulty 'Title contains' indicators found")
+    return {"categories": categories, "difficulty": difficulty, "tags": tag_lists}
+
+
+def load_json_reference(path: Path) -> Dict[str, Any]:
+    """Strict JSON load; syntax errors are reported with file, line and column."""
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except json.JSONDecodeError as e:
+        raise RuleIndexError(f"{path}:{e.lineno}:{e.colno}: invalid JSON: {e.msg}") from None
+    if not isinstance(data, dict):
+        raise RuleIndexError(f"{path}: expected a JSON object keyed by category")
+    return data
+
+
+def validate_references(categories: List[str], icons: Dict[str, Any],
+                        translations: Dict[str, Any], references_dir: Path):
+    """Icons and translations must cover exactly the categories the rules define."""
+
+    for name, data in ((ICONS_FILE, icons), (TRANSLATIONS_FILE, translations)):
+        missing = sorted(set(categories) - set(data))
+        unknown = sorted(set(data) - set(categories))
+        if missing or unknown:
+            details = "; ".join(filter(None, [
+                f"missing {', '.join(missing)}" if missing else "",
+                f"unknown {', '.join(unknown)}" if unknown else "",
+            ]))
+            raise RuleIndexError(f"{references_dir / name}: categories differ from {RULES_FILE} ({details})")
+
+    for category in categories:
+        if not isinstance(icons[category].get("icon"), str):
+            raise RuleIndexError(f"{references_dir / ICONS_FILE}: '{category}' has no icon")
+        entry = translations[category]
+        for lang in REQUIRED_LANGUAGES:
+            if not isinstance(entry.get(lang), str):
+                raise RuleIndexError(f"{references_dir / TRANSLATIONS_FILE}: '{category}' has no '{lang}' title")
+            if not isinstance(entry.get("description", {}).get(lang), str):
+                raise RuleIndexError(f"{references_dir / TRANSLATIONS_FILE}: '{category}' has no '{lang}' description")
+
+
+def normalize_tag(keyword: str) -> str:
+    """Lowercase, hyphen-separated tag: 'GitHub Actions' → github-actions, 'd3.js' → d3-js."""
+
+    return re.sub(r'[^a-z0-9]+', '-', keyword.lower()).strip('-')
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over lowercase keywords, matching whole ASCII words only."""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = []
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[List[int]] = [[]]
+
+        index = {}
+        for keyword in keywords:
+            keyword = keyword.lower()
+            if keyword and keyword not in index:
+                index[keyword] = len(self.keywords)
+                self.keywords.append(keyword)
+                self._insert(keyword, index[keyword])
+        self._link()
+
+    def tables(self) -> Dict[str, Any]:
+        """Plain lists and dicts, so the pickle does not depend on this module's import name."""
+
+        return {"keywords": self.keywords, "goto": self.goto, "fail": self.fail, "output": self.output}
+
+    @classmethod
+    def from_tables(cls, tables: Dict[str, Any]) -> 'KeywordAutomaton':
+        automaton = cls.__new__(cls)
+        automaton.keywords = tables["keywords"]
+        automaton.goto = tables["goto"]
+        automaton.fail = tables["fail"]
+        automaton.output = tables["output"]
+        return automaton
+
+    def _insert(self, keyword: str, keyword_id: int):
+        state = 0
+        for ch in keyword:
+            nxt = self.goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[state][ch] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+            state = nxt
+        self.output[state].append(keyword_id)
+
+    def _link(self):
+        """Breadth-first failure links; outputs are merged along them once, here."""
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(ch, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.output[nxt] = self.output[nxt] + self.output[self.fail[nxt]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield (keyword_id, start) for every whole-word keyword occurrence in text."""
+
+        text = text.lower()
+        goto, fail, output, keywords = self.goto, self.fail, self.output, self.keywords
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not output[state]:
+                continue
+            after = text[i + 1] if i + 1 < len(text) else " "
+            for keyword_id in output[state]:
+                start = i - len(keywords[keyword_id]) + 1
+                before = text[start - 1] if start > 0 else " "
+                if (before not in WORD_CHARS or keywords[keyword_id][0] not in WORD_CHARS) and \
+                        (after not in WORD_CHARS or keywords[keyword_id][-1] not in WORD_CHARS):
+                    yield keyword_id, start
+
+
+def compile_keyword_actions(rules: Dict[str, Any]) -> Dict[str, List[Tuple[str, str, int]]]:
+    """keyword → [(kind, target, weight)] where kind is category / difficulty / tag."""
+
+    actions: Dict[str, List[Tuple[str, str, int]]] = {}
+
+    def add(keyword: str, action: Tuple[str, str, int]):
+        entry = actions.setdefault(keyword.lower(), [])
+        if action not in entry:
+            entry.append(action)
+
+    for category, lists in rules["categories"].items():
+        for label, keywords in lists.items():
+            weight = PRIMARY_WEIGHT if label == "primary" else 1
+            for keyword in keywords:
+                add(keyword, ("category", category, weight))
+                if label in TAG_LABELS:
+                    add(keyword, ("tag", normalize_tag(keyword), TAG_LABELS[label]))
+    for level, indicators in rules["difficulty"].items():
+        for keyword in indicators:
+            add(keyword, ("difficulty", level, 1))
+    for label, keywords in rules["tags"].items():
+        for keyword in keywords:
+            add(keyword, ("tag", normalize_tag(keyword), TAG_LABELS[label]))
+
+    return actions
+
+
+def compile_index(references_dir: Path) -> Dict[str, Any]:
+    """Parse, validate and compile every reference file."""
+
+    for name in SOURCE_FILES:
+        if not (references_dir / name).is_file():
+            raise RuleIndexError(f"{references_dir / name}: reference file not found")
+
+    rules = parse_classification_rules(references_dir / RULES_FILE)
+    icons = load_json_reference(references_dir / ICONS_FILE)
+    translations = load_json_reference(references_dir / TRANSLATIONS_FILE)
+    validate_references(list(rules["categories"]), icons, translations, references_dir)
+
+    actions = compile_keyword_actions(rules)
+    automaton = KeywordAutomaton(actions)
+    return {
+        "categories": list(rules["categories"]),
+        "rules": rules,
+        "icons": icons,
+        "translations": translations,
+        "automaton": automaton,
+        "keyword_actions": [actions[k] for k in automaton.keywords],
+    }
+
+
+def source_fingerprint(references_dir: Path) -> Dict[str, List[Any]]:
+    """Per source file: [size, mtime_ns, sha256 or None]; hashes are filled in lazily."""
+
+    fingerprint = {}
+    for name in SOURCE_FILES:
+        try:
+            st = os.stat(references_dir / name)
+        except OSError:
+            raise RuleIndexError(f"{references_dir / name}: reference file not found") from None
+        fingerprint[name] = [st.st_size, st.st_mtime_ns, None]
+    return fingerprint
+
+
+def file_sha256(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _sources_unchanged(references_dir: Path, stored: Dict[str, List[Any]],
+                       current: Dict[str, List[Any]]) -> bool:
+    """Same size and mtime, or (after a touch or checkout) the same content."""
+
+    if set(stored) != set(current):
+        return False
+    for name, (size, mtime_ns, _) in current.items():
+        if stored[name][:2] == [size, mtime_ns]:
+            current[name][2] = stored[name][2]
+            continue
+        current[name][2] = file_sha256(references_dir / name)
+        if size != stored[name][0] or current[name][2] != stored[name][2]:
+            return False
+    return True
+
+
+def _write_index(path: Path, payload: Dict[str, Any]):
+    """Atomic pickle write; an unwritable cache directory just means no cache."""
+
+    try:
+        write_atomic(path, pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
+
+
+def index_path(references_dir: Path) -> Path:
+    """Pickle of one references directory in the user cache (one file per directory)."""
+
+    digest = hashlib.sha256(str(references_dir.resolve()).encode("utf-8")).hexdigest()[:16]
+    return CACHE_DIR / f"rule-index-{digest}.pickle"
+
+
+_loaded: Dict[Path, Tuple[Dict[str, List[Any]], Dict[str, Any]]] = {}
+
+
+def _store(path: Path, sources: Dict[str, List[Any]], index: Dict[str, Any]):
+    _write_index(path, {
+        "version": INDEX_VERSION,
+        "sources": sources,
+        "index": {**index, "automaton": index["automaton"].tables()},
+    })
+
+
+def load_rule_index(references_dir: Path = REFERENCES_DIR, rebuild: bool = False) -> Dict[str, Any]:
+    """Compiled reference index, from the pickle when the sources are unchanged."""
+
+    references_dir = references_dir.resolve()
+    path = index_path(references_dir)
+    current = source_fingerprint(references_dir)
+
+    if not rebuild:
+        if references_dir in _loaded:
+            sources, index = _loaded[references_dir]
+        else:
+            try:
+                with open(path, "rb") as f:
+                    stored = pickle.load(f)
+                if stored.get("version") != INDEX_VERSION:
+                    raise ValueError("stale index version")
+                sources = stored["sources"]
+                index = {**stored["index"], "automaton": KeywordAutomaton.from_tables(stored["index"]["automaton"])}
+            except (OSError, pickle.UnpicklingError, EOFError, ValueError, KeyError, TypeError, AttributeError):
+                sources = index = None
+
+        if index is not None and _sources_unchanged(references_dir, sources, current):
+            if sources != current:
+                # Touched but identical: refresh the stored stats so the next load skips hashing
+                _store(path, current, index)
+            _loaded[references_dir] = (current, index)
+            return index
+
+    index = compile_index(references_dir)
+    for name, entry in current.items():
+        if entry[2] is None:
+            entry[2] = file_sha256(references_dir / name)
+    _store(path, current, index)
+    _loaded[references_dir] = (current, index)
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate and compile the importer's classification references")
+    parser.add_argument("--references", type=Path, default=REFERENCES_DIR,
+                        help="Directory containing classification-rules.md and the category JSON files")
+    parser.add_argument("--rebuild", action="store_true", help="Recompile even if the sources are unchanged")
+    parser.add_argument("--json", action="store_true", help="Print the categories, icons and translations as JSON")
+
+    args = parser.parse_args()
+
+    try:
+        index = load_rule_index(args.references, rebuild=args.rebuild)
+    except RuleIndexError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps({c: {"icon": index["icons"][c]["icon"], "translations": index["translations"][c]}
+                          for c in index["categories"]}, indent=2, ensure_ascii=False))
+        return
+
+    print(f"✅ {len(index['categories'])} categories, {len(index['automaton'].keywords)} keywords, "
+          f"{len(index['automaton'].goto)} automaton states → {index_path(args.references)}")
+
+
+if __name__ == "__main__":
+    main()
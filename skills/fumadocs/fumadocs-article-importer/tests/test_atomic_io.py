@@ -0,0 +1,54 @@
+"""atomic_io.write_atomic: content, and file modes of new and replaced files."""
+
+import os
+import sys
+import stat
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from atomic_io import UMASK, write_atomic
+
+
+def mode(path: Path) -> int:
+    return stat.S_IMODE(path.stat().st_mode)
+
+
+class WriteAtomicTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_new_file_honours_the_umask(self):
+        path = self.tmp / "sub" / "new.json"
+        write_atomic(path, "{}\n")
+
+        self.assertEqual(path.read_text(encoding="utf-8"), "{}\n")
+        self.assertEqual(mode(path), 0o666 & ~UMASK)
+
+    def test_replaced_file_keeps_its_mode(self):
+        path = self.tmp / "article.mdx"
+        path.write_bytes(b"old")
+        os.chmod(path, 0o640)
+
+        write_atomic(path, b"new")
+
+        self.assertEqual(path.read_bytes(), b"new")
+        self.assertEqual(mode(path), 0o640)
+
+    def test_no_temporary_files_are_left_behind(self):
+        write_atomic(self.tmp / "a.txt", "a")
+        with self.assertRaises(TypeError):
+            write_atomic(self.tmp / "b.txt", 42)
+
+        self.assertEqual([p.name for p in self.tmp.iterdir()], ["a.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
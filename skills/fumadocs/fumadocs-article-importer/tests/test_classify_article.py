@@ -0,0 +1,46 @@
+"""Keyword matching of classify_article.py."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from classify_article import Classifier, read_article
+from rule_index import REFERENCES_DIR, compile_index
+
+
+class ClassifierTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.classifier = Classifier(compile_index(REFERENCES_DIR))
+
+    def tags(self, title="", headings="", body=""):
+        return self.classifier.classify({"title": title, "headings": headings, "body": body})["tags"]
+
+    def test_everyday_words_are_not_technologies(self):
+        tags = self.tags(body="Publish every article in one go. Readers react quickly; rest assured, "
+                              "we express the idea in a quick sketch and excel at it.")
+        for tag in ("go", "react", "rest", "express", "sketch", "excel"):
+            self.assertNotIn(tag, tags)
+
+    def test_technology_names_still_match(self):
+        tags = self.tags(title="Building a REST API in Go", body="The frontend uses React and Express.")
+        for tag in ("go", "rest", "react", "express"):
+            self.assertIn(tag, tags)
+
+    def test_other_keywords_ignore_case(self):
+        self.assertIn("python", self.tags(body="Scripts are written in PYTHON and python."))
+
+    def test_code_block_language_counts(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "article.md"
+            path.write_text("---\ntitle: Notes\n---\n\n```go\nfunc main() {}\n```\n", encoding="utf-8")
+            article = read_article(path)
+        self.assertIn("go", self.classifier.classify(article)["tags"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+"""fetch_articles.Fetcher against local HTTP servers: revalidation, redirects, connection pooling."""
+
+import sys
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from fetch_articles import FetchError, Fetcher, output_name
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Serves self.server.routes: path → (status, headers, body); records every request."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append({"path": self.path, "headers": dict(self.headers),
+                                    "client": self.client_address})
+        status, headers, body = server.routes.get(self.path, (404, {}, b"not found"))
+        if status == 200 and headers.get("ETag") and self.headers.get("If-None-Match") == headers["ETag"]:
+            status, body = 304, b""
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server(routes):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.routes = routes
+    server.requests = []
+    server.lock = threading.Lock()
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class FetcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = Path(tempfile.mkdtemp())
+        self.servers = []
+
+    def tearDown(self):
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+        shutil.rmtree(self.cache_dir)
+
+    def server(self, routes):
+        server = start_server(routes)
+        self.servers.append(server)
+        return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+    def fetcher(self, **kwargs) -> Fetcher:
+        return Fetcher(self.cache_dir, **kwargs)
+
+    def test_unchanged_resource_is_revalidated_with_304(self):
+        server, base = self.server({"/post": (200, {"ETag": '"v1"', "Content-Type": "text/html"}, b"<p>hi</p>")})
+
+        with self.fetcher() as fetcher:
+            first = fetcher.fetch(f"{base}/post")
+        with self.fetcher() as fetcher:
+            second = fetcher.fetch(f"{base}/post")
+            body = fetcher.read(second)
+
+        self.assertEqual((first["status"], first["from_cache"]), (200, False))
+        self.assertEqual((second["status"], second["from_cache"]), (304, True))
+        self.assertEqual(body, b"<p>hi</p>")
+        self.assertEqual(server.requests[1]["headers"].get("If-None-Match"), '"v1"')
+
+    def test_max_age_answers_from_cache_without_a_request(self):
+        server, base = self.server({"/post": (200, {"ETag": '"v1"'}, b"body")})
+
+        with self.fetcher(max_age=3600) as fetcher:
+            fetcher.fetch(f"{base}/post")
+            cached = fetcher.fetch(f"{base}/post")
+
+        self.assertTrue(cached["from_cache"])
+        self.assertEqual(len(server.requests), 1)
+
+    def test_same_host_redirect_keeps_headers(self):
+        server, base = self.server({
+            "/old": (301, {"Location": "/new"}, b""),
+            "/new": (200, {}, b"moved"),
+        })
+
+        with self.fetcher(headers={"Authorization": "Bearer token"}) as fetcher:
+            result = fetcher.fetch(f"{base}/old")
+            body = fetcher.read(result)
+
+        self.assertEqual((result["url"], body), (f"{base}/old", b"moved"))
+        self.assertEqual(server.requests[-1]["headers"].get("Authorization"), "Bearer token")
+
+    def test_cross_host_redirect_drops_credentials_and_validators(self):
+        target, target_base = self.server({"/article": (200, {"ETag": '"t1"'}, b"article")})
+        origin, origin_base = self.server({"/a": (302, {"Location": f"{target_base}/article"}, b"")})
+
+        with self.fetcher(headers={"Authorization": "Bearer secret"}) as fetcher:
+            fetcher.fetch(f"{origin_base}/a")
+        with self.fetcher(headers={"Authorization": "Bearer secret"}) as fetcher:
+            second = fetcher.fetch(f"{origin_base}/a")
+
+        for request in target.requests:
+            self.assertNotIn("Authorization", request["headers"])
+            self.assertNotIn("If-None-Match", request["headers"])
+        self.assertEqual(origin.requests[1]["headers"].get("Authorization"), "Bearer secret")
+        self.assertEqual(second["status"], 200)
+
+    def test_redirect_loop_fails(self):
+        _, base = self.server({"/loop": (302, {"Location": "/loop"}, b"")})
+
+        with self.fetcher() as fetcher:
+            with self.assertRaises(FetchError):
+                fetcher.fetch(f"{base}/loop")
+
+    def test_error_status_fails(self):
+        _, base = self.server({})
+
+        with self.fetcher() as fetcher:
+            with self.assertRaisesRegex(FetchError, "HTTP 404"):
+                fetcher.fetch(f"{base}/missing")
+
+    def test_connections_are_pooled_per_host(self):
+        routes = {f"/p{i}": (200, {}, f"page {i}".encode()) for i in range(20)}
+        server, base = self.server(routes)
+
+        with self.fetcher(workers=8, per_host=2) as fetcher:
+            results = list(fetcher.fetch_many(f"{base}/p{i}" for i in range(20)))
+            opened = fetcher.pool.connections_opened
+
+        self.assertEqual(len([r for r in results if "error" not in r]), 20)
+        self.assertLessEqual(opened, 2)
+        self.assertLessEqual(len({r["client"] for r in server.requests}), 2)
+
+    def test_output_names_are_unique_per_url(self):
+        names = {output_name(url, "text/html") for url in
+                 ("https://a.com/x/index", "https://a.com/y/index", "https://b.com/x/index")}
+        self.assertEqual(len(names), 3)
+        self.assertTrue(all(name.startswith("index-") and name.endswith(".html") for name in names))
+
+
+if __name__ == "__main__":
+    unittest.main()
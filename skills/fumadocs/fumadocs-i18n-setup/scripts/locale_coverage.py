@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Locale coverage matrix of a Fumadocs site.
+
+content/docs/<lang>/** is indexed once (os.scandir, one thread per locale,
+only the frontmatter of each page is read) into a slug × locale matrix.
+Each cell records whether the page exists, whether its frontmatter is valid
+(closed block, non-empty title, lang matching the directory) and whether the
+meta.json files on its path include it in the navigation. meta.json entries
+that point at pages or folders that do not exist are reported as dangling.
+
+Cells:
+    ✓  present, valid and in the navigation
+    ~  present and valid, but left out by meta.json
+    !  present with invalid or unreadable frontmatter
+    ·  missing
+
+Usage:
+    python locale_coverage.py [docs_dir] [--locales en,zh,fr] [--all] [--json] [--strict]
+
+Examples:
+    python locale_coverage.py
+    python locale_coverage.py content/docs --json > coverage.json
+    python locale_coverage.py --strict    # also fail on missing translations (deploy gate)
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+
+DEFAULT_DOCS_DIR = Path("content") / "docs"
+SOURCE_LOCALE = "en"
+LOCALE_DIR_PATTERN = re.compile(r'^[a-z]{2}(-[A-Z]{2})?$')
+SLUG_PATTERN = re.compile(r'^[A-Za-z0-9_.-]+$')
+MAX_FRONTMATTER_LINES = 200
+
+
+def check_frontmatter(path: str, lang: str) -> List[str]:
+    """Frontmatter problems of one page, reading no further than the closing ---.
+
+    A page that cannot be read is reported as an issue, so one bad file does
+    not abort the whole matrix.
+    """
+
+    fields: Dict[str, str] = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if f.readline().strip() != "---":
+                return ["no frontmatter"]
+            for count, line in enumerate(f):
+                if line.strip() == "---":
+                    break
+                if count >= MAX_FRONTMATTER_LINES:
+                    return ["unclosed frontmatter"]
+                if line[:1].isalpha() and ":" in line:
+                    key, value = line.split(":", 1)
+                    fields[key.strip()] = value.split(" #")[0].strip().strip("\"'")
+            else:
+                return ["unclosed frontmatter"]
+    except UnicodeDecodeError as e:
+        return [f"not UTF-8: {e.reason}"]
+    except OSError as e:
+        return [f"unreadable: {e.strerror or e}"]
+
+    issues = []
+    if not fields.get("title"):
+        issues.append("missing title")
+    if fields.get("lang") and fields["lang"] != lang:
+        issues.append(f"lang is {fields['lang']}")
+    return issues
+
+
+def load_pages(meta_path: str) -> Optional[List[Any]]:
+    """The pages array of a meta.json, or None when the file sets none."""
+
+    with open(meta_path, "r", encoding="utf-8") as f:
+        pages = json.load(f).get("pages")
+    return pages if isinstance(pages, list) else None
+
+
+def entry_name(entry: str) -> Optional[str]:
+    """Page or folder a meta.json entry refers to (slug, ...folder, !slug); None for separators and links."""
+
+    if entry == "..." or (entry.startswith("---") and entry.endswith("---")):
+        return None
+    name = entry[3:] if entry.startswith("...") else entry[1:] if entry.startswith("!") else entry
+    return name if SLUG_PATTERN.match(name) else None
+
+
+def index_locale(locale_root: Path, lang: str) -> Dict[str, Any]:
+    """Every page of one locale with its frontmatter issues and navigation status."""
+
+    pages: Dict[str, Dict[str, Any]] = {}
+    dangling: List[str] = []
+    errors: List[str] = []
+
+    def visit(directory: str, prefix: str, listed: bool):
+        files, subdirs, meta_path = [], [], None
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.startswith((".", "_")):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry)
+                elif entry.name == "meta.json":
+                    meta_path = entry.path
+                elif entry.name.endswith((".mdx", ".md")) and entry.is_file():
+                    files.append(entry)
+
+        entries = None
+        if meta_path:
+            try:
+                entries = load_pages(meta_path)
+            except (OSError, ValueError) as e:
+                errors.append(f"{meta_path}: {e}")
+
+        def in_navigation(name: str) -> bool:
+            if entries is None:
+                return True
+            if f"!{name}" in entries:
+                return False
+            return name in entries or f"...{name}" in entries or "..." in entries
+
+        names = {e.name.rsplit(".", 1)[0] for e in files} | {e.name for e in subdirs}
+        for entry in entries or []:
+            name = entry_name(entry) if isinstance(entry, str) else None
+            if name and name not in names:
+                dangling.append(f"{meta_path}: {entry}")
+
+        for entry in files:
+            name = entry.name.rsplit(".", 1)[0]
+            pages[prefix + name] = {"issues": check_frontmatter(entry.path, lang),
+                                    "listed": listed and in_navigation(name)}
+        for entry in subdirs:
+            visit(entry.path, f"{prefix}{entry.name}/", listed and in_navigation(entry.name))
+
+    visit(str(locale_root), "", True)
+    return {"lang": lang, "pages": pages, "dangling": dangling, "errors": errors}
+
+
+def cell(page: Optional[Dict[str, Any]]) -> str:
+    if page is None:
+        return "·"
+    if page["issues"]:
+        return "!"
+    return "✓" if page["listed"] else "~"
+
+
+def build_matrix(docs_root: Path, locales: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Slug × locale coverage with per-category totals."""
+
+    available = sorted(p.name for p in os.scandir(docs_root) if p.is_dir() and LOCALE_DIR_PATTERN.match(p.name))
+    selected = [lang for lang in available if not locales or lang in locales]
+    selected.sort(key=lambda lang: (lang != SOURCE_LOCALE, lang))
+
+    with ThreadPoolExecutor(max_workers=len(selected) or 1) as executor:
+        indexes = list(executor.map(lambda lang: index_locale(docs_root / lang, lang), selected))
+
+    slugs = sorted(set().union(*(index["pages"] for index in indexes)))
+    matrix = {slug: {index["lang"]: index["pages"].get(slug) for index in indexes} for slug in slugs}
+
+    categories: Dict[str, Dict[str, Dict[str, int]]] = {}
+    for slug, row in matrix.items():
+        category = slug.split("/", 1)[0] if "/" in slug else "(root)"
+        totals = categories.setdefault(category, {lang: {"pages": 0, "present": 0, "valid": 0, "listed": 0}
+                                                  for lang in selected})
+        for lang, page in row.items():
+            totals[lang]["pages"] += 1
+            if page is not None:
+                totals[lang]["present"] += 1
+                totals[lang]["valid"] += not page["issues"]
+                totals[lang]["listed"] += page["listed"]
+
+    return {
+        "locales": selected,
+        "matrix": matrix,
+        "categories": categories,
+        "dangling": [d for index in indexes for d in index["dangling"]],
+        "errors": [e for index in indexes for e in index["errors"]],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Slug × locale coverage matrix of a Fumadocs site")
+    parser.add_argument("docs_dir", nargs="?", type=Path, default=DEFAULT_DOCS_DIR,
+                        help="Docs root with one directory per locale (default: content/docs)")
+    parser.add_argument("--locales", help="Comma-separated locales (default: every content/docs/<lang>)")
+    parser.add_argument("--all", action="store_true", help="Show every slug, not only rows with gaps")
+    parser.add_argument("--json", action="store_true", help="Print the full matrix as JSON")
+    parser.add_argument("--strict", action="store_true", help="Also fail when a page is missing in a locale")
+
+    args = parser.parse_args()
+
+    if not args.docs_dir.is_dir():
+        print(f"❌ {args.docs_dir} not found", file=sys.stderr)
+        sys.exit(1)
+
+    locales = [lang.strip() for lang in args.locales.split(",")] if args.locales else None
+    result = build_matrix(args.docs_dir, locales)
+    langs = result["locales"]
+    rows = result["matrix"]
+
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    else:
+        width = max([len(slug) for slug in rows] + [4])
+        shown = [slug for slug, row in rows.items() if args.all or any(cell(p) != "✓" for p in row.values())]
+        if shown:
+            print(f"{'slug':<{width}}  " + "  ".join(f"{lang:^5}" for lang in langs))
+            for slug in shown:
+                row = rows[slug]
+                issues = sorted({i for p in row.values() if p for i in p["issues"]})
+                note = f"  {'; '.join(issues)}" if issues else ""
+                print(f"{slug:<{width}}  " + "  ".join(f"{cell(row[lang]):^5}" for lang in langs) + note)
+            print("\n✓ ok   ~ not in meta.json   ! invalid or unreadable frontmatter   · missing\n")
+
+        print("📊 Coverage by category (present/pages, ! invalid):")
+        for category, totals in sorted(result["categories"].items()):
+            parts = []
+            for lang in langs:
+                t = totals[lang]
+                invalid = t["present"] - t["valid"]
+                parts.append(f"{lang} {t['present']}/{t['pages']}" + (f" ({invalid}!)" if invalid else ""))
+            print(f"  {category:<{width}}  " + "   ".join(parts))
+
+        for entry in result["dangling"]:
+            print(f"  ⚠️  dangling meta.json entry {entry}")
+        for error in result["errors"]:
+            print(f"  ❌ {error}", file=sys.stderr)
+
+    invalid = any(p and p["issues"] for row in rows.values() for p in row.values())
+    missing = any(p is None for row in rows.values() for p in row.values())
+    if invalid or result["dangling"] or result["errors"] or (args.strict and missing):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""locale_coverage.build_matrix over a small docs tree."""
+
+import sys
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from locale_coverage import build_matrix, cell
+
+
+class BuildMatrixTest(unittest.TestCase):
+
+    def setUp(self):
+        self.docs = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.docs)
+
+    def page(self, rel: str, content: bytes):
+        path = self.docs / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+
+    def test_cells(self):
+        self.page("en/guide.mdx", b'---\ntitle: "Guide"\n---\n')
+        self.page("en/faq.mdx", b'---\ntitle: "FAQ"\n---\n')
+        self.page("zh/guide.mdx", b'---\ntitle: "\xe6\x8c\x87\xe5\x8d\x97"\nlang: fr\n---\n')
+
+        matrix = build_matrix(self.docs)["matrix"]
+
+        self.assertEqual({slug: {lang: cell(page) for lang, page in row.items()} for slug, row in matrix.items()},
+                         {"faq": {"en": "✓", "zh": "·"}, "guide": {"en": "✓", "zh": "!"}})
+        self.assertEqual(matrix["guide"]["zh"]["issues"], ["lang is fr"])
+
+    def test_undecodable_page_is_reported_not_fatal(self):
+        self.page("en/guide.mdx", b'---\ntitle: "Guide"\n---\n')
+        self.page("zh/guide.mdx", b'---\ntitle: "\xff\xfe"\n---\n')
+
+        result = build_matrix(self.docs)
+
+        page = result["matrix"]["guide"]["zh"]
+        self.assertEqual(cell(page), "!")
+        self.assertTrue(page["issues"][0].startswith("not UTF-8"))
+        self.assertEqual(result["categories"]["(root)"]["zh"]["valid"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Shared SQLite index of the MDX articles in content/docs/<lang>/.
+
+For every article the index stores its locale and slug, size, mtime,
+content hash and source hash (the version a translation records it was
+made from, see article-translator's translation_memory.py), the parsed
+frontmatter, headings, outbound links and image references. It lives
+outside the work tree, so `git add -A` never picks it up: in the
+repository's git directory (.git/content-index.sqlite), or in the user
+cache directory when the site is not a git repository.
+
+It is updated incrementally: files with unchanged size and mtime are
+skipped, files whose bytes hash the same are only re-stamped, and only the
+rest are parsed again. Tools ask the index small questions (lang, title,
+source URL, sibling locales, who links where) instead of re-reading the
+tree.
+
+Usage:
+    python content_index.py update [project-root]
+    python content_index.py show <file> [--project-root <dir>]
+    python content_index.py siblings <slug> [--project-root <dir>]
+    python content_index.py find --field <name> --value <value> [--project-root <dir>]
+    python content_index.py links-to <url> [--project-root <dir>]
+
+Examples:
+    python content_index.py update .
+    python content_index.py show content/docs/zh/ai-ml/article.mdx
+    python content_index.py find --field source.url --value https://example.com/post
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+import subprocess
+import argparse
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+
+DEFAULT_DOCS_DIR = Path('content') / 'docs'
+DB_NAME = 'content-index.sqlite'
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'mdx-article-publisher'
+SCHEMA_VERSION = 2
+
+# source_hash as computed by article-translator's translation_memory.py: the
+# version of an English article that a translation records it was made from
+SOURCE_HASH_LENGTH = 16
+SOURCE_HASH_FIELDS = {'title', 'description'}
+FRONTMATTER_BLOCK = re.compile(r'^---\n(?:.*?\n)?(---)[^\n]*(?:\n|$)', re.DOTALL)
+FRONTMATTER_FIELD = re.compile(r'^([A-Za-z0-9_-]+):(\s*)(["\']?)(.*?)(\3)(\s*(?:#.*)?)$')
+
+# Locale directory names: en, zh, fr, zh-CN, pt-BR...
+LOCALE_DIR_PATTERN = re.compile(r'^[a-z]{2}(-[A-Z]{2})?$')
+
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+FENCE_PATTERN = re.compile(r'^\s*(```|~~~)')
+IMAGE_PATTERN = re.compile(r'!\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"]*")?\s*\)|<img\b[^>]*?\bsrc=["\']([^"\']+)["\']')
+LINK_PATTERN = re.compile(r'(?<!!)\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"]*")?\s*\)|\bhref=["\']([^"\']+)["\']')
+
+SCHEMA = '''
+CREATE TABLE files (
+    path TEXT PRIMARY KEY,
+    lang TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    source_hash TEXT NOT NULL,
+    title TEXT,
+    description TEXT,
+    frontmatter TEXT NOT NULL,
+    frontmatter_error TEXT,
+    indexed_at REAL NOT NULL
+);
+CREATE INDEX files_slug ON files (slug, lang);
+CREATE TABLE headings (path TEXT NOT NULL, line INTEGER NOT NULL, level INTEGER NOT NULL, text TEXT NOT NULL);
+CREATE TABLE links (path TEXT NOT NULL, line INTEGER NOT NULL, url TEXT NOT NULL);
+CREATE TABLE images (path TEXT NOT NULL, line INTEGER NOT NULL, url TEXT NOT NULL);
+CREATE INDEX headings_path ON headings (path);
+CREATE INDEX links_path ON links (path);
+CREATE INDEX links_url ON links (url);
+CREATE INDEX images_path ON images (path);
+CREATE INDEX images_url ON images (url);
+'''
+
+
+def parse_frontmatter(lines: List[str]) -> Tuple[Dict[str, Any], int, Optional[str]]:
+    """Frontmatter fields, the index of the first body line and an error message, if any.
+
+    Top-level scalars map to strings, indented "key: value" lines under a
+    parent become "parent.key", and "- item" lines become a list.
+    """
+    if not lines or lines[0].strip() != '---':
+        return {}, 0, 'no frontmatter'
+
+    fields: Dict[str, Any] = {}
+    parent = None
+    for i, line in enumerate(lines[1:], start=1):
+        if line.strip() == '---':
+            return fields, i + 1, None
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+        if not line[0].isspace():
+            key, sep, value = line.partition(':')
+            if not sep:
+                continue
+            parent = key.strip()
+            value = value.split(' #')[0].strip()
+            fields[parent] = value.strip('"\'') if value else None
+        elif parent:
+            item = line.strip()
+            if item.startswith('- '):
+                if not isinstance(fields.get(parent), list):
+                    fields[parent] = []
+                fields[parent].append(item[2:].strip().strip('"\''))
+            elif ':' in item:
+                key, _, value = item.partition(':')
+                fields[f'{parent}.{key.strip()}'] = value.split(' #')[0].strip().strip('"\'')
+    return fields, 0, 'unclosed frontmatter'
+
+
+def state_path(project_root: Path, name: str) -> Path:
+    """Location for a tool's state file outside the work tree, so `git add -A` never stages it.
+
+    Inside the repository's git directory, or in the user cache directory
+    (one file per project) when the site is not a git repository.
+    """
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--git-dir'], cwd=project_root,
+                                capture_output=True, text=True, check=True)
+        return (project_root / result.stdout.strip()).resolve() / name
+    except (OSError, subprocess.CalledProcessError):
+        digest = hashlib.sha256(str(project_root.resolve()).encode('utf-8')).hexdigest()[:16]
+        return CACHE_DIR / f'{digest}-{name}'
+
+
+def source_hash(text: str) -> str:
+    """Hash of title, description and the whitespace-normalized body (same as translation_memory.source_hash)."""
+    match = FRONTMATTER_BLOCK.match(text)
+    header, body = (text[:match.end()], text[match.end():]) if match else ('', text)
+
+    parts = []
+    for line in header.split('\n')[1:]:
+        if line.strip() == '---':
+            break
+        field = FRONTMATTER_FIELD.match(line)
+        if field and field.group(1) in SOURCE_HASH_FIELDS and any(ch.isalpha() for ch in field.group(4)):
+            # segment_mdx leaves a value's leading whitespace out of the segment
+            parts.append(field.group(4).lstrip(' \t'))
+    parts.extend(line.strip() for line in body.splitlines() if line.strip())
+    return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()[:SOURCE_HASH_LENGTH]
+
+
+def parse_article(text: str) -> Dict[str, Any]:
+    """Frontmatter, headings, links and images of one article (code fences are skipped)."""
+    lines = text.split('\n')
+    frontmatter, body_start, error = parse_frontmatter(lines)
+
+    headings, links, images = [], [], []
+    fence = None
+    for number, line in enumerate(lines[body_start:], start=body_start + 1):
+        match = FENCE_PATTERN.match(line)
+        if match:
+            if fence is None:
+                fence = match.group(1)
+            elif match.group(1) == fence:
+                fence = None
+            continue
+        if fence:
+            continue
+
+        heading = HEADING_PATTERN.match(line)
+        if heading:
+            headings.append((number, len(heading.group(1)), heading.group(2)))
+        for m in IMAGE_PATTERN.finditer(line):
+            images.append((number, m.group(1) or m.group(2)))
+        for m in LINK_PATTERN.finditer(line):
+            links.append((number, m.group(1) or m.group(2)))
+
+    return {'frontmatter': frontmatter, 'error': error, 'headings': headings, 'links': links, 'images': images}
+
+
+class ContentIndex:
+    """Incrementally maintained SQLite index of content/docs/<lang>/**/*.mdx."""
+
+    def __init__(self, project_root: Path, docs_dir: Path = DEFAULT_DOCS_DIR, db_path: Optional[Path] = None):
+        self.project_root = project_root
+        self.docs_root = project_root / docs_dir
+        self.db_path = db_path or state_path(project_root, DB_NAME)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(self.db_path))
+        self.db.row_factory = sqlite3.Row
+        self._ensure_schema()
+
+    def __enter__(self) -> 'ContentIndex':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.db.close()
+
+    def _ensure_schema(self):
+        """Create the tables, recreating them when the schema version changed."""
+        if self.db.execute('PRAGMA user_version').fetchone()[0] == SCHEMA_VERSION:
+            return
+        with self.db:
+            for table in ('files', 'headings', 'links', 'images'):
+                self.db.execute(f'DROP TABLE IF EXISTS {table}')
+            self.db.executescript(SCHEMA)
+            self.db.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def _walk(self) -> Dict[str, Tuple[str, str, os.stat_result]]:
+        """Project-relative path → (lang, slug, stat) of every article, in one scandir traversal."""
+        found: Dict[str, Tuple[str, str, os.stat_result]] = {}
+        if not self.docs_root.is_dir():
+            return found
+
+        with os.scandir(self.docs_root) as it:
+            stack = [(entry.path, entry.name, '') for entry in it
+                     if entry.is_dir() and LOCALE_DIR_PATTERN.match(entry.name)]
+        while stack:
+            directory, lang, prefix = stack.pop()
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, lang, f'{prefix}{entry.name}/'))
+                    elif entry.name.endswith('.mdx') and entry.is_file():
+                        rel = Path(entry.path).relative_to(self.project_root).as_posix()
+                        found[rel] = (lang, prefix + entry.name[:-4], entry.stat())
+        return found
+
+    def update(self) -> Dict[str, int]:
+        """Bring the index up to date with the tree; returns what had to be done."""
+        stats = {'files': 0, 'parsed': 0, 'restamped': 0, 'removed': 0}
+        known = {row['path']: row for row in self.db.execute('SELECT path, size, mtime_ns, sha256 FROM files')}
+        found = self._walk()
+        stats['files'] = len(found)
+
+        with self.db:
+            for path, (lang, slug, stat) in found.items():
+                row = known.get(path)
+                if row and row['size'] == stat.st_size and row['mtime_ns'] == stat.st_mtime_ns:
+                    continue
+
+                data = (self.project_root / path).read_bytes()
+                digest = hashlib.sha256(data).hexdigest()
+                if row and row['sha256'] == digest:
+                    self.db.execute('UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?',
+                                    (stat.st_size, stat.st_mtime_ns, path))
+                    stats['restamped'] += 1
+                    continue
+
+                self._store(path, lang, slug, stat, digest, data.decode('utf-8', errors='replace'))
+                stats['parsed'] += 1
+
+            for path in known.keys() - found.keys():
+                self._delete(path)
+                stats['removed'] += 1
+
+        return stats
+
+    def _delete(self, path: str):
+        for table in ('files', 'headings', 'links', 'images'):
+            self.db.execute(f'DELETE FROM {table} WHERE path = ?', (path,))
+
+    def _store(self, path: str, lang: str, slug: str, stat: os.stat_result, digest: str, text: str):
+        self._delete(path)
+        parsed = parse_article(text)
+        frontmatter = parsed['frontmatter']
+        self.db.execute(
+            'INSERT INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (path, lang, slug, stat.st_size, stat.st_mtime_ns, digest, source_hash(text),
+             frontmatter.get('title'), frontmatter.get('description'),
+             json.dumps(frontmatter, ensure_ascii=False), parsed['error'], time.time()))
+        self.db.executemany('INSERT INTO headings VALUES (?, ?, ?, ?)',
+                            [(path, line, level, text) for line, level, text in parsed['headings']])
+        self.db.executemany('INSERT INTO links VALUES (?, ?, ?)', [(path, line, url) for line, url in parsed['links']])
+        self.db.executemany('INSERT INTO images VALUES (?, ?, ?)', [(path, line, url) for line, url in parsed['images']])
+
+    # Queries
+
+    def _row(self, row: Optional[sqlite3.Row]) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        entry = dict(row)
+        entry['frontmatter'] = json.loads(entry['frontmatter'])
+        return entry
+
+    def relative(self, file_path) -> str:
+        """Project-relative POSIX path of a file given relative to the project or absolute."""
+        path = Path(file_path)
+        if path.is_absolute():
+            path = path.resolve().relative_to(self.project_root.resolve())
+        return path.as_posix()
+
+    def get(self, file_path) -> Optional[Dict[str, Any]]:
+        """Indexed entry of one article: lang, slug, hash, title, description, frontmatter..."""
+        try:
+            path = self.relative(file_path)
+        except ValueError:
+            return None
+        row = self.db.execute('SELECT * FROM files WHERE path = ?', (path,)).fetchone()
+        return self._row(row)
+
+    def all(self) -> List[Dict[str, Any]]:
+        """Every indexed entry, ordered by path."""
+        return [self._row(row) for row in self.db.execute('SELECT * FROM files ORDER BY path')]
+
+    def locales(self) -> List[str]:
+        return [row[0] for row in self.db.execute('SELECT DISTINCT lang FROM files ORDER BY lang')]
+
+    def slugs(self) -> List[str]:
+        return [row[0] for row in self.db.execute('SELECT DISTINCT slug FROM files ORDER BY slug')]
+
+    def files(self, under: Optional[str] = None) -> List[str]:
+        """Indexed article paths, optionally only those below a project-relative directory."""
+        if under is None:
+            return [row[0] for row in self.db.execute('SELECT path FROM files ORDER BY path')]
+        prefix = self.relative(under).rstrip('/') + '/'
+        return [row[0] for row in self.db.execute(
+            "SELECT path FROM files WHERE substr(path, 1, ?) = ? ORDER BY path", (len(prefix), prefix))]
+
+    def siblings(self, slug: str) -> Dict[str, Dict[str, Any]]:
+        """Locale → entry for every version of a slug."""
+        rows = self.db.execute('SELECT * FROM files WHERE slug = ? ORDER BY lang', (slug,))
+        return {row['lang']: self._row(row) for row in rows}
+
+    def find(self, field: str, value: str) -> List[Dict[str, Any]]:
+        """Articles whose frontmatter field (e.g. "lang", "source.url") equals value."""
+        return [entry for entry in self.all() if entry['frontmatter'].get(field) == value]
+
+    def headings(self, file_path) -> List[Dict[str, Any]]:
+        return [dict(row) for row in self.db.execute(
+            'SELECT line, level, text FROM headings WHERE path = ? ORDER BY line', (self.relative(file_path),))]
+
+    def links(self, file_path) -> List[Dict[str, Any]]:
+        return [dict(row) for row in self.db.execute(
+            'SELECT line, url FROM links WHERE path = ? ORDER BY line', (self.relative(file_path),))]
+
+    def images(self, file_path) -> List[Dict[str, Any]]:
+        return [dict(row) for row in self.db.execute(
+            'SELECT line, url FROM images WHERE path = ? ORDER BY line', (self.relative(file_path),))]
+
+    def linking_to(self, url: str) -> List[str]:
+        """Articles with a link or image reference to url."""
+        return [row[0] for row in self.db.execute(
+            'SELECT path FROM links WHERE url = ? UNION SELECT path FROM images WHERE url = ? ORDER BY 1', (url, url))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Shared SQLite index of MDX articles')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    update = commands.add_parser('update', help='Update the index from content/docs')
+    update.add_argument('project_root', nargs='?', default='.')
+
+    show = commands.add_parser('show', help='Print the indexed entry of one article')
+    show.add_argument('file')
+
+    siblings = commands.add_parser('siblings', help='Print every locale version of a slug')
+    siblings.add_argument('slug')
+
+    find = commands.add_parser('find', help='Find articles by frontmatter field')
+    find.add_argument('--field', required=True)
+    find.add_argument('--value', required=True)
+
+    links_to = commands.add_parser('links-to', help='Articles linking to (or embedding) a URL')
+    links_to.add_argument('url')
+
+    for command in (show, siblings, find, links_to):
+        command.add_argument('--project-root', default='.')
+
+    args = parser.parse_args()
+    project_root = Path(args.project_root).resolve()
+    if not (project_root / DEFAULT_DOCS_DIR).is_dir():
+        print(f"❌ {project_root / DEFAULT_DOCS_DIR} not found")
+        sys.exit(1)
+
+    with ContentIndex(project_root) as index:
+        stats = index.update()
+
+        if args.command == 'update':
+            print(f"🗂️  {stats['files']} articles indexed in {index.db_path}: {stats['parsed']} parsed, "
+                  f"{stats['restamped']} re-stamped, {stats['removed']} removed")
+
+        elif args.command == 'show':
+            entry = index.get(Path(args.file).resolve())
+            if entry is None:
+                print(f"❌ Not indexed: {args.file}")
+                sys.exit(1)
+            entry.update(headings=index.headings(entry['path']), links=index.links(entry['path']),
+                         images=index.images(entry['path']))
+            print(json.dumps(entry, indent=2, ensure_ascii=False))
+
+        elif args.command == 'siblings':
+            print(json.dumps(index.siblings(args.slug), indent=2, ensure_ascii=False))
+
+        elif args.command == 'find':
+            for entry in index.find(args.field, args.value):
+                print(entry['path'])
+
+        elif args.command == 'links-to':
+            for path in index.linking_to(args.url):
+                print(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Locale index of translated MDX articles.
+
+Maps every article slug (its path below the locale directory, without
+extension) to the file, size, mtime and content hash of each locale version.
+Used to group translation sibling sets and flag missing or outdated
+translations without probing the filesystem per file. The entries come from
+the shared content index (content_index.py), so only files changed since the
+last run are re-read.
+
+A translation is outdated when the source_hash recorded in its frontmatter
+(written by the article-translator tools) differs from the current source
+hash of the English article. Modification times are not compared: checkouts
+and clones reset them.
+
+Usage:
+    python locale_index.py <project-root-or-docs-dir> [--json]
+
+Examples:
+    python locale_index.py .
+    python locale_index.py content/docs --json
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from content_index import ContentIndex
+
+
+DEFAULT_DOCS_DIR = Path('content') / 'docs'
+SOURCE_LOCALE = 'en'
+
+# Locale directory names: en, zh, fr, zh-CN, pt-BR...
+LOCALE_DIR_PATTERN = re.compile(r'^[a-z]{2}(-[A-Z]{2})?$')
+
+
+class LocaleIndex:
+    """Slug → locale → file entry index for content/docs/<lang>/**.mdx."""
+
+    def __init__(self, project_root: Path, docs_dir: Path = DEFAULT_DOCS_DIR,
+                 source_locale: str = SOURCE_LOCALE):
+        self.project_root = project_root
+        self.docs_dir = docs_dir
+        self.docs_root = project_root / docs_dir
+        self.source_locale = source_locale
+        self.content_index: Optional[ContentIndex] = None
+        self.locales: List[str] = []
+        self.entries: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.files_indexed: int = 0
+
+    def build(self) -> 'LocaleIndex':
+        """Update the content index and group its entries by slug and locale."""
+        self.locales = []
+        self.entries = {}
+        self.files_indexed = 0
+
+        if not self.docs_root.is_dir():
+            return self
+
+        with os.scandir(self.docs_root) as it:
+            self.locales = sorted(
+                entry.name for entry in it
+                if entry.is_dir() and LOCALE_DIR_PATTERN.match(entry.name)
+            )
+
+        if self.content_index is None:
+            self.content_index = ContentIndex(self.project_root, self.docs_dir)
+        self.content_index.update()
+
+        for entry in self.content_index.all():
+            self.entries.setdefault(entry['slug'], {})[entry['lang']] = {
+                'file': entry['path'],
+                'size': entry['size'],
+                'mtime': entry['mtime_ns'] / 1e9,
+                'hash': entry['sha256'],
+                'source_hash': entry['source_hash'],
+                'recorded_hash': entry['frontmatter'].get('source_hash')
+            }
+            self.files_indexed += 1
+
+        return self
+
+    def locate(self, file_path: str) -> Optional[Tuple[str, str]]:
+        """Return (lang, slug) for a project-relative path, or None if not indexed."""
+        try:
+            rel = (self.project_root / file_path).relative_to(self.docs_root)
+        except ValueError:
+            return None
+
+        if len(rel.parts) < 2 or rel.parts[0] not in self.locales:
+            return None
+        return rel.parts[0], Path(*rel.parts[1:]).with_suffix('').as_posix()
+
+    def siblings(self, slug: str) -> Dict[str, Dict[str, Any]]:
+        """All locale versions of a slug."""
+        return self.entries.get(slug, {})
+
+    def missing(self, slug: str) -> List[str]:
+        """Locales that have no version of this slug."""
+        present = self.siblings(slug)
+        return [lang for lang in self.locales if lang not in present]
+
+    def outdated(self, slug: str) -> List[str]:
+        """Translations made from an older source version, or byte-identical copies of it.
+
+        Translations without a recorded source_hash cannot be dated and are
+        not reported.
+        """
+        versions = self.siblings(slug)
+        source = versions.get(self.source_locale)
+        if not source:
+            return []
+
+        stale = []
+        for lang, entry in sorted(versions.items()):
+            if lang == self.source_locale:
+                continue
+            recorded = entry['recorded_hash']
+            if (recorded and recorded != source['source_hash']) or entry['hash'] == source['hash']:
+                stale.append(lang)
+        return stale
+
+    def translation_status(self, slug: str) -> Dict[str, Any]:
+        """Summary of one sibling set: present, missing and outdated locales."""
+        return {
+            'slug': slug,
+            'present': sorted(self.siblings(slug)),
+            'missing': self.missing(slug),
+            'outdated': self.outdated(slug)
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable view of the whole index."""
+        return {
+            'docs_root': str(self.docs_root),
+            'locales': self.locales,
+            'files_indexed': self.files_indexed,
+            'slugs': {slug: self.translation_status(slug) for slug in sorted(self.entries)}
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Index translated MDX articles by slug and locale')
+    parser.add_argument('path', help='Project root (containing content/docs) or the docs directory itself')
+    parser.add_argument('--json', action='store_true', help='Print the full index as JSON')
+
+    args = parser.parse_args()
+
+    path = Path(args.path).resolve()
+    if not path.exists():
+        print(f"❌ Path does not exist: {path}")
+        sys.exit(1)
+
+    if (path / DEFAULT_DOCS_DIR).is_dir():
+        index = LocaleIndex(path).build()
+    else:
+        index = LocaleIndex(path, docs_dir=Path('.')).build()
+
+    if args.json:
+        print(json.dumps(index.to_dict(), indent=2, ensure_ascii=False))
+        return
+
+    print(f"📚 {index.files_indexed} files, {len(index.entries)} slugs, locales: {', '.join(index.locales)}")
+    for slug in sorted(index.entries):
+        status = index.translation_status(slug)
+        if status['missing'] or status['outdated']:
+            notes = []
+            if status['missing']:
+                notes.append(f"missing {', '.join(status['missing'])}")
+            if status['outdated']:
+                notes.append(f"outdated {', '.join(status['outdated'])}")
+            print(f"  ⚠️  {slug}: {'; '.join(notes)}")
+
+
+if __name__ == '__main__':
+    main()
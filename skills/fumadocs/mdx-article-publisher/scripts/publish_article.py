@@ -3,30 +3,109 @@
 Publish article with semantic commit and automated push.
 
 Usage:
-    python publish_article.py <mdx-file-or-directory> [--push] [--type <commit-type>]
+    python publish_article.py <mdx-file-or-directory>... [--push] [--type <commit-type>]
+    python publish_article.py <mdx-file-or-directory>... --queue
+    python publish_article.py --flush-queue [--group-by language|category] [--push]
 
 Examples:
     python publish_article.py content/docs/en/development/article.mdx
     python publish_article.py content/docs/en/development/article.mdx --push
     python publish_article.py content/docs/en/development/article.mdx --push --type feat
+    python publish_article.py content/docs/en/ai-ml/a.mdx content/docs/zh/ai-ml/a.mdx --push
+    python publish_article.py content/docs/fr/ai-ml/a.mdx --queue
+    python publish_article.py --flush-queue --group-by category --push
 """
 
 import re
 import sys
+import json
+import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import subprocess
 
+from content_index import state_path
+from locale_index import LocaleIndex
+from validate_mdx import MDXValidator
+
+
+# Queue file collecting articles for batch publishing; kept in the git directory
+# (see content_index.state_path) so unrelated commits never pick it up
+QUEUE_FILE = 'publish-queue'
+
+# git push stderr fragments that indicate a retryable (network-level) failure
+TRANSIENT_PUSH_ERRORS = [
+    'could not resolve host',
+    'connection timed out',
+    'connection reset',
+    'connection refused',
+    'operation timed out',
+    'temporary failure',
+    'the remote end hung up unexpectedly',
+    'early eof',
+    'rpc failed',
+    'http 5',
+    'returned error: 5',
+]
+
+
+def _output_size(output) -> int:
+    """Size in bytes of captured subprocess output (str, bytes or None)."""
+    if not output:
+        return 0
+    return len(output.encode('utf-8')) if isinstance(output, str) else len(output)
+
 
 class ArticlePublisher:
     """Publishes MDX articles with semantic commits and automated push."""
 
-    def __init__(self, push: bool = False, commit_type: str = 'docs'):
+    def __init__(self, push: bool = False, commit_type: str = 'docs',
+                 remotes: Optional[List[str]] = None, push_retries: int = 3,
+                 retry_backoff: float = 1.0):
         self.push = push
         self.commit_type = commit_type
+        self.remotes = remotes or ['origin']
+        self.push_retries = push_retries
+        self.retry_backoff = retry_backoff
+        self.push_results: List[Dict[str, Any]] = []
         self.changes: List[Dict[str, Any]] = []
         self.project_root = None
+        self.group_by: Optional[str] = None
+        self.locale_index: Optional[LocaleIndex] = None
+        # Telemetry: wall time per stage, every subprocess call, build output size
+        self.started_at = time.perf_counter()
+        self.timings: Dict[str, float] = {}
+        self.subprocesses: List[Dict[str, Any]] = []
+        self.build_output_bytes: int = 0
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a pipeline stage (detect, build, mdx, commit, push)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
+    def _run(self, cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
+        """subprocess.run wrapper that records duration, exit code and output size."""
+        start = time.perf_counter()
+        record: Dict[str, Any] = {'cmd': ' '.join(cmd[:3]), 'returncode': None, 'output_bytes': 0}
+        try:
+            result = subprocess.run(cmd, **kwargs)
+            record['returncode'] = result.returncode
+            record['output_bytes'] = _output_size(result.stdout) + _output_size(result.stderr)
+            return result
+        except subprocess.CalledProcessError as e:
+            record['returncode'] = e.returncode
+            raise
+        finally:
+            record['seconds'] = round(time.perf_counter() - start, 4)
+            self.subprocesses.append(record)
 
     def find_project_root(self, start_path: Path) -> Path:
         """Find the project root containing package.json."""
@@ -43,21 +122,41 @@ class ArticlePublisher:
             # Single file
             if self._is_mdx_file(path):
                 rel_path = path.relative_to(self.project_root)
-                self.changes.append({
-                    'file': str(rel_path),
-                    'type': self._detect_change_type(path),
-                    'languages': self._detect_languages(path)
-                })
+                self._add_change(str(rel_path))
         else:
             # Directory - find all modified/added MDX files
             changed_files = self._get_git_changed_files()
             for file_path in changed_files:
                 if self._is_mdx_file(Path(file_path)):
-                    self.changes.append({
-                        'file': file_path,
-                        'type': self._detect_change_type(Path(file_path)),
-                        'languages': self._detect_languages(Path(file_path))
-                    })
+                    self._add_change(file_path)
+
+    def build_locale_index(self) -> LocaleIndex:
+        """Index content/docs/<lang>/ once so changes can be grouped into translation sets."""
+        self.locale_index = LocaleIndex(self.project_root).build()
+        return self.locale_index
+
+    def _add_change(self, file_path: str):
+        """Record a changed file once, even when several queued paths cover it."""
+        if any(change['file'] == file_path for change in self.changes):
+            return
+
+        located = self.locale_index.locate(file_path) if self.locale_index else None
+        if located:
+            lang, slug = located
+            languages = [lang]
+            category = slug.split('/')[0] if '/' in slug else 'general'
+        else:
+            slug = Path(file_path).stem
+            languages = self._detect_languages(Path(file_path))
+            category = self._detect_category(Path(file_path))
+
+        self.changes.append({
+            'file': file_path,
+            'type': self._detect_change_type(Path(file_path)),
+            'languages': languages,
+            'category': category,
+            'slug': slug
+        })
 
     def _is_mdx_file(self, path: Path) -> bool:
         """Check if file is an MDX file."""
@@ -66,7 +165,7 @@ class ArticlePublisher:
     def _get_git_changed_files(self) -> List[str]:
         """Get list of changed/added files from git."""
         try:
-            result = subprocess.run(
+            result = self._run(
                 ['git', 'status', '--porcelain'],
                 cwd=self.project_root,
                 capture_output=True,
@@ -115,11 +214,80 @@ class ArticlePublisher:
 
         return languages if languages else ['en']  # Default to English
 
+    def _detect_category(self, file_path: Path) -> str:
+        """Detect category from path (content/docs/<lang>/<category>/<slug>.mdx)."""
+        parts = file_path.parts
+        for i, part in enumerate(parts[:-2]):
+            if part in ('en', 'zh', 'fr'):
+                return parts[i + 1]
+        return 'general'
+
+    def load_queue(self) -> List[str]:
+        """Load queued article paths (relative to project root)."""
+        queue_path = state_path(self.project_root, QUEUE_FILE)
+        if not queue_path.exists():
+            return []
+        with open(queue_path, 'r', encoding='utf-8') as f:
+            return [line.strip() for line in f if line.strip()]
+
+    def enqueue(self, paths: List[Path]) -> int:
+        """Add paths to the publish queue, skipping ones already queued."""
+        queued = self.load_queue()
+        added = 0
+        for path in paths:
+            rel_path = str(path.relative_to(self.project_root))
+            if rel_path not in queued:
+                queued.append(rel_path)
+                added += 1
+
+        queue_path = state_path(self.project_root, QUEUE_FILE)
+        queue_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(queue_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(queued) + '\n')
+        return added
+
+    def clear_queue(self):
+        """Remove the publish queue after a successful batch."""
+        queue_path = state_path(self.project_root, QUEUE_FILE)
+        if queue_path.exists():
+            queue_path.unlink()
+
+    def group_changes(self, group_by: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Group detected changes by primary language, category or translation set (slug)."""
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for change in self.changes:
+            if group_by == 'language':
+                key = change['languages'][0]
+            elif group_by == 'translation':
+                key = change['slug']
+            else:
+                key = change['category']
+            groups.setdefault(key, []).append(change)
+        return dict(sorted(groups.items()))
+
+    def translation_report(self) -> List[Dict[str, Any]]:
+        """Missing/outdated locales for every translation set touched by this publish."""
+        if not self.locale_index:
+            return []
+        slugs = sorted({change['slug'] for change in self.changes
+                        if change['slug'] in self.locale_index.entries})
+        return [self.locale_index.translation_status(slug) for slug in slugs]
+
+    def validation_files(self) -> List[str]:
+        """Changed files plus every existing locale sibling, so each set is validated as a unit."""
+        files = [change['file'] for change in self.changes]
+        if self.locale_index:
+            for change in self.changes:
+                for entry in self.locale_index.siblings(change['slug']).values():
+                    if entry['file'] not in files:
+                        files.append(entry['file'])
+        return files
+
     def validate_build(self) -> bool:
         """Run build to ensure files compile correctly."""
         print("🔧 Validating build...")
         try:
-            result = subprocess.run(
+            result = self._run(
                 ['npm', 'run', 'build'],
                 cwd=self.project_root,
                 capture_output=True,
@@ -127,6 +295,8 @@ class ArticlePublisher:
                 timeout=300
             )
 
+            self.build_output_bytes += _output_size(result.stdout) + _output_size(result.stderr)
+
             if result.returncode != 0:
                 print("❌ Build validation failed:")
                 print(result.stderr)
@@ -145,7 +315,7 @@ class ArticlePublisher:
         """Run MDX validation."""
         print("🔍 Running MDX validation...")
         try:
-            result = subprocess.run(
+            result = self._run(
                 ['python', 'scripts/validate_mdx.py', str(path)],
                 cwd=self.project_root / '.claude/skills/skill-article-publisher',
                 capture_output=True,
@@ -167,16 +337,36 @@ class ArticlePublisher:
             print(f"⚠️  Could not run MDX validation: {str(e)}")
             return True  # Continue anyway
 
-    def generate_commit_message(self) -> str:
+    def validate_mdx_batch(self) -> bool:
+        """Run MDX validation over the changed files and their locale siblings in one pass."""
+        files = self.validation_files()
+        print(f"🔍 Running MDX validation on {len(files)} files "
+              f"({len(files) - len(self.changes)} locale siblings)...")
+        validator = MDXValidator(self.locale_index.content_index if self.locale_index else None)
+        for file_path in files:
+            validator.validate_file(self.project_root / file_path)
+        validator.print_report()
+
+        if validator.errors:
+            print("❌ MDX validation failed")
+            return False
+        return True
+
+    def generate_commit_message(self, changes: Optional[List[Dict[str, Any]]] = None,
+                                scope: Optional[str] = None) -> str:
         """Generate semantic commit message based on detected changes."""
-        if not self.changes:
-            return f'{self.commit_type}: publish article'
+        if changes is None:
+            changes = self.changes
+        prefix = f'({scope})' if scope else ''
+
+        if not changes:
+            return f'{self.commit_type}{prefix}: publish article'
 
         # Group by type
         by_type: Dict[str, List[str]] = {}
         by_language: Dict[str, List[str]] = {}
 
-        for change in self.changes:
+        for change in changes:
             change_type = change['type']
             file_name = Path(change['file']).name
 
@@ -194,22 +384,22 @@ class ArticlePublisher:
         primary_type = self.commit_type
         if 'skill-analysis' in by_type:
             primary_type = 'feat'
-        elif len(self.changes) > 3:
+        elif len(changes) > 3:
             primary_type = 'feat'
 
         # Build message
         message_lines = []
 
         # Main commit line
-        if len(self.changes) == 1:
+        if len(changes) == 1:
             # Single file
-            change = self.changes[0]
+            change = changes[0]
             file_name = Path(change['file']).name.replace('.mdx', '')
-            message_lines.append(f"{primary_type}: publish {file_name}")
+            message_lines.append(f"{primary_type}{prefix}: publish {file_name}")
         else:
             # Multiple files
             type_summary = ', '.join(f"{len(files)} {t}" for t, files in by_type.items())
-            message_lines.append(f"{primary_type}: publish multiple articles ({type_summary})")
+            message_lines.append(f"{primary_type}{prefix}: publish multiple articles ({type_summary})")
 
         # Body with details
         message_lines.append('')
@@ -225,22 +415,27 @@ class ArticlePublisher:
 
         return '\n'.join(message_lines)
 
-    def stage_and_commit(self, message: str) -> bool:
-        """Stage changes and create commit."""
+    def stage_and_commit(self, message: str, files: Optional[List[str]] = None) -> bool:
+        """Stage changes and create commit.
+
+        When ``files`` is given only those paths are staged and committed,
+        so several batch commits can be cut from one working tree.
+        """
         print(f"\n📝 Preparing commit...")
+        pathspec = ['--'] + files if files else []
 
         try:
-            # Stage all changes
-            subprocess.run(
-                ['git', 'add', '-A'],
+            # Stage all changes (or just the batch files)
+            self._run(
+                ['git', 'add', '-A'] + pathspec,
                 cwd=self.project_root,
                 check=True,
                 capture_output=True
             )
 
             # Check if there are staged changes
-            result = subprocess.run(
-                ['git', 'diff', '--staged', '--name-only'],
+            result = self._run(
+                ['git', 'diff', '--staged', '--name-only'] + pathspec,
                 cwd=self.project_root,
                 capture_output=True,
                 text=True,
@@ -252,8 +447,8 @@ class ArticlePublisher:
                 return False
 
             # Create commit
-            subprocess.run(
-                ['git', 'commit', '-m', message],
+            self._run(
+                ['git', 'commit', '-m', message] + pathspec,
                 cwd=self.project_root,
                 check=True,
                 capture_output=True
@@ -268,13 +463,55 @@ class ArticlePublisher:
                 print(f"Error: {e.stderr.decode() if isinstance(e.stderr, bytes) else e.stderr}")
             return False
 
+    def related_files(self, file_path: str) -> List[str]:
+        """Existing assets that belong to an article: meta.json files on its path and referenced local images."""
+        related = []
+        article = self.project_root / file_path
+        docs_root = self.locale_index.docs_root if self.locale_index else article.parent
+        for directory in [article.parent, *article.parent.parents]:
+            if (directory / 'meta.json').is_file():
+                related.append((directory / 'meta.json').relative_to(self.project_root).as_posix())
+            if directory == docs_root or directory == self.project_root:
+                break
+
+        content_index = self.locale_index.content_index if self.locale_index else None
+        images = content_index.images(file_path) if content_index else []
+        for image in images:
+            url = image['url'].split('#')[0].split('?')[0]
+            if not url or '://' in url or url.startswith('data:'):
+                continue
+            target = self.project_root / 'public' / url.lstrip('/') if url.startswith('/') else article.parent / url
+            try:
+                rel = target.resolve().relative_to(self.project_root.resolve()).as_posix()
+            except ValueError:
+                continue
+            if target.is_file() and rel not in related:
+                related.append(rel)
+        return related
+
+    def commit_batches(self) -> int:
+        """Create one semantic commit per group. Returns number of commits created.
+
+        Each batch also stages the meta.json files and images that belong to
+        its articles, so nothing published alongside them is left behind.
+        """
+        commits = 0
+        for key, changes in self.group_changes(self.group_by).items():
+            message = self.generate_commit_message(changes, scope=key)
+            files = [change['file'] for change in changes]
+            for change in changes:
+                files += [f for f in self.related_files(change['file']) if f not in files]
+            if self.stage_and_commit(message, files):
+                commits += 1
+        return commits
+
     def push_changes(self) -> bool:
-        """Push changes to remote repository."""
-        print(f"\n🚀 Pushing to remote...")
+        """Push changes to every configured remote in parallel."""
+        print(f"\n🚀 Pushing to {', '.join(self.remotes)}...")
 
         try:
             # Get current branch
-            result = subprocess.run(
+            result = self._run(
                 ['git', 'branch', '--show-current'],
                 cwd=self.project_root,
                 capture_output=True,
@@ -282,21 +519,62 @@ class ArticlePublisher:
                 check=True
             )
             branch = result.stdout.strip()
-
-            # Push
-            subprocess.run(
-                ['git', 'push', 'origin', branch],
-                cwd=self.project_root,
-                check=True
-            )
-
-            print(f"✅ Changes pushed to origin/{branch}")
-            return True
-
         except subprocess.CalledProcessError as e:
             print(f"❌ Push failed: {str(e)}")
             return False
 
+        with ThreadPoolExecutor(max_workers=len(self.remotes)) as executor:
+            self.push_results = list(executor.map(
+                lambda remote: self._push_remote(remote, branch), self.remotes))
+
+        for outcome in self.push_results:
+            attempts = f"{outcome['attempts']} attempt{'s' if outcome['attempts'] > 1 else ''}"
+            if outcome['ok']:
+                print(f"✅ Changes pushed to {outcome['remote']}/{branch} ({attempts}, {outcome['seconds']:.1f}s)")
+            else:
+                print(f"❌ Push to {outcome['remote']} failed after {attempts}: {outcome['error']}")
+
+        return all(outcome['ok'] for outcome in self.push_results)
+
+    def _push_remote(self, remote: str, branch: str) -> Dict[str, Any]:
+        """Push to one remote, retrying transient failures with exponential backoff."""
+        start = time.perf_counter()
+        outcome: Dict[str, Any] = {'remote': remote, 'ok': False, 'attempts': 0, 'error': None}
+
+        for attempt in range(1, self.push_retries + 2):
+            outcome['attempts'] = attempt
+            result = self._run(
+                ['git', 'push', remote, branch],
+                cwd=self.project_root,
+                capture_output=True,
+                text=True
+            )
+            if result.returncode == 0:
+                outcome['ok'] = True
+                outcome['error'] = None
+                break
+
+            outcome['error'] = self._push_error_line(result.stderr)
+            if attempt > self.push_retries or not self._is_transient_push_error(result.stderr):
+                break
+            time.sleep(self.retry_backoff * 2 ** (attempt - 1))
+
+        outcome['seconds'] = round(time.perf_counter() - start, 4)
+        return outcome
+
+    def _push_error_line(self, stderr: str) -> str:
+        """Pick the most informative line of git push stderr."""
+        lines = [line.strip() for line in (stderr or '').splitlines() if line.strip()]
+        for line in lines:
+            if line.startswith(('fatal:', 'error:', '!')):
+                return line
+        return lines[-1] if lines else 'unknown error'
+
+    def _is_transient_push_error(self, stderr: str) -> bool:
+        """Check whether a failed push is worth retrying (network, not rejection/auth)."""
+        stderr = (stderr or '').lower()
+        return any(fragment in stderr for fragment in TRANSIENT_PUSH_ERRORS)
+
     def print_summary(self):
         """Print summary of changes."""
         print("\n" + "="*80)
@@ -309,10 +587,30 @@ class ArticlePublisher:
                 languages = ', '.join(change['languages'])
                 print(f"  - {change['file']} [{languages}]")
 
-        commit_msg = self.generate_commit_message()
-        print(f"\n📝 Generated commit message:\n")
-        for line in commit_msg.split('\n'):
-            print(f"    {line}")
+        translations = [status for status in self.translation_report()
+                        if status['missing'] or status['outdated']]
+        if translations:
+            print(f"\n🌐 Translation sets needing attention ({len(translations)}):")
+            for status in translations:
+                notes = []
+                if status['missing']:
+                    notes.append(f"missing {', '.join(status['missing'])}")
+                if status['outdated']:
+                    notes.append(f"outdated {', '.join(status['outdated'])}")
+                print(f"  - {status['slug']} [{', '.join(status['present'])}]: {'; '.join(notes)}")
+
+        if self.group_by:
+            groups = self.group_changes(self.group_by)
+            print(f"\n📝 Generated commit messages ({len(groups)} commits, grouped by {self.group_by}):")
+            for key, changes in groups.items():
+                print()
+                for line in self.generate_commit_message(changes, scope=key).split('\n'):
+                    print(f"    {line}")
+        else:
+            commit_msg = self.generate_commit_message()
+            print(f"\n📝 Generated commit message:\n")
+            for line in commit_msg.split('\n'):
+                print(f"    {line}")
 
         print(f"\n📦 Actions:")
         if self.changes:
@@ -320,7 +618,7 @@ class ArticlePublisher:
                 print("  ✅ Validate MDX")
                 print("  ✅ Run build check")
                 print("  ✅ Create semantic commit")
-                print("  ✅ Push to remote")
+                print(f"  ✅ Push to {', '.join(self.remotes)}")
             else:
                 print("  ✅ Validate MDX")
                 print("  ✅ Run build check")
@@ -331,50 +629,97 @@ class ArticlePublisher:
 
         print("="*80)
 
-
-def main():
-    parser = argparse.ArgumentParser(description='Publish article with semantic commit and automated push')
-    parser.add_argument('path', help='Path to MDX file or directory to publish')
-    parser.add_argument('--push', action='store_true', help='Push changes to remote after commit')
-    parser.add_argument('--type', choices=['docs', 'feat', 'fix', 'chore'], default='docs',
-                       help='Commit type for semantic commits (default: docs)')
-    parser.add_argument('--skip-build', action='store_true', help='Skip build validation')
-    parser.add_argument('--skip-mdx', action='store_true', help='Skip MDX validation')
-
-    args = parser.parse_args()
-
-    path = Path(args.path)
-    if not path.exists():
-        print(f"❌ Path does not exist: {path}")
-        sys.exit(1)
-
-    # Initialize publisher
-    publisher = ArticlePublisher(push=args.push, commit_type=args.type)
-    publisher.project_root = publisher.find_project_root(path)
-
-    print(f"📁 Project root: {publisher.project_root}")
-
-    # Detect changes
-    publisher.detect_changes(path)
+    def print_timings(self):
+        """Print per-stage wall time and subprocess breakdown."""
+        print(f"\n⏱️  Timings:")
+        print(f"  {'Stage':<12} {'Seconds':>9}")
+        for name, seconds in self.timings.items():
+            print(f"  {name:<12} {seconds:>9.3f}")
+        print(f"  {'total':<12} {time.perf_counter() - self.started_at:>9.3f}")
+
+        if self.subprocesses:
+            print(f"\n  {'Command':<28} {'Seconds':>9} {'Exit':>5} {'Output':>10}")
+            for record in self.subprocesses:
+                returncode = '-' if record['returncode'] is None else record['returncode']
+                print(f"  {record['cmd']:<28} {record['seconds']:>9.3f} {returncode:>5} "
+                      f"{record['output_bytes']:>9}B")
+
+        print(f"\n  Files: {len(self.changes)}  Build output: {self.build_output_bytes} bytes")
+
+    def build_report(self, exit_code: int) -> Dict[str, Any]:
+        """Build the JSON run record for this publish."""
+        languages: Dict[str, int] = {}
+        for change in self.changes:
+            for lang in change['languages']:
+                languages[lang] = languages.get(lang, 0) + 1
+
+        return {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'project_root': str(self.project_root),
+            'commit_type': self.commit_type,
+            'push': self.push,
+            'group_by': self.group_by,
+            'exit_code': exit_code,
+            'files': len(self.changes),
+            'languages': languages,
+            'stages': {name: round(seconds, 4) for name, seconds in self.timings.items()},
+            'total_seconds': round(time.perf_counter() - self.started_at, 4),
+            'subprocesses': self.subprocesses,
+            'build_output_bytes': self.build_output_bytes,
+            'push_results': self.push_results,
+            'translations': self.translation_report(),
+        }
+
+    def write_report(self, report_path: Path, exit_code: int):
+        """Append one JSON line describing this run."""
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(self.build_report(exit_code), ensure_ascii=False) + '\n')
+        print(f"📊 Run report appended to: {report_path}")
+
+
+def publish(publisher: ArticlePublisher, args: argparse.Namespace, paths: List[Path]) -> int:
+    """Run the publish pipeline. Returns the process exit code."""
+    # Batch mode: several paths or the whole queue → grouped commits, one push
+    if args.flush_queue:
+        paths = [publisher.project_root / p for p in publisher.load_queue()] + paths
+    if args.flush_queue or len(paths) > 1:
+        publisher.group_by = args.group_by
+
+    # Index locale sibling sets once, then detect changes against it
+    with publisher.stage('index'):
+        publisher.build_locale_index()
+
+    with publisher.stage('detect'):
+        for path in paths:
+            if path.exists():
+                publisher.detect_changes(path)
 
     if not publisher.changes:
         print("⚠️  No MDX changes detected")
         publisher.print_summary()
-        sys.exit(0)
+        return 0
 
     # Validate build
     if not args.skip_build:
-        if not publisher.validate_build():
+        with publisher.stage('build'):
+            build_ok = publisher.validate_build()
+        if not build_ok:
             print("\n❌ Build validation failed. Fix errors before publishing.")
-            sys.exit(1)
+            return 1
     else:
         print("\n⏭️  Skipping build validation")
 
     # Validate MDX
     if not args.skip_mdx:
-        if not publisher.validate_mdx(path):
+        with publisher.stage('mdx'):
+            if publisher.group_by or publisher.locale_index.entries:
+                valid = publisher.validate_mdx_batch()
+            else:
+                valid = publisher.validate_mdx(paths[0])
+        if not valid:
             print("\n❌ MDX validation failed. Fix errors before publishing.")
-            sys.exit(1)
+            return 1
     else:
         print("\n⏭️  Skipping MDX validation")
 
@@ -388,22 +733,94 @@ def main():
         response = input("Proceed with commit and push? [y/N]: ").strip().lower()
         if response not in ['y', 'yes']:
             print("❌ Aborted")
-            sys.exit(0)
+            return 0
 
     # Stage and commit
-    if publisher.stage_and_commit(commit_msg):
-        # Push if requested
-        if args.push:
-            if publisher.push_changes():
-                print("\n✅ Publish complete!")
-            else:
-                print("\n❌ Commit succeeded but push failed")
-                sys.exit(1)
+    with publisher.stage('commit'):
+        if publisher.group_by:
+            committed = publisher.commit_batches() > 0
         else:
-            print("\n✅ Commit created (dry run - use --push to actually push)")
-    else:
+            committed = publisher.stage_and_commit(commit_msg)
+
+    if not committed:
         print("\n❌ Commit failed")
-        sys.exit(1)
+        return 1
+
+    if args.flush_queue:
+        publisher.clear_queue()
+
+    # Push if requested
+    if args.push:
+        with publisher.stage('push'):
+            pushed = publisher.push_changes()
+        if not pushed:
+            print("\n❌ Commit succeeded but push failed")
+            return 1
+        print("\n✅ Publish complete!")
+    else:
+        print("\n✅ Commit created (dry run - use --push to actually push)")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Publish article with semantic commit and automated push')
+    parser.add_argument('paths', nargs='*', metavar='path',
+                       help='Path(s) to MDX file or directory to publish')
+    parser.add_argument('--push', action='store_true', help='Push changes to remote after commit')
+    parser.add_argument('--type', choices=['docs', 'feat', 'fix', 'chore'], default='docs',
+                       help='Commit type for semantic commits (default: docs)')
+    parser.add_argument('--skip-build', action='store_true', help='Skip build validation')
+    parser.add_argument('--skip-mdx', action='store_true', help='Skip MDX validation')
+    parser.add_argument('--queue', action='store_true',
+                       help=f'Add paths to the publish queue (.git/{QUEUE_FILE}) without publishing')
+    parser.add_argument('--flush-queue', action='store_true',
+                       help='Publish all queued articles as grouped commits with a single push')
+    parser.add_argument('--group-by', choices=['language', 'category', 'translation'], default='language',
+                       help='How to group batch commits; translation = one commit per slug '
+                            'with all its locales (default: language)')
+    parser.add_argument('--report', help='Append a JSON Lines timing record for this run to this file')
+    parser.add_argument('--remote', action='append', dest='remotes',
+                       help='Remote name or URL to push to; repeat for mirrors (default: origin)')
+    parser.add_argument('--push-retries', type=int, default=3,
+                       help='Retries per remote on transient push failures (default: 3)')
+    parser.add_argument('--retry-backoff', type=float, default=1.0,
+                       help='Seconds before the first push retry, doubled for each further retry (default: 1)')
+
+    args = parser.parse_args()
+
+    if not args.paths and not args.flush_queue:
+        parser.error('at least one path is required (or use --flush-queue)')
+
+    paths = [Path(p).resolve() for p in args.paths]
+    for path in paths:
+        if not path.exists():
+            print(f"❌ Path does not exist: {path}")
+            sys.exit(1)
+
+    # Initialize publisher
+    publisher = ArticlePublisher(push=args.push, commit_type=args.type,
+                                 remotes=args.remotes, push_retries=args.push_retries,
+                                 retry_backoff=args.retry_backoff)
+    publisher.project_root = publisher.find_project_root(paths[0] if paths else Path.cwd())
+
+    print(f"📁 Project root: {publisher.project_root}")
+
+    if args.queue:
+        added = publisher.enqueue(paths)
+        total = len(publisher.load_queue())
+        print(f"📥 Queued {added} path(s) ({total} waiting). Publish with --flush-queue")
+        sys.exit(0)
+
+    exit_code = 1
+    try:
+        exit_code = publish(publisher, args, paths)
+    finally:
+        if publisher.timings:
+            publisher.print_timings()
+        if args.report:
+            publisher.write_report(Path(args.report), exit_code)
+
+    sys.exit(exit_code)
 
 
 if __name__ == '__main__':
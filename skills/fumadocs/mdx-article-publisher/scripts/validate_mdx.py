@@ -3,26 +3,33 @@
 MDX file validator for Claude skills documentation.
 
 Usage:
-    python validate_mdx.py <file-or-directory>
+    python validate_mdx.py <file-or-directory> [--index]
 
 Examples:
     python validate_mdx.py content/docs/en/development/article.mdx
     python validate_mdx.py content/docs/en/development/
-    python validate_mdx.py content/docs/en/
+    python validate_mdx.py content/docs/en/ --index
 """
 
 import re
 import sys
 import argparse
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import subprocess
 
+from content_index import DEFAULT_DOCS_DIR, ContentIndex
+
+
+# Fumadocs page URLs: /docs/<slug> or /<lang>/docs/<slug>
+DOCS_LINK_PATTERN = re.compile(r'^/(?:([a-z]{2}(?:-[A-Z]{2})?)/)?docs(?:/(.*?))?/?$')
+
 
 class MDXValidator:
     """Validator for MDX files with Claude skills documentation patterns."""
 
-    def __init__(self):
+    def __init__(self, content_index: Optional[ContentIndex] = None):
+        self.content_index = content_index
         self.errors: List[Dict[str, Any]] = []
         self.warnings: List[Dict[str, Any]] = []
         self.files_checked: int = 0
@@ -51,6 +58,10 @@ class MDXValidator:
             # Check 5: Check for unclosed tags
             self._validate_tag_balance(content, file_path)
 
+            # Check 6: Cross-file checks against the content index
+            if self.content_index:
+                self._validate_references(file_path)
+
             self.files_valid += 1
             return True
 
@@ -189,6 +200,43 @@ class MDXValidator:
                     'message': f'Tag <{tag}> appears {open_count} times but </{tag}> appears {close_count} times (may be intentional in MDX)'
                 })
 
+    def _validate_references(self, file_path: Path):
+        """Check lang against the locale directory, internal links and local images using the content index."""
+        entry = self.content_index.get(file_path.resolve())
+        if entry is None:
+            return
+
+        lang = entry['frontmatter'].get('lang')
+        if lang and lang != entry['lang']:
+            self.warnings.append({
+                'file': str(file_path),
+                'line': 1,
+                'message': f'lang "{lang}" does not match the locale directory "{entry["lang"]}"'
+            })
+
+        for link in self.content_index.links(entry['path']):
+            match = DOCS_LINK_PATTERN.match(link['url'].split('#')[0].split('?')[0])
+            if not match:
+                continue
+            lang = match.group(1) or entry['lang']
+            slug = match.group(2) or 'index'
+            if lang not in self.content_index.siblings(slug) and lang not in self.content_index.siblings(f'{slug}/index'):
+                self.warnings.append({
+                    'file': str(file_path),
+                    'line': link['line'],
+                    'message': f'Link target not found in content/docs/{lang}/: {link["url"]}'
+                })
+
+        public_dir = self.content_index.project_root / 'public'
+        for image in self.content_index.images(entry['path']):
+            url = image['url'].split('?')[0]
+            if url.startswith('/') and not (public_dir / url.lstrip('/')).is_file():
+                self.warnings.append({
+                    'file': str(file_path),
+                    'line': image['line'],
+                    'message': f'Image not found in public/: {image["url"]}'
+                })
+
     def run_build_check(self, dir_path: Path = None) -> bool:
         """Run npm build to validate MDX compilation."""
         print("\n🔧 Running build validation (this may take a while)...")
@@ -294,11 +342,24 @@ class MDXValidator:
         print("="*80)
 
 
+def find_docs_root(path: Path) -> Optional[Path]:
+    """Nearest directory at or above path that contains content/docs."""
+    current = path.resolve()
+    if current.is_file():
+        current = current.parent
+    for candidate in (current, *current.parents):
+        if (candidate / DEFAULT_DOCS_DIR).is_dir():
+            return candidate
+    return None
+
+
 def main():
     parser = argparse.ArgumentParser(description='Validate MDX files for Claude skills documentation')
     parser.add_argument('path', help='Path to MDX file or directory to validate')
     parser.add_argument('--build', action='store_true', help='Run build validation (slower but more thorough)')
     parser.add_argument('--no-build', action='store_true', help='Skip build validation')
+    parser.add_argument('--index', action='store_true',
+                        help='Use the shared content index for file discovery and cross-file checks (links, images, lang)')
 
     args = parser.parse_args()
 
@@ -307,7 +368,16 @@ def main():
         print(f"Error: Path does not exist: {path}")
         sys.exit(1)
 
-    validator = MDXValidator()
+    content_index = None
+    if args.index:
+        project_root = find_docs_root(path)
+        if project_root is None:
+            print(f"⚠️  No {DEFAULT_DOCS_DIR} above {path}; validating without the content index")
+        else:
+            content_index = ContentIndex(project_root)
+            content_index.update()
+
+    validator = MDXValidator(content_index)
 
     # Validate MDX files
     if path.is_file():
@@ -316,8 +386,17 @@ def main():
         else:
             print(f"Skipping non-MDX file: {path}")
     else:
-        # Recursively validate all MDX files in directory
-        mdx_files = list(path.rglob('*.mdx'))
+        # Recursively validate all MDX files in directory (indexed articles when available)
+        mdx_files = None
+        if content_index:
+            try:
+                path.resolve().relative_to(content_index.docs_root.resolve())
+            except ValueError:
+                pass
+            else:
+                mdx_files = [content_index.project_root / f for f in content_index.files(under=path.resolve())]
+        if mdx_files is None:
+            mdx_files = list(path.rglob('*.mdx'))
         if not mdx_files:
             print(f"No MDX files found in: {path}")
             sys.exit(0)
@@ -0,0 +1,96 @@
+"""Push and retry behaviour of publish_article.py against local bare repositories."""
+
+import sys
+import stat
+import shutil
+import tempfile
+import unittest
+import subprocess
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from publish_article import ArticlePublisher
+
+
+def git(*args, cwd):
+    return subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def install_hook(bare: Path, script: str):
+    hook = bare / 'hooks' / 'pre-receive'
+    hook.write_text('#!/bin/sh\n' + script, encoding='utf-8')
+    hook.chmod(hook.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+
+@unittest.skipUnless(shutil.which('git'), 'git is not installed')
+class PushTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.site = self.tmp / 'site'
+        self.site.mkdir()
+        git('init', '-q', '-b', 'main', cwd=self.site)
+        git('config', 'user.email', 'test@example.com', cwd=self.site)
+        git('config', 'user.name', 'Test', cwd=self.site)
+        (self.site / 'article.mdx').write_text('---\ntitle: A\n---\n', encoding='utf-8')
+        git('add', '-A', cwd=self.site)
+        git('commit', '-qm', 'docs: add article', cwd=self.site)
+        self.head = git('rev-parse', 'HEAD', cwd=self.site)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def bare(self, name: str) -> Path:
+        path = self.tmp / f'{name}.git'
+        git('init', '-q', '--bare', str(path), cwd=self.tmp)
+        return path
+
+    def publisher(self, *remotes: Path, retries: int = 2) -> ArticlePublisher:
+        publisher = ArticlePublisher(push=True, remotes=[str(r) for r in remotes],
+                                     push_retries=retries, retry_backoff=0)
+        publisher.project_root = self.site
+        return publisher
+
+    def test_pushes_to_every_remote(self):
+        origin, mirror = self.bare('origin'), self.bare('mirror')
+        publisher = self.publisher(origin, mirror)
+
+        self.assertTrue(publisher.push_changes())
+        for remote in (origin, mirror):
+            self.assertEqual(git('rev-parse', 'main', cwd=remote), self.head)
+        self.assertEqual([r['attempts'] for r in publisher.push_results], [1, 1])
+
+    def test_transient_failure_is_retried(self):
+        origin = self.bare('origin')
+        # Fail the first push with a network-style error, accept the next one
+        install_hook(origin, 'if [ ! -f attempted ]; then touch attempted; '
+                             'echo "error: RPC failed; connection reset by peer" >&2; exit 1; fi\n')
+        publisher = self.publisher(origin)
+
+        self.assertTrue(publisher.push_changes())
+        self.assertEqual(publisher.push_results[0]['attempts'], 2)
+        self.assertEqual(git('rev-parse', 'main', cwd=origin), self.head)
+
+    def test_permanent_failure_is_not_retried(self):
+        origin, mirror = self.bare('origin'), self.bare('mirror')
+        install_hook(origin, 'echo "protected branch: pushes are not allowed" >&2; exit 1\n')
+        publisher = self.publisher(origin, mirror, retries=3)
+
+        self.assertFalse(publisher.push_changes())
+        results = {Path(r['remote']).name: r for r in publisher.push_results}
+        self.assertFalse(results['origin.git']['ok'])
+        self.assertEqual(results['origin.git']['attempts'], 1)
+        self.assertTrue(results['mirror.git']['ok'])
+
+    def test_retries_are_bounded(self):
+        origin = self.bare('origin')
+        install_hook(origin, 'echo "fatal: the remote end hung up unexpectedly" >&2; exit 1\n')
+        publisher = self.publisher(origin, retries=2)
+
+        self.assertFalse(publisher.push_changes())
+        self.assertEqual(publisher.push_results[0]['attempts'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+"""content_index.source_hash must agree with article-translator's translation_memory.source_hash.
+
+Translations are stamped with the translator's hash and compared against the
+publisher's; both skills ship standalone, so each keeps its own copy.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+SKILLS_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(SKILLS_DIR / "mdx-article-publisher" / "scripts"))
+sys.path.insert(0, str(SKILLS_DIR / "article-translator" / "scripts"))
+
+import content_index
+import translation_memory
+
+
+SAMPLES = [
+    '---\ntitle: "Building Agents"\ndescription: How to build agents\nlang: en\n---\n\n## Intro\n\nText.\n',
+    "---\ntitle: 'Single quoted'   # comment\ndescription: \"\"\n---\nBody\n",
+    '---\ntitle: "  Leading spaces"\ndescription: "2024"\n---\n\n  indented line  \n\n\n',
+    '---\ntitle: 构建智能体\nauthor: Jane\n---\n\n<SourceAttribution\n  source={{ url: "https://x.y" }}\n/>\n',
+    '---\ntitle: Unclosed\n\nNo closing fence.\n',
+    'No frontmatter at all.\n\n```js\nconst x = 1\n```\n',
+    '',
+    '---\n---\nEmpty frontmatter.',
+]
+
+
+class SourceHashTest(unittest.TestCase):
+
+    def test_implementations_agree(self):
+        for text in SAMPLES:
+            with self.subTest(text=text):
+                self.assertEqual(content_index.source_hash(text), translation_memory.source_hash(text))
+
+    def test_frontmatter_formatting_does_not_change_the_hash(self):
+        a = '---\ntitle: "Post"\nlang: en\n---\n\nBody text.\n'
+        b = "---\ntitle: Post\nsidebar: 3\n---\nBody text.\n\n"
+        self.assertEqual(content_index.source_hash(a), content_index.source_hash(b))
+
+
+if __name__ == "__main__":
+    unittest.main()
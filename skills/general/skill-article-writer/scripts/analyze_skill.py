@@ -4,21 +4,151 @@ Analyze a skill structure and generate metadata for article creation.
 
 Usage:
     python analyze_skill.py <skill-path> [--output <output-file>]
+    python analyze_skill.py --marketplace <marketplace.json> [--workers N] [--output <file.jsonl>]
+    python analyze_skill.py --root <skills-dir> [--workers N] [--output <file.jsonl>]
+    python analyze_skill.py <skill-path> --cache <cache.json>
+    python analyze_skill.py <skill-path> --dedup-index <near-duplicates.json>
 
 Examples:
     python analyze_skill.py /path/to/skill-creator
     python analyze_skill.py /path/to/skill-creator --output skill-metadata.json
+    python analyze_skill.py --marketplace .claude-plugin/marketplace.json > skills.jsonl
+    python analyze_skill.py --root skills/ --workers 8 --output skills.jsonl
+    python analyze_skill.py --root skills/ --cache .skill-analysis-cache.json --output skills.jsonl
 """
 
+import os
+import re
+import ast
 import json
 import sys
+import hashlib
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from fnmatch import fnmatch
 from pathlib import Path
-from typing import Dict, Any, List
-
-
-def analyze_skill(skill_path: Path) -> Dict[str, Any]:
-    """Analyze a skill directory and extract comprehensive metadata."""
+from typing import Dict, Any, List, TextIO, Optional, Tuple, Iterable, Iterator
+
+from atomic_io import write_atomic
+from near_duplicates import NearDuplicateIndex
+
+
+# Bump whenever the metadata format or analysis logic changes to invalidate caches
+CACHE_VERSION = 3
+
+
+class SkillSnapshot:
+    """One os.scandir traversal of a skill directory.
+
+    Records every entry's type, size and depth so the analysis functions
+    never touch the filesystem again.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        # Relative POSIX path -> {"is_dir", "size", "mtime_ns", "depth"}; depth of a top-level entry is 0
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        # Relative directory path ("" for the root) -> names of its direct children
+        self.children: Dict[str, List[str]] = {}
+        if root.is_dir():
+            self._scan()
+
+    def _scan(self):
+        stack = [("", self.root)]
+        while stack:
+            rel_dir, abs_dir = stack.pop()
+            names = []
+            try:
+                with os.scandir(abs_dir) as it:
+                    for entry in it:
+                        rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                        is_dir = entry.is_dir()
+                        try:
+                            stat = None if is_dir else entry.stat()
+                        except OSError:
+                            stat = entry.stat(follow_symlinks=False)  # dangling symlink
+                        self.entries[rel_path] = {
+                            "is_dir": is_dir,
+                            "size": stat.st_size if stat else 0,
+                            "mtime_ns": stat.st_mtime_ns if stat else 0,
+                            "depth": rel_path.count("/")
+                        }
+                        names.append(entry.name)
+                        # Like rglob, list symlinked directories but don't descend into them (cycles, vendor trees)
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append((rel_path, entry.path))
+            except OSError:
+                pass
+            self.children[rel_dir] = names
+
+    def exists(self, rel_path: str) -> bool:
+        return rel_path in self.entries
+
+    def is_dir(self, rel_path: str) -> bool:
+        return self.entries.get(rel_path, {}).get("is_dir", False)
+
+    def list_dir(self, rel_path: str) -> List[str]:
+        return self.children.get(rel_path, [])
+
+    def files(self) -> List[str]:
+        return sorted(path for path, entry in self.entries.items() if not entry["is_dir"])
+
+    def fingerprint(self) -> str:
+        """Cheap tree fingerprint from paths, sizes and mtimes (no file reads)."""
+        digest = hashlib.sha256()
+        for path in sorted(self.entries):
+            entry = self.entries[path]
+            digest.update(f"{path}\0{entry['size']}\0{entry['mtime_ns']}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+
+class MetadataCache:
+    """Persistent cache of skill metadata, one entry per resolved skill path.
+
+    Each entry stores the stat fingerprint of the tree, a content fingerprint
+    and per-file [size, mtime_ns, sha256] records used as the fallback when
+    only mtimes changed.
+    """
+
+    def __init__(self, cache_path: Path):
+        self.cache_path = cache_path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.dirty = False
+        if cache_path.exists():
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("version") == CACHE_VERSION:
+                    self.entries = data.get("skills", {})
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def get(self, skill_path: Path) -> Optional[Dict[str, Any]]:
+        return self.entries.get(str(skill_path.resolve()))
+
+    def put(self, skill_path: Path, entry: Optional[Dict[str, Any]]):
+        key = str(skill_path.resolve())
+        if entry is not None and self.entries.get(key) != entry:
+            self.entries[key] = entry
+            self.dirty = True
+
+    def save(self):
+        """Atomically write the cache if anything changed."""
+        if not self.dirty:
+            return
+        write_atomic(self.cache_path, json.dumps({"version": CACHE_VERSION, "skills": self.entries}, ensure_ascii=False))
+        self.dirty = False
+
+
+def analyze_skill(skill_path: Path, snapshot: Optional[SkillSnapshot] = None,
+                  skill_md: Optional[Dict[str, Any]] = None,
+                  script_cache: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """Analyze a skill directory and extract comprehensive metadata.
+
+    An existing snapshot, an already-computed SKILL.md analysis and previous
+    script introspections (keyed by sha256) can be passed in by the
+    incremental cache to skip re-walking and re-parsing.
+    """
 
     metadata = {
         "skill_path": str(skill_path),
@@ -27,6 +157,7 @@ def analyze_skill(skill_path: Path) -> Dict[str, Any]:
         "structure": {},
         "skill_md": {},
         "scripts": [],
+        "script_details": [],
         "references": [],
         "assets": [],
         "analysis": {
@@ -40,20 +171,25 @@ def analyze_skill(skill_path: Path) -> Dict[str, Any]:
     if not skill_path.exists():
         return metadata
 
+    # Walk the skill tree once; everything below reads from the snapshot
+    if snapshot is None:
+        snapshot = SkillSnapshot(skill_path)
+
     # Analyze directory structure
-    structure_analysis = analyze_structure(skill_path)
+    structure_analysis = analyze_structure(snapshot)
     metadata["structure"] = structure_analysis
 
     # Analyze SKILL.md
-    skill_md_path = skill_path / "SKILL.md"
-    if skill_md_path.exists():
-        skill_md_analysis = analyze_skill_md(skill_md_path)
+    if snapshot.exists("SKILL.md"):
+        skill_md_analysis = skill_md if skill_md is not None else analyze_skill_md(skill_path / "SKILL.md")
         metadata["skill_md"] = skill_md_analysis
 
     # Analyze bundled resources
-    metadata["scripts"] = list_resource_files(skill_path / "scripts", ["*.py", "*.sh", "*.js"])
-    metadata["references"] = list_resource_files(skill_path / "references", ["*.md", "*.txt", "*.json"])
-    metadata["assets"] = list_resource_files(skill_path / "assets", ["*"])
+    metadata["scripts"] = list_resource_files(snapshot, "scripts", ["*.py", "*.sh", "*.js"])
+    metadata["script_details"] = introspect_scripts(
+        skill_path / "scripts", [name for name in metadata["scripts"] if name.endswith(".py")], script_cache)
+    metadata["references"] = list_resource_files(snapshot, "references", ["*.md", "*.txt", "*.json"])
+    metadata["assets"] = list_resource_files(snapshot, "assets", ["*"])
 
     # Generate skill-level analysis
     metadata["analysis"] = generate_skill_analysis(metadata)
@@ -61,36 +197,373 @@ def analyze_skill(skill_path: Path) -> Dict[str, Any]:
     return metadata
 
 
-def analyze_structure(skill_path: Path) -> Dict[str, Any]:
+def analyze_skill_cached(skill_path: Path, entry: Optional[Dict[str, Any]]
+                         ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Analyze a skill incrementally against its previous cache entry.
+
+    Returns the metadata and the cache entry to store. Stored metadata is
+    returned as-is when the stat fingerprint matches, or when it differs but
+    every file hashes the same. Otherwise only changed parts are redone: the
+    SKILL.md analysis is reused if its hash is unchanged.
+    """
+
+    if not skill_path.is_dir():
+        return analyze_skill(skill_path), None
+
+    snapshot = SkillSnapshot(skill_path)
+    fingerprint = snapshot.fingerprint()
+
+    if entry and entry["fingerprint"] == fingerprint:
+        return dict(entry["metadata"], skill_path=str(skill_path)), entry
+
+    # Fallback: content hashes, re-reading only files whose size or mtime moved
+    previous_files = entry["files"] if entry else {}
+    files = hash_files(skill_path, snapshot, previous_files)
+    content_fingerprint = hashlib.sha256(
+        json.dumps(sorted((path, record[2]) for path, record in files.items())).encode("utf-8")
+    ).hexdigest()
+
+    if entry and entry["content_fingerprint"] == content_fingerprint:
+        entry = dict(entry, fingerprint=fingerprint, files=files)
+        return dict(entry["metadata"], skill_path=str(skill_path)), entry
+
+    skill_md = None
+    if entry and "SKILL.md" in files and previous_files.get("SKILL.md", [None] * 3)[2] == files["SKILL.md"][2]:
+        skill_md = entry["metadata"].get("skill_md")
+
+    script_cache = {details["sha256"]: details for details in entry["metadata"].get("script_details", [])
+                    if "sha256" in details} if entry else None
+
+    metadata = analyze_skill(skill_path, snapshot=snapshot, skill_md=skill_md, script_cache=script_cache)
+    return metadata, {
+        "fingerprint": fingerprint,
+        "content_fingerprint": content_fingerprint,
+        "files": files,
+        "metadata": metadata
+    }
+
+
+def hash_files(skill_path: Path, snapshot: SkillSnapshot,
+               previous: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+    """Map each file to [size, mtime_ns, sha256], reusing hashes of unchanged files."""
+
+    files = {}
+    for rel_path in snapshot.files():
+        entry = snapshot.entries[rel_path]
+        record = previous.get(rel_path)
+        if record and record[0] == entry["size"] and record[1] == entry["mtime_ns"]:
+            files[rel_path] = record
+            continue
+
+        digest = hashlib.sha256()
+        try:
+            with open(skill_path / rel_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 16), b""):
+                    digest.update(chunk)
+        except OSError:
+            continue
+        files[rel_path] = [entry["size"], entry["mtime_ns"], digest.hexdigest()]
+    return files
+
+
+def introspect_scripts(scripts_dir: Path, names: List[str],
+                       script_cache: Optional[Dict[str, Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+    """Introspect Python scripts concurrently, reusing cached results for unchanged hashes."""
+
+    if not names:
+        return []
+
+    def load(name: str) -> Dict[str, Any]:
+        try:
+            with open(scripts_dir / name, 'rb') as f:
+                source = f.read()
+        except OSError as e:
+            return {"file": name, "error": str(e)}
+
+        sha256 = hashlib.sha256(source).hexdigest()
+        if script_cache and sha256 in script_cache:
+            return dict(script_cache[sha256], file=name)
+        return dict(introspect_script(source), file=name, sha256=sha256)
+
+    with ThreadPoolExecutor(max_workers=min(8, len(names))) as executor:
+        return list(executor.map(load, names))
+
+
+def introspect_script(source: bytes) -> Dict[str, Any]:
+    """Describe a Python script from its AST without running it.
+
+    Extracts the module docstring, argparse parser description and
+    arguments, top-level functions and classes, and whether it has a
+    __main__ entry point.
+    """
+
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError) as e:
+        return {"error": f"Could not parse: {e}"}
+
+    details: Dict[str, Any] = {
+        "docstring": ast.get_docstring(tree) or "",
+        "description": "",
+        "arguments": [],
+        "functions": [],
+        "classes": [],
+        "entry_point": False
+    }
+
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            details["functions"].append({
+                "name": node.name,
+                "args": [arg.arg for arg in node.args.args],
+                "summary": _docstring_summary(node)
+            })
+        elif isinstance(node, ast.ClassDef):
+            details["classes"].append({
+                "name": node.name,
+                "summary": _docstring_summary(node),
+                "methods": [item.name for item in node.body
+                            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+                            and not item.name.startswith('_')]
+            })
+        elif isinstance(node, ast.If) and _is_main_guard(node.test):
+            details["entry_point"] = True
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func_name = node.func.attr if isinstance(node.func, ast.Attribute) else getattr(node.func, "id", "")
+        keywords = {kw.arg: kw.value for kw in node.keywords if kw.arg}
+
+        if func_name == "ArgumentParser" and "description" in keywords:
+            details["description"] = _node_value(keywords["description"]) or ""
+        elif func_name == "add_argument":
+            flags = [_node_value(arg) for arg in node.args]
+            argument = {"flags": [flag for flag in flags if isinstance(flag, str)]}
+            for key in ("help", "action", "choices", "default", "nargs", "required", "dest"):
+                if key in keywords:
+                    argument[key] = _node_value(keywords[key])
+            if "type" in keywords:
+                argument["type"] = getattr(keywords["type"], "id", None)
+            details["arguments"].append(argument)
+
+    return details
+
+
+def _docstring_summary(node: ast.AST) -> str:
+    """First line of a function or class docstring."""
+    docstring = ast.get_docstring(node) or ""
+    return docstring.strip().split('\n')[0]
+
+
+def _is_main_guard(test: ast.expr) -> bool:
+    """Match `if __name__ == "__main__":`."""
+    return (isinstance(test, ast.Compare) and isinstance(test.left, ast.Name)
+            and test.left.id == "__name__" and len(test.comparators) == 1
+            and _node_value(test.comparators[0]) == "__main__")
+
+
+def _node_value(node: ast.AST) -> Any:
+    """Literal value of an AST node, or its source text when it isn't a literal."""
+    if isinstance(node, ast.JoinedStr):
+        # f-string: keep the literal parts, show interpolations as {expr}
+        return "".join(_node_value(part) if not isinstance(part, ast.FormattedValue)
+                       else "{" + str(_node_value(part.value)) + "}" for part in node.values)
+    if isinstance(node, ast.Name):
+        return node.id
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError):
+        unparse = getattr(ast, "unparse", None)  # Python 3.9+
+        return unparse(node) if unparse else None
+
+
+def analyze_structure(snapshot: SkillSnapshot) -> Dict[str, Any]:
     """Analyze the directory structure of a skill."""
 
     return {
-        "has_skill_md": (skill_path / "SKILL.md").exists(),
-        "has_scripts": (skill_path / "scripts").exists(),
-        "has_references": (skill_path / "references").exists(),
-        "has_assets": (skill_path / "assets").exists(),
-        "total_files": count_files(skill_path),
-        "depth": get_directory_depth(skill_path)
+        "has_skill_md": snapshot.exists("SKILL.md"),
+        "has_scripts": snapshot.exists("scripts"),
+        "has_references": snapshot.exists("references"),
+        "has_assets": snapshot.exists("assets"),
+        "total_files": count_files(snapshot),
+        "depth": get_directory_depth(snapshot)
+    }
+
+
+# Frontmatter "key: value" at column 0
+FRONTMATTER_FIELD = re.compile(r'^([A-Za-z0-9_-]+):\s*(.*)$')
+# YAML block scalar indicators (description: >)
+BLOCK_SCALARS = {'>', '>-', '>+', '|', '|-', '|+'}
+HEADING = re.compile(r'^(#{1,6})\s+(.*)$')
+COMMAND_LANGUAGES = {'bash', 'sh', 'shell'}
+
+# Text feature -> pattern searched in prose (not code) for extract_key_features
+TEXT_FEATURES = {
+    "workflow": re.compile(r'workflow'),
+    "script": re.compile(r'script'),
+    "api": re.compile(r'\bapis?\b'),
+    "generation": re.compile(r'create|generate|build'),
+}
+
+
+def parse_skill_md(lines: Iterable[str], header_only: bool = False) -> Iterator[Tuple[str, Any]]:
+    """Stream SKILL.md in one pass, yielding (event, value) tuples.
+
+    Events: ("frontmatter", (key, value)), ("frontmatter_end", None),
+    ("heading", (level, text)), ("code", (language, body)), ("text", line)
+    and finally ("end", {"size", "line_count"}) once every line is read.
+    Headings and text inside fenced code blocks are not reported as such.
+
+    With header_only=True parsing stops as soon as the frontmatter and title
+    are known, without reading the rest of the file.
+    """
+
+    state = "start"
+    size = 0
+    newlines = 0
+    has_name = False
+    block_key = None
+    block_style = None
+    block_lines: List[str] = []
+    fence_lang = None
+    fence_lines: List[str] = []
+
+    def flush_block():
+        joiner = '\n' if block_style.startswith('|') else ' '
+        return ("frontmatter", (block_key, joiner.join(line for line in block_lines if line).strip()))
+
+    for raw in lines:
+        size += len(raw)
+        if raw.endswith('\n'):
+            newlines += 1
+        line = raw.rstrip('\n')
+
+        if state == "start":
+            if line == '---':
+                state = "frontmatter"
+                continue
+            state = "body"
+
+        if state == "frontmatter":
+            if block_key is not None:
+                if line.startswith((' ', '\t')) or not line.strip():
+                    block_lines.append(line.strip())
+                    continue
+                yield flush_block()
+                block_key = None
+
+            if line.startswith('---'):
+                yield ("frontmatter_end", None)
+                state = "body"
+                if header_only and has_name:
+                    return
+                continue
+
+            match = FRONTMATTER_FIELD.match(line)
+            if match:
+                key, value = match.group(1), match.group(2).strip()
+                if value in BLOCK_SCALARS:
+                    block_key, block_style, block_lines = key, value, []
+                else:
+                    has_name = has_name or key == 'name'
+                    yield ("frontmatter", (key, value.strip('"\'')))
+            continue
+
+        stripped = line.strip()
+        if fence_lang is not None:
+            if stripped.startswith('```'):
+                yield ("code", (fence_lang, '\n'.join(fence_lines)))
+                fence_lang = None
+            else:
+                fence_lines.append(line)
+            continue
+
+        if stripped.startswith('```'):
+            info = stripped[3:].split()
+            fence_lang = info[0] if info else ''
+            fence_lines = []
+            continue
+
+        match = HEADING.match(stripped)
+        if match:
+            yield ("heading", (len(match.group(1)), match.group(2).strip()))
+            if header_only and len(match.group(1)) == 1:
+                return
+            continue
+
+        yield ("text", line)
+
+    yield ("end", {"size": size, "line_count": newlines + 1})
+
+
+def summarize_skill_md(events: Iterable[Tuple[str, Any]]) -> Dict[str, Any]:
+    """Fold parser events into the SKILL.md analysis dictionary."""
+
+    frontmatter: Dict[str, str] = {}
+    has_frontmatter = False
+    headings: List[Dict[str, Any]] = []
+    code_blocks: List[Dict[str, Any]] = []
+    commands: List[str] = []
+    text_features = {name: False for name in TEXT_FEATURES}
+    stats = None
+
+    for event, value in events:
+        if event == "frontmatter":
+            has_frontmatter = True
+            frontmatter.setdefault(value[0], value[1])
+        elif event == "frontmatter_end":
+            has_frontmatter = True
+        elif event == "heading":
+            headings.append({"level": value[0], "text": value[1]})
+        elif event == "code":
+            language, body = value
+            code_blocks.append({"language": language, "line_count": body.count('\n') + 1})
+            if language in COMMAND_LANGUAGES and body.strip():
+                commands.append(body.strip())
+        elif event == "text":
+            lowered = value.lower()
+            for name, pattern in TEXT_FEATURES.items():
+                if not text_features[name] and pattern.search(lowered):
+                    text_features[name] = True
+        elif event == "end":
+            stats = value
+
+    title = frontmatter.get("name") or next(
+        (h["text"] for h in headings if h["level"] == 1), "Unknown Skill")
+    description = frontmatter.get("description") or "No description available"
+    if len(description) >= 200:
+        description = description[:200] + "..."
+
+    summary = {
+        "exists": True,
+        "has_yaml_frontmatter": has_frontmatter,
+        "frontmatter": frontmatter,
+        "title": title,
+        "description": description,
     }
+    if stats is None:
+        # header_only parse: body was not read
+        return summary
+
+    summary.update({
+        "size": stats["size"],
+        "line_count": stats["line_count"],
+        "sections": [h["text"] for h in headings if h["level"] == 2 and not h["text"].startswith('---')],
+        "headings": headings,
+        "code_blocks": code_blocks,
+        "commands": commands,
+        "text_features": text_features,
+    })
+    return summary
 
 
-def analyze_skill_md(skill_md_path: Path) -> Dict[str, Any]:
-    """Analyze the SKILL.md file."""
+def analyze_skill_md(skill_md_path: Path, header_only: bool = False) -> Dict[str, Any]:
+    """Analyze the SKILL.md file in a single streaming pass."""
 
     try:
         with open(skill_md_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        return {
-            "exists": True,
-            "size": len(content),
-            "line_count": len(content.split('\n')),
-            "has_yaml_frontmatter": content.startswith('---\n'),
-            "sections": extract_sections(content),
-            "title": extract_title(content),
-            "description": extract_description(content),
-            "commands": extract_commands(content)
-        }
+            return summarize_skill_md(parse_skill_md(f, header_only=header_only))
     except Exception as e:
         return {
             "exists": True,
@@ -103,108 +576,51 @@ def analyze_skill_md(skill_md_path: Path) -> Dict[str, Any]:
 def extract_sections(content: str) -> List[str]:
     """Extract major section headings from SKILL.md."""
 
-    sections = []
-    for line in content.split('\n'):
-        line = line.strip()
-        if line.startswith('## '):
-            section = line[3:].strip()
-            if section and not section.startswith('---'):
-                sections.append(section)
-    return sections
+    return summarize_skill_md(parse_skill_md(content.splitlines(True)))["sections"]
 
 
 def extract_title(content: str) -> str:
     """Extract the skill name from frontmatter or first heading."""
 
-    if content.startswith('---'):
-        parts = content.split('\n---', 1)
-        if len(parts) == 2:
-            frontmatter = parts[0]
-            lines = frontmatter.split('\n')
-            for line in lines:
-                if line.startswith('name: '):
-                    return line[6:].strip().strip('"\'')
-
-    # Fallback: find first H1
-    for line in content.split('\n'):
-        if line.startswith('# '):
-            return line[2:].strip()
-
-    return "Unknown Skill"
+    return summarize_skill_md(parse_skill_md(content.splitlines(True), header_only=True))["title"]
 
 
 def extract_description(content: str) -> str:
     """Extract skill description from frontmatter."""
 
-    if content.startswith('---'):
-        parts = content.split('\n---', 1)
-        if len(parts) == 2:
-            frontmatter = parts[0]
-            lines = frontmatter.split('\n')
-            for line in lines:
-                if line.startswith('description: '):
-                    desc = line[13:].strip().strip('"\'')
-                    return desc if len(desc) < 200 else desc[:200] + "..."
-
-    return "No description available"
+    return summarize_skill_md(parse_skill_md(content.splitlines(True), header_only=True))["description"]
 
 
 def extract_commands(content: str) -> List[str]:
     """Extract command-line examples from the content."""
 
-    commands = []
-    in_code_block = False
-    current_block = []
+    return summarize_skill_md(parse_skill_md(content.splitlines(True)))["commands"]
 
-    for line in content.split('\n'):
-        if line.startswith('```bash'):
-            in_code_block = True
-            current_block = []
-        elif line.startswith('```') and in_code_block:
-            in_code_block = False
-            block_content = '\n'.join(current_block).strip()
-            if block_content:
-                commands.append(block_content)
-        elif in_code_block:
-            current_block.append(line)
 
-    return commands
-
-
-def list_resource_files(resource_path: Path, patterns: List[str]) -> List[str]:
+def list_resource_files(snapshot: SkillSnapshot, resource_dir: str, patterns: List[str]) -> List[str]:
     """List files in a resource directory."""
 
-    if not resource_path.exists() or not resource_path.is_dir():
+    if not snapshot.is_dir(resource_dir):
         return []
 
+    names = snapshot.list_dir(resource_dir)
     files = []
     for pattern in patterns:
-        files.extend([str(p.relative_to(resource_path)) for p in resource_path.glob(pattern)])
+        files.extend([name for name in names if fnmatch(name, pattern)])
 
     return sorted(files)
 
 
-def count_files(directory: Path) -> int:
-    """Count total files in directory."""
+def count_files(snapshot: SkillSnapshot) -> int:
+    """Count total entries (files and directories) in the skill tree."""
 
-    try:
-        return len(list(directory.rglob('*'))) if directory.exists() else 0
-    except:
-        return 0
+    return len(snapshot.entries)
 
 
-def get_directory_depth(directory: Path) -> int:
+def get_directory_depth(snapshot: SkillSnapshot) -> int:
     """Get maximum directory depth."""
 
-    if not directory.exists():
-        return 0
-
-    max_depth = 0
-    for path in directory.rglob('*'):
-        if path.is_file():
-            depth = len(path.relative_to(directory).parts) - 1
-            max_depth = max(max_depth, depth)
-    return max_depth
+    return max((entry["depth"] for entry in snapshot.entries.values() if not entry["is_dir"]), default=0)
 
 
 def generate_skill_analysis(metadata: Dict[str, Any]) -> Dict[str, Any]:
@@ -258,14 +674,14 @@ def extract_key_features(metadata: Dict[str, Any]) -> List[str]:
     # Check for common patterns
     skill_md = metadata.get("skill_md", {})
     if skill_md:
-        content = skill_md.get("content", "")
-        if "workflow" in content.lower():
+        text_features = skill_md.get("text_features", {})
+        if text_features.get("workflow"):
             features.append("workflow-automation")
-        if "script" in content.lower():
+        if text_features.get("script"):
             features.append("scripting")
-        if "API" in content.lower():
+        if text_features.get("api"):
             features.append("api-integration")
-        if any(word in content.lower() for word in ["create", "generate", "build"]):
+        if text_features.get("generation"):
             features.append("content-generation")
 
     return features
@@ -295,20 +711,150 @@ def generate_recommendations(metadata: Dict[str, Any]) -> List[str]:
     return recs
 
 
+def discover_marketplace_skills(manifest_path: Path) -> List[Path]:
+    """List skill directories declared in a .claude-plugin/marketplace.json manifest."""
+
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    # Plugin sources are relative to the marketplace root (the parent of .claude-plugin/)
+    marketplace_root = manifest_path.resolve().parent
+    if marketplace_root.name == ".claude-plugin":
+        marketplace_root = marketplace_root.parent
+
+    skill_paths = []
+    for plugin in manifest.get("plugins", []):
+        source = marketplace_root / plugin.get("source", "./")
+        for skill in plugin.get("skills", []):
+            skill_path = (source / skill).resolve()
+            if skill_path not in skill_paths:
+                skill_paths.append(skill_path)
+    return skill_paths
+
+
+def discover_skills(root: Path) -> List[Path]:
+    """Find every directory below root that contains a SKILL.md."""
+
+    skill_paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.') and d != "node_modules")
+        if "SKILL.md" in filenames:
+            skill_paths.append(Path(dirpath))
+    return skill_paths
+
+
+def _analyze_skill_safe(skill_path: Path, entry: Optional[Dict[str, Any]] = None,
+                        use_cache: bool = False) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Worker entry point: never raise, so one broken skill doesn't stop the batch."""
+
+    try:
+        if use_cache:
+            return analyze_skill_cached(skill_path, entry)
+        return analyze_skill(skill_path), None
+    except Exception as e:
+        return {"skill_path": str(skill_path), "name": skill_path.name, "error": str(e)}, None
+
+
+def find_near_duplicates(skill_path: Path, dedup_index: NearDuplicateIndex) -> List[Dict[str, Any]]:
+    """Near-duplicate SKILL.md files / articles already in the index."""
+
+    skill_md_path = skill_path / "SKILL.md"
+    if not skill_md_path.is_file():
+        return []
+    return dedup_index.query(skill_md_path)
+
+
+def analyze_skills_batch(skill_paths: List[Path], out: TextIO, workers: Optional[int] = None,
+                         cache: Optional[MetadataCache] = None,
+                         dedup_index: Optional[NearDuplicateIndex] = None) -> int:
+    """Analyze skills in a process pool, writing one JSON line per skill as each finishes."""
+
+    if dedup_index is not None:
+        # Index every skill first so each record lists duplicates across the whole batch
+        dedup_index.add_paths([path / "SKILL.md" for path in skill_paths if (path / "SKILL.md").is_file()])
+        dedup_index.save()
+
+    count = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_analyze_skill_safe, path, cache.get(path) if cache else None, cache is not None): path
+            for path in skill_paths
+        }
+        for future in as_completed(futures):
+            metadata, entry = future.result()
+            if cache is not None:
+                cache.put(futures[future], entry)
+            if dedup_index is not None:
+                # Copy: the cached entry may share this dict, and duplicates depend on the batch
+                metadata = {**metadata, "near_duplicates": find_near_duplicates(futures[future], dedup_index)}
+            out.write(json.dumps(metadata, ensure_ascii=False) + "\n")
+            out.flush()
+            count += 1
+
+    if cache is not None:
+        cache.save()
+    return count
+
+
+def batch_main(args: argparse.Namespace):
+    """Batch mode: analyze many skills in parallel and stream JSON Lines."""
+
+    source = Path(args.marketplace or args.root)
+    if not source.exists():
+        print(f"Error: Path does not exist: {source}", file=sys.stderr)
+        sys.exit(1)
+
+    skill_paths = discover_marketplace_skills(source) if args.marketplace else discover_skills(source)
+    cache = MetadataCache(Path(args.cache)) if args.cache else None
+    dedup_index = NearDuplicateIndex(Path(args.dedup_index)) if args.dedup_index else None
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            count = analyze_skills_batch(skill_paths, f, args.workers, cache, dedup_index)
+        print(f"Metadata for {count} skills saved to: {args.output}", file=sys.stderr)
+    else:
+        analyze_skills_batch(skill_paths, sys.stdout, args.workers, cache, dedup_index)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Analyze a Claude skill structure")
-    parser.add_argument("skill_path", help="Path to the skill directory")
-    parser.add_argument("--output", help="Output JSON file (default: stdout)")
+    parser.add_argument("skill_path", nargs="?", help="Path to the skill directory")
+    parser.add_argument("--output", help="Output JSON file (default: stdout); JSON Lines in batch mode")
+    parser.add_argument("--marketplace", help="Analyze every skill listed in a marketplace.json manifest")
+    parser.add_argument("--root", help="Analyze every skill (directory with SKILL.md) below this directory")
+    parser.add_argument("--workers", type=int, help="Worker processes for batch mode (default: CPU count)")
+    parser.add_argument("--cache", help="Persistent metadata cache file; unchanged skills are returned from it")
+    parser.add_argument("--dedup-index", help="Near-duplicate index (see near_duplicates.py); adds near_duplicates")
 
     args = parser.parse_args()
 
+    if args.marketplace or args.root:
+        batch_main(args)
+        return
+
+    if not args.skill_path:
+        parser.error("skill_path is required unless --marketplace or --root is given")
+
     skill_path = Path(args.skill_path)
 
     if not skill_path.exists():
         print(f"Error: Path does not exist: {skill_path}", file=sys.stderr)
         sys.exit(1)
 
-    metadata = analyze_skill(skill_path)
+    if args.cache:
+        cache = MetadataCache(Path(args.cache))
+        metadata, entry = analyze_skill_cached(skill_path, cache.get(skill_path))
+        cache.put(skill_path, entry)
+        cache.save()
+    else:
+        metadata = analyze_skill(skill_path)
+
+    if args.dedup_index:
+        dedup_index = NearDuplicateIndex(Path(args.dedup_index))
+        if (skill_path / "SKILL.md").is_file():
+            dedup_index.add_file(skill_path / "SKILL.md")
+            dedup_index.save()
+        metadata["near_duplicates"] = find_near_duplicates(skill_path, dedup_index)
 
     if args.output:
         output_path = Path(args.output)
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Build article outlines for many skills and languages in one process.
+
+Skills are analyzed in a process pool and their metadata is rendered straight
+into outlines for every requested language, without the intermediate
+metadata JSON files. Outlines are written concurrently, each through an
+atomic rename, to <out-dir>/<lang>/<skill-name>.md.
+
+A build graph in <out-dir>/.outline-build.json records, per outline, the hash
+of the template values rendered from the skill metadata and the template
+version it was rendered with. Metadata that never reaches the outline (such
+as the skill path, which depends on the working directory) does not count. Outlines
+whose inputs are unchanged are not re-rendered or rewritten, so their mtimes
+stay put for downstream builds.
+
+Usage:
+    python build_outlines.py (--marketplace <marketplace.json> | --root <dir> | <skill-path>...)
+                             [--out-dir <dir>] [--languages en,zh,fr] [--dry-run] [--force]
+
+Examples:
+    python build_outlines.py --root skills/ --out-dir outlines
+    python build_outlines.py --marketplace .claude-plugin/marketplace.json --languages en,zh,fr,ja
+    python build_outlines.py skills/general/skill-article-writer --cache .skill-analysis-cache.json
+    python build_outlines.py --root skills/ --dry-run
+"""
+
+import sys
+import json
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from atomic_io import write_atomic
+from analyze_skill import (MetadataCache, _analyze_skill_safe, discover_marketplace_skills,
+                           discover_skills)
+import generate_article_outline
+from generate_article_outline import TEMPLATE_DIR, load_template, outline_values
+
+
+DEFAULT_LANGUAGES = ["en", "zh", "fr"]
+DEFAULT_OUT_DIR = Path("outlines")
+BUILD_GRAPH_FILE = ".outline-build.json"
+BUILD_GRAPH_VERSION = 2
+
+# The section helpers shape the output as much as the template text does
+RENDERER_VERSION = hashlib.sha256(Path(generate_article_outline.__file__).read_bytes()).hexdigest()[:12]
+
+
+def outline_path(out_dir: Path, language: str, skill_name: str) -> Path:
+    return out_dir / language / f"{skill_name}.md"
+
+
+def values_hash(values: Dict[str, str]) -> str:
+    """Stable hash of the template values an outline is rendered from."""
+
+    canonical = json.dumps(values, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class BuildGraph:
+    """Outline path → {input, template} hashes from the last successful render."""
+
+    def __init__(self, out_dir: Path):
+        self.out_dir = out_dir
+        self.path = out_dir / BUILD_GRAPH_FILE
+        self.nodes: Dict[str, Dict[str, str]] = {}
+        self.dirty = False
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == BUILD_GRAPH_VERSION:
+            self.nodes = data.get("outlines", {})
+
+    def key(self, target: Path) -> str:
+        return target.relative_to(self.out_dir).as_posix()
+
+    def reason(self, target: Path, deps: Dict[str, str]) -> Optional[str]:
+        """Why target must be rebuilt, or None when it is up to date."""
+
+        node = self.nodes.get(self.key(target))
+        if node is None:
+            return "new"
+        if not target.exists():
+            return "missing"
+        if node.get("input") != deps["input"]:
+            return "metadata changed"
+        if node.get("template") != deps["template"]:
+            return "template changed"
+        return None
+
+    def record(self, target: Path, deps: Dict[str, str]):
+        self.nodes[self.key(target)] = deps
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        content = json.dumps({"version": BUILD_GRAPH_VERSION, "outlines": self.nodes},
+                             indent=2, sort_keys=True, ensure_ascii=False)
+        write_atomic(self.path, content + "\n")
+        self.dirty = False
+
+
+def build_outlines(skill_paths: List[Path], out_dir: Path, languages: List[str],
+                   workers: Optional[int] = None, cache: Optional[MetadataCache] = None,
+                   template_dir: Path = TEMPLATE_DIR, dry_run: bool = False,
+                   force: bool = False) -> Dict[str, Any]:
+    """Analyze skills in parallel and write one outline per skill and language.
+
+    Only outlines whose template values or template version differ from the build
+    graph are rendered; with dry_run nothing is written and the summary lists
+    what would change.
+    """
+
+    graph = BuildGraph(out_dir)
+    summary = {"skills": 0, "written": 0, "unchanged": 0, "changes": [], "errors": []}
+    seen: Dict[str, Path] = {}
+
+    with ProcessPoolExecutor(max_workers=workers) as analyzers, ThreadPoolExecutor() as writers:
+        futures = [
+            analyzers.submit(_analyze_skill_safe, path, cache.get(path) if cache else None, cache is not None)
+            for path in skill_paths
+        ]
+        writes = []
+
+        # Results are taken in skill_paths order, so the first path always wins a name collision
+        for skill_path, future in zip(skill_paths, futures):
+            metadata, entry = future.result()
+            if cache is not None:
+                cache.put(skill_path, entry)
+
+            if "error" in metadata:
+                summary["errors"].append(f"{skill_path}: {metadata['error']}")
+                continue
+
+            name = metadata["name"]
+            if name in seen:
+                summary["errors"].append(f"{skill_path}: skill name '{name}' already used by {seen[name]}")
+                continue
+            seen[name] = skill_path
+            summary["skills"] += 1
+
+            for language in languages:
+                target = outline_path(out_dir, language, name)
+                try:
+                    template = load_template(language, template_dir)
+                except OSError as e:
+                    summary["errors"].append(f"{skill_path} [{language}]: {e}")
+                    continue
+
+                values = outline_values(metadata, language)
+                deps = {"input": values_hash(values), "template": f"{template.version}-{RENDERER_VERSION}"}
+                reason = "forced" if force else graph.reason(target, deps)
+                if reason is None:
+                    summary["unchanged"] += 1
+                    continue
+                summary["changes"].append((target, reason))
+                if dry_run:
+                    continue
+
+                try:
+                    outline = template.render(values)
+                except KeyError as e:
+                    summary["errors"].append(f"{skill_path} [{language}]: {e}")
+                    continue
+                writes.append((target, deps, writers.submit(write_atomic, target, outline)))
+
+        for target, deps, write in writes:
+            try:
+                write.result()
+                graph.record(target, deps)
+                summary["written"] += 1
+            except OSError as e:
+                summary["errors"].append(f"{target}: {e}")
+
+    graph.save()
+    if cache is not None:
+        cache.save()
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build article outlines for many skills and languages")
+    parser.add_argument("skill_paths", nargs="*", help="Skill directories to build outlines for")
+    parser.add_argument("--marketplace", help="Build every skill listed in a marketplace.json manifest")
+    parser.add_argument("--root", help="Build every skill (directory with SKILL.md) below this directory")
+    parser.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR,
+                        help="Output directory; outlines go to <out-dir>/<lang>/<skill>.md (default: outlines)")
+    parser.add_argument("--languages", default=",".join(DEFAULT_LANGUAGES),
+                        help="Comma-separated outline languages (default: en,zh,fr)")
+    parser.add_argument("--workers", type=int, help="Worker processes for analysis (default: CPU count)")
+    parser.add_argument("--cache", help="Persistent metadata cache file (see analyze_skill.py --cache)")
+    parser.add_argument("--template-dir", type=Path, default=TEMPLATE_DIR,
+                        help="Directory containing outline templates")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="List outlines that would be rebuilt without writing anything")
+    parser.add_argument("--force", action="store_true",
+                        help="Rebuild every outline regardless of the build graph")
+
+    args = parser.parse_args()
+
+    if args.marketplace:
+        skill_paths = discover_marketplace_skills(Path(args.marketplace))
+    elif args.root:
+        skill_paths = discover_skills(Path(args.root))
+    elif args.skill_paths:
+        skill_paths = [Path(p) for p in args.skill_paths]
+    else:
+        parser.error("give skill paths, --marketplace or --root")
+
+    languages = [lang.strip() for lang in args.languages.split(",") if lang.strip()]
+    cache = MetadataCache(Path(args.cache)) if args.cache else None
+
+    summary = build_outlines(skill_paths, args.out_dir, languages, args.workers, cache,
+                             args.template_dir, args.dry_run, args.force)
+
+    if args.dry_run:
+        for target, reason in sorted(summary["changes"]):
+            print(f"{target}  ({reason})")
+        print(f"🔍 {len(summary['changes'])} outlines would be rebuilt, "
+              f"{summary['unchanged']} unchanged", file=sys.stderr)
+    else:
+        print(f"📝 {summary['written']} outlines written, {summary['unchanged']} unchanged, "
+              f"for {summary['skills']} skills ({', '.join(languages)}) in {args.out_dir}", file=sys.stderr)
+    for error in summary["errors"]:
+        print(f"  ❌ {error}", file=sys.stderr)
+
+    if summary["errors"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,292 +2,103 @@
 """
 Generate article outline based on skill analysis metadata.
 
+The outline text lives in assets/outline-templates/outline[.<lang>].md and is
+compiled once per process into literal chunks and variable slots.
+
 Usage:
-    python generate_article_outline.py <skill-metadata.json> [--output <outline.md>]
+    python generate_article_outline.py <skill-metadata.json> [--output <outline.md>] [--language <lang>]
 
 Examples:
     python generate_article_outline.py skill-metadata.json
     python generate_article_outline.py skill-metadata.json --output article-outline.md
 """
 
+import re
 import json
 import sys
+import hashlib
 import argparse
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
 
-def generate_outline(metadata: Dict[str, Any]) -> str:
-    """Generate a complete article outline based on skill metadata."""
-
-    skill_name = metadata.get("name", "Unknown Skill")
-    description = metadata.get("skill_md", {}).get("description", "No description available")
-    sections = metadata.get("skill_md", {}).get("sections", [])
-    analysis = metadata.get("analysis", {})
-
-    outline = f"""---
-title: "Analyzing {skill_name}: A Complete Guide"  # Will be translated
-description: "{description[:150]}..."  # Will be translated
-lang: {{{{language}}}}
-category: development
-difficulty: intermediate
-tags:
-  - claude-skills
-  - skill-analysis
-  - tutorial
-source_url: "{{{{source_url}}}}"
-published_date: "{{{{published_date}}}}"
-author: Anthropic
-source:
-  url: "{{{{source_url}}}}"
-  name: "Anthropic Skills Repository"
-  author: "Anthropic"
-  published_date: "{{{{published_date}}}}"
-  accessed_date: "{{{{current_date}}}}"
-  license: "See SKILL.md for terms"
-import:
-  date: "{{{{current_date}}}}"
-  slug: "{{{{slug_from_url(source_url)}}}}"
-  translator: "Claude AI"
----
-
-import {{ SourceAttribution }} from '@/components/SourceAttribution';
-import {{ Callout }} from 'fumadocs-ui/components/callout';
-import {{ Cards, Card }} from 'fumadocs-ui/components/card';
-import {{ Steps, Step }} from 'fumadocs-ui/components/steps';
-
-<SourceAttribution
-  source={{{{...}}}}
-  languages={{{{['en', 'zh', 'fr']}}}}
-  currentLang={{{{language}}}}
-/>
-
-# Analyzing {skill_name}
-
-**{skill_name}** is {{description}} This article provides a comprehensive analysis of its structure, design patterns, and practical applications.
-
-<Callout type="info">
-  This is a real-world skill from the Anthropic skills repository, designed to {{description.lower().split()[0]}}.
-</Callout>
-
-## Overview
-
-### What is {skill_name}?
-
-<Callout type="question">
-  Based on the description: {description}
-</Callout>
-
-### Core Purpose
-
-The {skill_name} skill aims to:
-
-{{generate_purpose_bullet_points(description)}}
-
-### Target Audience
-
-This skill is designed for:
-
-- Users who want to...
-- Developers working with...
-- Anyone interested in...
-
-## Skill Anatomy
-
-### Directory Structure
-
-```
-{skill_name}/
-├── SKILL.md (required)
-└── Bundled Resources (optional)
-    ├── scripts/          - Executable code
-    ├── references/       - Documentation
-    └── assets/           - Templates and files
-```
-
-### SKILL.md Structure
-
-Every skill begins with metadata in YAML frontmatter:
-
-```yaml
----
-name: {skill_name}
-description: "{description}"
-license: See SKILL.md for terms
----
-```
-
-### Key Components
-
-{{generate_component_sections(metadata)}}
-
-## Technical Deep Dive
-
-### How It Works
-
-<Steps>
-  <Step>
-    **Trigger Detection**: Claude identifies when this skill should be used based on the description and user query.
-  </Step>
-  <Step>
-    **Context Loading**: SKILL.md content is loaded into Claude's context window.
-  </Step>
-  <Step>
-    **Resource Access**: If needed, Claude loads or references bundled resources.
-  </Step>
-  <Step>
-    **Execution**: Claude follows the procedural instructions to complete the task.
-  </Step>
-</Steps>
-
-### Detailed Workflow
-
-{{generate_workflow_section(metadata)}}
-
-## Usage Examples
-
-### Basic Usage
-
-```bash
-{{generate_basic_usage(metadata)}}
-```
-
-### Advanced Scenarios
-
-<Callout type="tip">
-  Best practices and advanced usage patterns.
-</Callout>
-
-## Best Practices
-
-Based on the design of {skill_name}, here are key principles:
-
-{{generate_best_practices(metadata)}}
-
-## Common Pitfalls
-
-<Callout type="warn">
-  Common mistakes users make when working with this skill.
-</Callout>
-
-{{generate_common_pitfalls(metadata)}}
-
-## Integration with Other Skills
-
-{skill_name} works well with:
-
-1. **skill-creator** - For creating new skills based on this pattern
-2. **skill-builder** - For extending functionality
-3. **Other related skills**
-
-## Real-World Applications
-
-### Use Case 1: {{Use Case Description}}
-
-Practical example of how this skill solves a real problem...
-
-### Use Case 2: {{Another Use Case}}
-
-Another practical example with specific details...
-
-## Troubleshooting
-
-<Callout type="error">
-  Common errors and their solutions.
-</Callout>
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "assets" / "outline-templates"
+DEFAULT_LANGUAGE = "en"
 
-{{generate_troubleshooting_section(metadata)}}
+# ${name} marks a value filled in at render time. {{name}} placeholders are
+# left in the outline for the writer and need no escaping.
+VARIABLE_PATTERN = re.compile(r"\$\{([a-z_][a-z0-9_]*)\}")
 
-## Next Steps
 
-To use {skill_name} effectively:
+class CompiledTemplate:
+    """An outline template split once into literal chunks and variable slots."""
 
-1. **Clone the repository**: {{repository_url}}
-2. **Install dependencies**: {{install_commands}}
-3. **Follow the workflow**: {{workflow_instructions}}
-4. **Iterate based on feedback**: {{iteration_tips}}
+    def __init__(self, text: str, source: str = "<string>"):
+        parts = VARIABLE_PATTERN.split(text)
+        self.source = source
+        self.literals = parts[0::2]
+        self.variables = parts[1::2]
+        self.version = hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
 
-### Related Resources
+    def render(self, values: Dict[str, str]) -> str:
+        """Interleave the literal chunks with the values of the variables."""
 
-- **Anthropic Skills Repository**: github.com/anthropics/skills
-- **Creating Your First Skill**: /tutorials/creating-first-skill
-- **Advanced Skill Development**: /development/advanced-skills
+        try:
+            slots = [values[name] for name in self.variables]
+        except KeyError as e:
+            raise KeyError(f"{self.source}: no value for template variable {e}") from None
 
-## Conclusion
+        out = [None] * (len(self.literals) + len(slots))
+        out[0::2] = self.literals
+        out[1::2] = slots
+        return "".join(out)
 
-{skill_name} demonstrates excellent Claude skill design by:
 
-{{generate_conclusion_points(metadata)}}
+def template_path(language: str = DEFAULT_LANGUAGE, template_dir: Path = TEMPLATE_DIR) -> Path:
+    """Per-language template (outline.<lang>.md), falling back to outline.md."""
 
-The key insights from this skill can be applied to your own skill development projects.
+    localized = template_dir / f"outline.{language}.md"
+    return localized if localized.exists() else template_dir / "outline.md"
 
----
 
-## Summary
+@lru_cache(maxsize=None)
+def _compile_file(path: Path) -> CompiledTemplate:
+    return CompiledTemplate(path.read_text(encoding="utf-8"), source=str(path))
 
-This analysis covered:
 
-- ✅ Skill structure and anatomy
-- ✅ Core workflow and execution flow
-- ✅ Best practices and design patterns
-- ✅ Real-world usage examples
-- ✅ Integration strategies
-- ✅ Troubleshooting guide
+def load_template(language: str = DEFAULT_LANGUAGE, template_dir: Path = TEMPLATE_DIR) -> CompiledTemplate:
+    """Compiled template for a language; each file is parsed once per process."""
 
-## Next Steps
+    return _compile_file(template_path(language, template_dir).resolve())
 
-Ready to apply what you learned?
 
-1. **Study other skills** in the repository
-2. **Create your own skill** using these patterns
-3. **Share your skills** with the community
-4. **Iterate and improve** based on usage
-
-## ℹ️ Source Information
-
-**Original Skill**: [{{skill_name}}]({{source_url}})
-
-- **Source**: Anthropic Skills Repository
-- **Author**: Anthropic
-- **Accessed**: {{current_date}}
-- **License**: See SKILL.md for full terms
-
-*This article was automatically generated based on skill analysis.*
-
----
-
-## Appendix
-
-### Directory Structure Details
-
-{{generate_directory_details(metadata)}}
-
-### Resource Inventory
-
-<Callout type="info">
-  Complete listing of all resources included in this skill.
-</Callout>
-
-**Scripts**:
-{{generate_resources_list(metadata.get("scripts", []))}}
-
-**References**:
-{{generate_resources_list(metadata.get("references", []))}}
-
-**Assets**:
-{{generate_resources_list(metadata.get("assets", []))}}
-"""
-
-    return outline
+def outline_values(metadata: Dict[str, Any], language: str = DEFAULT_LANGUAGE) -> Dict[str, str]:
+    """Values for every variable the outline templates use."""
 
+    skill_name = metadata.get("name", "Unknown Skill")
+    description = metadata.get("skill_md", {}).get("description", "No description available")
 
-def generate_purpose_bullet_points(description: str) -> str:
-    """Generate purpose bullet points from description."""
+    return {
+        "language": language,
+        "skill_name": skill_name,
+        "description": description,
+        "description_short": description[:150],
+        "description_lead": (description.lower().split() or [""])[0],
+        "component_sections": generate_component_sections(metadata),
+        "workflow_section": generate_workflow_section(metadata),
+        "basic_usage": generate_basic_usage(metadata),
+        "scripts_list": generate_resources_list(metadata.get("scripts", [])),
+        "references_list": generate_resources_list(metadata.get("references", [])),
+        "assets_list": generate_resources_list(metadata.get("assets", [])),
+    }
+
+
+def generate_outline(metadata: Dict[str, Any], language: str = DEFAULT_LANGUAGE,
+                     template_dir: Path = TEMPLATE_DIR) -> str:
+    """Generate a complete article outline based on skill metadata."""
 
-    return """- Automate repetitive tasks
-- Provide specialized workflows
-- Integrate domain knowledge
-- Improve efficiency and consistency"""
+    return load_template(language, template_dir).render(outline_values(metadata, language))
 
 
 def generate_component_sections(metadata: Dict[str, Any]) -> str:
@@ -296,18 +107,15 @@ def generate_component_sections(metadata: Dict[str, Any]) -> str:
     sections = []
 
     if metadata.get("scripts"):
-        sections.append("""### Scripts
+        sections.append(f"""### Scripts
 
 <Callout type="info">
   Scripts provide deterministic, reusable code that Claude can execute.
 </Callout>
 
-The {skill_name} includes scripts for:
-
-- **init_skill.py**: Initialize a new skill with proper structure
-- **package_skill.py**: Package and validate skills for distribution
+The {metadata.get("name", "skill")} includes scripts for:
 
-Each script serves a specific purpose in the skill creation workflow.
+{generate_script_details(metadata)}
 """)
 
     if metadata.get("references"):
@@ -333,6 +141,37 @@ Asset files are used in the final output without being loaded into Claude's cont
     return "\n\n".join(sections) if sections else "No bundled resources found."
 
 
+def generate_script_details(metadata: Dict[str, Any]) -> str:
+    """Describe each script from its introspected docstring and CLI arguments."""
+
+    details = {d["file"]: d for d in metadata.get("script_details", []) if "file" in d}
+    lines = []
+
+    for script in metadata.get("scripts", []):
+        info = details.get(script)
+        if not info or info.get("error"):
+            lines.append(f"- **{script}**")
+            continue
+
+        summary = info.get("description") or info.get("docstring", "").strip().split("\n")[0]
+        lines.append(f"- **{script}**: {escape_mdx(summary)}" if summary else f"- **{script}**")
+
+        for argument in info.get("arguments", []):
+            flags = ", ".join(f"`{flag}`" for flag in argument.get("flags", []))
+            help_text = argument.get("help")
+            if flags:
+                lines.append(f"  - {flags}: {escape_mdx(help_text)}" if isinstance(help_text, str) else f"  - {flags}")
+
+    return "\n".join(lines)
+
+
+def escape_mdx(text: str) -> str:
+    """Escape characters MDX would parse as JSX (<, >, {, })."""
+
+    return (text.replace("<", "&lt;").replace(">", "&gt;")
+            .replace("{", "&#123;").replace("}", "&#125;"))
+
+
 def generate_workflow_section(metadata: Dict[str, Any]) -> str:
     """Generate workflow analysis section."""
 
@@ -375,68 +214,6 @@ def generate_basic_usage(metadata: Dict[str, Any]) -> str:
     return f"# Example usage for {skill_name}\n./scripts/run_{skill_name}.py --help"
 
 
-def generate_best_practices(metadata: Dict[str, Any]) -> str:
-    """Generate best practices section."""
-
-    return """<Cards>
-  <Card title="Progressive Disclosure" icon="Layers">
-    Load information in three levels: metadata, SKILL.md, and bundled resources.
-  </Card>
-
-  <Card title="Avoid Duplication" icon="FileText">
-    Keep detailed reference material in references/ files, not in SKILL.md
-  </Card>
-
-  <Card title="Test & Iterate" icon="RefreshCw">
-    Use the skill on real tasks to identify improvements and update accordingly.
-  </Card>
-</Cards>
-"""
-
-
-def generate_common_pitfalls(metadata: Dict[str, Any]) -> str:
-    """Generate common pitfalls section."""
-
-    return """- **Overloading SKILL.md**: Don't include excessive detail in the main skill file.
-- **Missing Context**: Ensure bundled resources are properly referenced.
-- **Unclear Triggers**: Make the description specific about when to use the skill.
-- **Ignoring Validation**: Always use package_skill.py before distribution.
-"""
-
-
-def generate_troubleshooting_section(metadata: Dict[str, Any]) -> str:
-    """Generate troubleshooting section."""
-
-    return """### Validation Errors
-
-**Symptom**: package_skill.py reports validation errors
-
-**Solution**: Run the script and fix all reported issues before packaging.
-
-### Missing Resources
-
-**Symptom**: Claude cannot find referenced files
-
-**Solution**: Verify all paths in SKILL.md and ensure files exist.
-
-### Skill Not Triggering
-
-**Symptom**: Claude doesn't recognize when to use the skill
-
-**Solution**: Make the description more specific and include trigger phrases.
-"""
-
-
-def generate_conclusion_points(metadata: Dict[str, Any]) -> str:
-    """Generate conclusion bullet points."""
-
-    return """- ✅ Systematically extending Claude's capabilities
-- ✅ Managing context efficiently
-- ✅ Providing reusable resources
-- ✅ Maintaining high quality through validation
-- ✅ Following proven design patterns"""
-
-
 def generate_resources_list(resources: list) -> str:
     """Generate a markdown list of resources."""
 
@@ -446,30 +223,14 @@ def generate_resources_list(resources: list) -> str:
     return "\n".join([f"- {res}" for res in resources])
 
 
-def generate_directory_details(metadata: Dict[str, Any]) -> str:
-    """Generate directory structure details."""
-
-    return """### Required Files
-
-- **SKILL.md**: The core skill definition with metadata and instructions
-
-### Optional Directories
-
-- **scripts/**: Executable code for the skill
-- **references/**: Documentation and reference material
-- **assets/**: Templates, images, and output files
-
-### Best Practices
-
-- Keep SKILL.md under 5k words for optimal loading
-- Use descriptive names for all resources
-- Follow the six-step skill creation process"""
-
-
 def main():
     parser = argparse.ArgumentParser(description="Generate article outline from skill metadata")
     parser.add_argument("metadata_file", help="Path to the skill metadata JSON file")
     parser.add_argument("--output", help="Output markdown file (default: stdout)")
+    parser.add_argument("--language", default=DEFAULT_LANGUAGE,
+                        help="Outline language; uses outline.<lang>.md when present (default: en)")
+    parser.add_argument("--template-dir", type=Path, default=TEMPLATE_DIR,
+                        help="Directory containing outline templates")
 
     args = parser.parse_args()
 
@@ -486,7 +247,11 @@ def main():
         print(f"Error reading metadata: {e}", file=sys.stderr)
         sys.exit(1)
 
-    outline = generate_outline(metadata)
+    try:
+        outline = generate_outline(metadata, args.language, args.template_dir)
+    except (OSError, KeyError) as e:
+        print(f"Error rendering outline: {e}", file=sys.stderr)
+        sys.exit(1)
 
     if args.output:
         output_path = Path(args.output)
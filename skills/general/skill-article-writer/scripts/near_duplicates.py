@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate index for SKILL.md files and MDX articles.
+
+Bodies are shingled, summarized with MinHash signatures and bucketed with
+LSH banding, so near-copies are found from shared buckets instead of
+pairwise diffs. Signatures persist in a JSON index; unchanged files
+(same size and mtime) are not re-read on update. Documents without any
+body text (stubs, frontmatter only) are recorded but never matched.
+
+Usage:
+    python near_duplicates.py update <path>... [--index <index.json>]
+    python near_duplicates.py query <file> [--index <index.json>] [--threshold 0.8]
+    python near_duplicates.py clusters [--index <index.json>] [--threshold 0.8] [--json]
+
+Examples:
+    python near_duplicates.py update skills/ content/docs/
+    python near_duplicates.py query content/docs/en/ai-ml/new-article.mdx
+    python near_duplicates.py clusters --threshold 0.7
+"""
+
+import os
+import re
+import sys
+import json
+import random
+import hashlib
+import argparse
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable, Set
+
+from atomic_io import write_atomic
+
+
+DEFAULT_INDEX = Path('.near-duplicates.json')
+INDEX_VERSION = 2
+
+NUM_PERM = 128
+BANDS = 16              # 16 bands x 8 rows: candidate threshold ~0.71 Jaccard
+SHINGLE_SIZE = 5
+DEFAULT_THRESHOLD = 0.8
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Latin words/numbers as tokens, CJK characters one per token (no word breaks)
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+|[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af]')
+FRONTMATTER_PATTERN = re.compile(r'^---\n.*?\n---\n', re.DOTALL)
+MDX_IMPORT_PATTERN = re.compile(r'^(import|export)\s.*$', re.MULTILINE)
+
+
+def _permutations(num_perm: int) -> List[List[int]]:
+    """Fixed (a, b) pairs for the universal hash family; seeded so indexes stay comparable."""
+    rng = random.Random(1)
+    return [[rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1)]
+            for _ in range(num_perm)]
+
+
+PERMUTATIONS = _permutations(NUM_PERM)
+
+
+def extract_body(text: str) -> str:
+    """Drop YAML frontmatter and MDX import/export lines."""
+    return MDX_IMPORT_PATTERN.sub('', FRONTMATTER_PATTERN.sub('', text, count=1))
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[int]:
+    """Hashed k-token shingles of the normalized text."""
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    if len(tokens) < size:
+        tokens_windows = [tokens] if tokens else []
+    else:
+        tokens_windows = [tokens[i:i + size] for i in range(len(tokens) - size + 1)]
+
+    result = set()
+    for window in tokens_windows:
+        digest = hashlib.blake2b(' '.join(window).encode('utf-8'), digest_size=8).digest()
+        result.add(int.from_bytes(digest, 'little') & _MAX_HASH)
+    return result
+
+
+def minhash(shingle_set: Set[int]) -> List[int]:
+    """MinHash signature: per permutation, the minimum hashed shingle."""
+    if not shingle_set:
+        return [_MAX_HASH] * NUM_PERM
+
+    signature = []
+    for a, b in PERMUTATIONS:
+        signature.append(min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in shingle_set))
+    return signature
+
+
+def signature_of(file_path: Path) -> Optional[List[int]]:
+    """MinHash signature of a file's body, or None when it has no text to compare."""
+    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+        shingle_set = shingles(extract_body(f.read()))
+    return minhash(shingle_set) if shingle_set else None
+
+
+def similarity(sig_a: List[int], sig_b: List[int]) -> float:
+    """Estimated Jaccard similarity from two signatures."""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+
+def band_keys(signature: List[int]) -> List[str]:
+    """LSH bucket keys: one per band of consecutive signature rows."""
+    rows = len(signature) // BANDS
+    keys = []
+    for band in range(BANDS):
+        chunk = signature[band * rows:(band + 1) * rows]
+        digest = hashlib.blake2b(repr(chunk).encode('ascii'), digest_size=8).hexdigest()
+        keys.append(f"{band}:{digest}")
+    return keys
+
+
+class NearDuplicateIndex:
+    """Persistent MinHash + LSH index over document bodies."""
+
+    def __init__(self, index_path: Path = DEFAULT_INDEX):
+        self.index_path = index_path
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        self.buckets: Dict[str, List[str]] = {}
+        self.dirty = False
+        self._load()
+
+    def _load(self):
+        if not self.index_path.exists():
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') != INDEX_VERSION or data.get('num_perm') != NUM_PERM:
+            return
+        self.documents = data.get('documents', {})
+        for doc_id, doc in self.documents.items():
+            self._bucket(doc_id, doc['signature'])
+
+    def _bucket(self, doc_id: str, signature: Optional[List[int]]):
+        if signature is None:
+            return
+        for key in band_keys(signature):
+            self.buckets.setdefault(key, []).append(doc_id)
+
+    def _unbucket(self, doc_id: str, signature: Optional[List[int]]):
+        if signature is None:
+            return
+        for key in band_keys(signature):
+            members = self.buckets.get(key, [])
+            if doc_id in members:
+                members.remove(doc_id)
+
+    def save(self):
+        """Atomically write signatures (buckets are rebuilt on load)."""
+        if not self.dirty:
+            return
+        write_atomic(self.index_path, json.dumps({'version': INDEX_VERSION, 'num_perm': NUM_PERM, 'documents': self.documents}))
+        self.dirty = False
+
+    def add_file(self, file_path: Path) -> bool:
+        """Index one file; returns False when it was already indexed and unchanged."""
+        doc_id = str(file_path.resolve())
+        stat = file_path.stat()
+        existing = self.documents.get(doc_id)
+        if existing and existing['size'] == stat.st_size and existing['mtime_ns'] == stat.st_mtime_ns:
+            return False
+
+        signature = signature_of(file_path)
+
+        if existing:
+            self._unbucket(doc_id, existing['signature'])
+        self.documents[doc_id] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'signature': signature
+        }
+        self._bucket(doc_id, signature)
+        self.dirty = True
+        return True
+
+    def add_paths(self, paths: Iterable[Path]) -> int:
+        """Index files, or every SKILL.md / *.mdx below directories. Returns files (re)indexed."""
+        updated = 0
+        for path in paths:
+            for file_path in iter_documents(path):
+                if self.add_file(file_path):
+                    updated += 1
+        return updated
+
+    def prune(self):
+        """Forget documents whose files no longer exist."""
+        for doc_id in [d for d in self.documents if not Path(d).exists()]:
+            self._unbucket(doc_id, self.documents.pop(doc_id)['signature'])
+            self.dirty = True
+
+    def query(self, file_path: Path, threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+        """Indexed documents that are near-duplicates of file_path, most similar first."""
+        doc_id = str(file_path.resolve())
+        if doc_id in self.documents:
+            signature = self.documents[doc_id]['signature']
+        else:
+            signature = signature_of(file_path)
+        if signature is None:
+            return []
+
+        matches = []
+        for candidate in self._candidates(signature):
+            if candidate == doc_id:
+                continue
+            score = similarity(signature, self.documents[candidate]['signature'])
+            if score >= threshold:
+                matches.append({'path': candidate, 'similarity': round(score, 3)})
+        return sorted(matches, key=lambda m: (-m['similarity'], m['path']))
+
+    def _candidates(self, signature: List[int]) -> Set[str]:
+        candidates: Set[str] = set()
+        for key in band_keys(signature):
+            candidates.update(self.buckets.get(key, []))
+        return candidates
+
+    def clusters(self, threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+        """Groups of near-duplicate documents (union-find over LSH candidate pairs)."""
+        parent: Dict[str, str] = {}
+
+        def find(doc_id: str) -> str:
+            parent.setdefault(doc_id, doc_id)
+            while parent[doc_id] != doc_id:
+                parent[doc_id] = parent[parent[doc_id]]
+                doc_id = parent[doc_id]
+            return doc_id
+
+        # Only documents sharing a bucket are ever compared
+        scores: Dict[tuple, float] = {}
+        checked = set()
+        for members in self.buckets.values():
+            for i, doc_a in enumerate(members):
+                for doc_b in members[i + 1:]:
+                    pair = (doc_a, doc_b) if doc_a < doc_b else (doc_b, doc_a)
+                    if pair in checked:
+                        continue
+                    checked.add(pair)
+                    score = similarity(self.documents[doc_a]['signature'], self.documents[doc_b]['signature'])
+                    if score >= threshold:
+                        scores[pair] = score
+                        parent[find(doc_b)] = find(doc_a)
+
+        groups: Dict[str, Set[str]] = {}
+        top: Dict[str, float] = {}
+        for (doc_a, doc_b), score in scores.items():
+            root = find(doc_a)
+            groups.setdefault(root, set()).update((doc_a, doc_b))
+            top[root] = max(top.get(root, 0.0), score)
+
+        result = [{'documents': sorted(members), 'max_similarity': round(top[root], 3)}
+                  for root, members in groups.items()]
+        return sorted(result, key=lambda c: (-len(c['documents']), c['documents'][0]))
+
+
+def iter_documents(path: Path) -> Iterable[Path]:
+    """SKILL.md and *.mdx files under path (or path itself if it is a file)."""
+    if path.is_file():
+        yield path
+        return
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames[:] = [d for d in dirnames if not d.startswith('.') and d != 'node_modules']
+        for name in sorted(filenames):
+            if name == 'SKILL.md' or name.endswith('.mdx'):
+                yield Path(dirpath) / name
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find near-duplicate skills and articles with MinHash/LSH')
+    parser.add_argument('--index', default=str(DEFAULT_INDEX),
+                        help=f'Index file (default: {DEFAULT_INDEX})')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    update_parser = subparsers.add_parser('update', help='Add or refresh documents in the index')
+    update_parser.add_argument('paths', nargs='+', help='Files or directories (SKILL.md and *.mdx are indexed)')
+
+    query_parser = subparsers.add_parser('query', help='List near-duplicates of one file')
+    query_parser.add_argument('file', help='SKILL.md or MDX file to look up')
+    query_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                              help=f'Minimum estimated Jaccard similarity (default: {DEFAULT_THRESHOLD})')
+
+    clusters_parser = subparsers.add_parser('clusters', help='List all near-duplicate clusters')
+    clusters_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                                 help=f'Minimum estimated Jaccard similarity (default: {DEFAULT_THRESHOLD})')
+    clusters_parser.add_argument('--json', action='store_true', help='Print clusters as JSON')
+
+    args = parser.parse_args()
+    index = NearDuplicateIndex(Path(args.index))
+
+    if args.command == 'update':
+        paths = [Path(p) for p in args.paths]
+        for path in paths:
+            if not path.exists():
+                print(f"Error: Path does not exist: {path}", file=sys.stderr)
+                sys.exit(1)
+        index.prune()
+        updated = index.add_paths(paths)
+        index.save()
+        print(f"Indexed {updated} new or changed documents ({len(index.documents)} total)")
+
+    elif args.command == 'query':
+        file_path = Path(args.file)
+        if not file_path.exists():
+            print(f"Error: File not found: {file_path}", file=sys.stderr)
+            sys.exit(1)
+        print(json.dumps(index.query(file_path, args.threshold), indent=2, ensure_ascii=False))
+
+    else:
+        clusters = index.clusters(args.threshold)
+        if args.json:
+            print(json.dumps(clusters, indent=2, ensure_ascii=False))
+            return
+        if not clusters:
+            print("No near-duplicates found")
+        for i, cluster in enumerate(clusters, 1):
+            print(f"Cluster {i} ({len(cluster['documents'])} documents, up to {cluster['max_similarity']:.0%} similar):")
+            for doc in cluster['documents']:
+                print(f"  - {doc}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""build_outlines: name collisions and file modes of written outlines."""
+
+import sys
+import stat
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from atomic_io import UMASK
+from build_outlines import build_outlines, outline_path
+
+
+class BuildOutlinesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.out_dir = self.tmp / "outlines"
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def skill(self, parent: str, description: str) -> Path:
+        path = self.tmp / parent / "demo"
+        path.mkdir(parents=True)
+        (path / "SKILL.md").write_text(f"---\nname: demo\ndescription: {description}\n---\n\n# Demo\n",
+                                       encoding="utf-8")
+        return path
+
+    def test_first_path_wins_a_name_collision(self):
+        for order in (["b", "a"], ["a", "b"]):
+            with self.subTest(order=order):
+                shutil.rmtree(self.tmp)
+                paths = [self.skill(parent, f"from {parent}") for parent in order]
+
+                summary = build_outlines(paths, self.out_dir, ["en"], workers=2)
+
+                self.assertEqual(summary["skills"], 1)
+                self.assertEqual(summary["errors"],
+                                 [f"{paths[1]}: skill name 'demo' already used by {paths[0]}"])
+                outline = outline_path(self.out_dir, "en", "demo").read_text(encoding="utf-8")
+                self.assertIn(f"from {order[0]}", outline)
+                self.assertNotIn(f"from {order[1]}", outline)
+
+    def test_outlines_are_written_with_the_umask_mode(self):
+        summary = build_outlines([self.skill("a", "demo skill")], self.out_dir, ["en"], workers=1)
+
+        self.assertEqual(summary["written"], 1)
+        mode = stat.S_IMODE(outline_path(self.out_dir, "en", "demo").stat().st_mode)
+        self.assertEqual(mode, 0o666 & ~UMASK)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""SkillSnapshot traversal of skill directories."""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from analyze_skill import SkillSnapshot
+
+
+class SkillSnapshotTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        (self.root / "SKILL.md").write_text("---\nname: demo\n---\n", encoding="utf-8")
+        (self.root / "scripts").mkdir()
+        (self.root / "scripts" / "tool.py").write_text("print()\n", encoding="utf-8")
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "symlinks not supported")
+    def test_symlinked_directories_are_listed_not_followed(self):
+        os.symlink(self.root, self.root / "scripts" / "loop")
+        vendor = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, vendor)
+        (vendor / "big.py").write_text("x = 1\n", encoding="utf-8")
+        os.symlink(vendor, self.root / "vendor")
+
+        snapshot = SkillSnapshot(self.root)
+
+        self.assertEqual(snapshot.files(), ["SKILL.md", "scripts/tool.py"])
+        self.assertTrue(snapshot.is_dir("scripts/loop"))
+        self.assertTrue(snapshot.is_dir("vendor"))
+        self.assertEqual(snapshot.list_dir("vendor"), [])
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "symlinks not supported")
+    def test_dangling_symlink_does_not_hide_siblings(self):
+        os.symlink(self.root / "missing", self.root / "scripts" / "broken")
+
+        snapshot = SkillSnapshot(self.root)
+
+        self.assertIn("scripts/tool.py", snapshot.files())
+        self.assertIn("scripts/broken", snapshot.files())
+
+
+if __name__ == "__main__":
+    unittest.main()